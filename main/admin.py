@@ -4,14 +4,17 @@ from django.contrib import admin
 from django.contrib.auth.models import Group
 from django.contrib.auth.admin import GroupAdmin
 from django.db.models.functions import TruncDay
-from django.db.models import Avg, Count, Min, Sum
+from django.db.models import Avg, Count, DecimalField, F, Min, Q, Sum
 from django.http.request import HttpRequest
 from django.template.response import TemplateResponse
 from django.urls import path
 from django.contrib.auth.admin import (UserAdmin as DjangoUserAdmin)
 from django.utils.html import format_html
-from .models import (Product, ProductTag, ProductImage, Address,
-                     User, Basket, BasketLine, Order, OrderItem)
+from . import analytics, ratelimit
+from .routers import reporting_reads
+from .models import (Product, ProductTag, ProductImage, Address, AuthEvent,
+                     User, Basket, BasketLine, Order, OrderAddress,
+                     OrderItem)
 
 logger = logging.getLogger(__name__)
 
@@ -135,9 +138,9 @@ class AddressAdmin(admin.ModelAdmin):
 
 
 class BasketAdmin(admin.ModelAdmin):
-    list_display = ("id", "user", "status", "count")
+    list_display = ("id", "user", "status", "count", "date_updated")
     list_editable = ("status",)
-    list_filter = ("status",)
+    list_filter = ("status", "date_updated")
     inlines = (BasketLineInline,)
 
 
@@ -147,39 +150,37 @@ class OrderItemInline(admin.TabularInline):
     autocomplete_fields = ['product']
 
 
-class OrderAdmin(admin.ModelAdmin):
-    list_display = ("id", "user", "status")
+class OrderAddressAdmin(admin.ModelAdmin):
+    # snapshots are shared between orders, so they are never edited
+    list_display = ("name", "address1", "city", "country")
+    list_filter = ("country",)
+    search_fields = ("name", "address1", "city")
+    readonly_fields = OrderAddress.FIELDS
+
+    def has_add_permission(self, request):
+        return False
+
+
+class OrderTotalsMixin:
+    # items edited through the inline change the stored totals
+    def save_related(self, request, form, formsets, change):
+        super().save_related(request, form, formsets, change)
+        form.instance.update_totals()
+
+
+class OrderAdmin(OrderTotalsMixin, admin.ModelAdmin):
+    list_display = ("id", "user", "status", "item_count", "subtotal")
     list_editable = ("status",)
-    list_filter = ("status", "shipping_country", "date_added")
+    list_filter = ("status", "shipping_address__country", "date_added")
+    list_select_related = ("user",)
+    raw_id_fields = ("billing_address", "shipping_address")
+    readonly_fields = ("item_count", "subtotal")
     inlines = (OrderItemInline,)
 
     fieldsets = (
-        (None, {"fields": ("user", "status")}),
-        (
-            "Billing info",
-            {
-                "fields": (
-                    "billing_name",
-                    "billing_address1",
-                    "billing_address2",
-                    "billing_zip_code",
-                    "billing_city",
-                    "billing_country",
-                )
-            },
-        ),
-        (
-            "Shipping info",
-            {"fields": (
-                "shipping_name",
-                "shipping_address1",
-                "shipping_address2",
-                "shipping_zip_code",
-                "shipping_city",
-                "shipping_country",
-            )
-            },
-        ),
+        (None, {"fields": ("user", "status", "item_count", "subtotal")}),
+        ("Billing info", {"fields": ("billing_address",)}),
+        ("Shipping info", {"fields": ("shipping_address",)}),
     )
 
 
@@ -192,43 +193,21 @@ class OrderAdmin(admin.ModelAdmin):
 
 class CentralOfficeOrderItemInline(admin.TabularInline):
     model = OrderItem
-    readonly_fields = ['product']
+    readonly_fields = ['product', 'unit_price']
 
 
-class CentralOfficeOrderAdmin(admin.ModelAdmin):
-    list_display = ("id", "user", "status")
+class CentralOfficeOrderAdmin(OrderTotalsMixin, admin.ModelAdmin):
+    list_display = ("id", "user", "status", "item_count", "subtotal")
     list_editable = ("status",)
-    readonly_fields = ("user",)
-    list_filter = ("status", "shipping_country", "date_added")
+    list_select_related = ("user",)
+    readonly_fields = ("user", "item_count", "subtotal")
+    raw_id_fields = ("billing_address", "shipping_address")
+    list_filter = ("status", "shipping_address__country", "date_added")
     inlines = (CentralOfficeOrderItemInline,)
     fieldsets = (
-        (None, {"fields": ("user", "status")}),
-        (
-            "Billing info",
-            {
-                "fields": (
-                    "billing_name",
-                    "billing_address1",
-                    "billing_address2",
-                    "billing_zip_code",
-                    "billing_city",
-                    "billing_country",
-                )
-            },
-        ),
-        (
-            "Shipping info",
-            {
-                "fields": (
-                    "shipping_name",
-                    "shipping_address1",
-                    "shipping_address2",
-                    "shipping_zip_code",
-                    "shipping_city",
-                    "shipping_country",
-                )
-            },
-        ),
+        (None, {"fields": ("user", "status", "item_count", "subtotal")}),
+        ("Billing info", {"fields": ("billing_address",)}),
+        ("Shipping info", {"fields": ("shipping_address",)}),
     )
 
 
@@ -240,27 +219,35 @@ class DispatchersOrderAdmin(admin.ModelAdmin):
         "date_added",
         "status",
     )
-    list_filter = ("status", "shipping_country", "date_added")
+    list_filter = ("status", "shipping_address__country", "date_added")
     inlines = (CentralOfficeOrderItemInline,)
+    readonly_fields = ("shipping_details",)
     fieldsets = (
         "Shipping info",
         {
             "fields": (
-                "shipping_name",
-                "shipping_address1",
-                "shipping_address2",
-                "shipping_zip_code",
-                "shipping_city",
-                "shipping_country",
+                "shipping_details",
             )
         },
     ),
+
+    def shipping_name(self, obj):
+        return obj.shipping_address.name
+
+    def shipping_details(self, obj):
+        return format_html(
+            "<br>".join(["{}"] * len(OrderAddress.FIELDS)),
+            *[getattr(obj.shipping_address, name) or "-"
+              for name in OrderAddress.FIELDS]
+        )
+
     # Dispatchers are only allowed to see orders that
     # are ready to be shipped
 
     def get_queryset(self, request):
         qs = super().get_queryset(request)
-        return qs.filter(status=Order.PAID)
+        return qs.filter(status=Order.PAID).select_related(
+            "shipping_address")
 
 
 # The following will add reporting views to the list of
@@ -278,18 +265,21 @@ class ReportingColoredAdminSite(ColoredAdminSite):
     def get_urls(self):
         urls = super().get_urls()
         my_urls = [
-            path("orders_per_day/", self.admin_view(self.orders_per_day),)]
+            path("orders_per_day/", self.admin_view(self.orders_per_day),),
+            path("revenue/", self.admin_view(self.revenue),),
+            path("throttling/", self.admin_view(self.throttling),)]
         return my_urls + urls
 
     def orders_per_day(self, request):
         starting_day = datetime.now() - timedelta(days=180)
-        order_data = (
-            Order.objects.filter(
-                date_added__gt=starting_day)
-            .annotate(day=TruncDay("date_added"))
-            .values('day')
-            .annotate(c=Count('id'))
-        )
+        with reporting_reads():
+            order_data = list(
+                Order.objects.filter(
+                    date_added__gt=starting_day)
+                .annotate(day=TruncDay("date_added"))
+                .values('day')
+                .annotate(c=Count('id'))
+            )
         lables = [x['day'].strftime("%Y-%m-%d") for x in order_data]
         values = [x["c"] for x in order_data]
 
@@ -303,16 +293,78 @@ class ReportingColoredAdminSite(ColoredAdminSite):
             request, "orders_per_day.html", context
         )
 
+    def revenue(self, request):
+        # reads only the totals stored on orders and items at
+        # checkout, never the current product prices
+        starting_day = datetime.now() - timedelta(days=180)
+        orders = Order.objects.filter(date_added__gt=starting_day)
+        with reporting_reads():
+            per_day = list(
+                orders.annotate(day=TruncDay("date_added"))
+                .values("day")
+                .annotate(orders=Count("id"), items=Sum("item_count"),
+                          revenue=Sum("subtotal"))
+                .order_by("day")
+            )
+            per_country = list(
+                orders.values(country=F("shipping_address__country"))
+                .annotate(orders=Count("id"), items=Sum("item_count"),
+                          revenue=Sum("subtotal"))
+                .order_by("-revenue")
+            )
+            # one pass over the items, those of untagged products
+            # make up the row whose tag is None
+            per_tag = list(
+                OrderItem.objects.filter(order__in=orders)
+                .values(tag_id=F("product__tags"),
+                        tag=F("product__tags__name"))
+                .annotate(items=Sum("quantity"),
+                          revenue=Sum(F("quantity") * F("unit_price"),
+                                      output_field=DecimalField(
+                                          max_digits=14, decimal_places=2)))
+                .order_by("-revenue")
+            )
+
+        context = dict(
+            self.each_context(request),
+            title="Revenue",
+            per_day=per_day,
+            per_country=per_country,
+            per_tag=per_tag,
+        )
+        return TemplateResponse(request, "revenue.html", context)
+
+    def throttling(self, request):
+        names = ("login", "signup")
+        outcomes = ("failed", "rejected")
+        context = dict(
+            self.each_context(request),
+            title="Login and signup throttling",
+            columns=["%s %s" % (name, outcome)
+                     for name in names for outcome in outcomes],
+            rows=ratelimit.stats(names, outcomes),
+        )
+        return TemplateResponse(request, "throttling.html", context)
+
+    reporting_pages = [
+        {
+            "name": "Orders per day",
+            "link": "orders_per_day/"
+        },
+        {
+            "name": "Revenue",
+            "link": "revenue/"
+        },
+        {
+            "name": "Login and signup throttling",
+            "link": "throttling/"
+        },
+    ]
+
     def index(self, request, extra_context=None):
-        reporting_pages = [
-            {
-                "name": "Orders per day",
-                "link": "orders_per_day/"
-            }
-        ]
         if not extra_context:
             extra_context = {}
-        extra_context = {"reporting_pages": reporting_pages}
+        extra_context = {"reporting_pages": self.reporting_pages}
 
         return super().index(request, extra_context)
 
@@ -324,11 +376,47 @@ class OwnersAdminSite(ReportingColoredAdminSite):
     site_header = "BookTime owners administration"
     site_header_color = "black"
     module_caption_color = "grey"
+    reporting_pages = ReportingColoredAdminSite.reporting_pages + [
+        {
+            "name": "Signups and logins per day",
+            "link": "auth_events/"
+        },
+    ]
 
     # return True or Flase either has permission to access
     def has_permission(self, request):
         return (request.user.is_active and request.user.is_superuser)
 
+    def get_urls(self):
+        urls = super().get_urls()
+        my_urls = [
+            path("auth_events/", self.admin_view(self.auth_events),)]
+        return my_urls + urls
+
+    def auth_events(self, request):
+        # events still buffered in memory are written first
+        analytics.flush()
+        starting_day = datetime.now() - timedelta(days=30)
+        with reporting_reads():
+            rows = list(
+                AuthEvent.objects.filter(date_added__gt=starting_day)
+                .annotate(day=TruncDay("date_added"))
+                .values("day", "kind", "platform")
+                .annotate(events=Count("id"),
+                          mobile=Count("id", filter=Q(mobile=True)))
+                .order_by("-day", "kind", "-events")
+            )
+        kinds = dict(AuthEvent.KINDS)
+        for row in rows:
+            row["kind"] = kinds[row["kind"]]
+
+        context = dict(
+            self.each_context(request),
+            title="Signups and logins per day",
+            rows=rows,
+        )
+        return TemplateResponse(request, "auth_events.html", context)
+
 
 class CentralOfficeAdminSite(ReportingColoredAdminSite):
     site_header = "BookTime central office administration"
@@ -359,6 +447,7 @@ main_admin.register(ProductImage, ProductImageAdmin)
 main_admin.register(Address, AddressAdmin)
 main_admin.register(Basket, BasketAdmin)
 main_admin.register(Order, OrderAdmin)
+main_admin.register(OrderAddress, OrderAddressAdmin)
 
 # Central Office Permission
 central_office_admin = CentralOfficeAdminSite("central-office-admin")
@@ -367,6 +456,7 @@ central_office_admin.register(ProductTag, ProductTagAdmin)
 central_office_admin.register(ProductImage, ProductImageAdmin)
 central_office_admin.register(Address, AddressAdmin)
 central_office_admin.register(Order, CentralOfficeOrderAdmin)
+central_office_admin.register(OrderAddress, OrderAddressAdmin)
 
 # Dispatcher permission
 dispatchers_admin = DispatchersAdminSite("dispatchers-admin")
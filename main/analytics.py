@@ -0,0 +1,90 @@
+"""
+    Signup and login analytics kept off the request path: track()
+only appends to an in-memory buffer, which is written with a single
+bulk_create once it is big or old enough. The check runs on
+request_finished, after the response was handed to the client, and
+once more when the process exits (a restart or a deploy). The test
+runner (main.test_runner) discards the buffer between tests and before
+the test database goes, so nothing is left for the exit flush.
+"""
+import atexit
+import logging
+import threading
+import time
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.core.signals import request_finished
+from django.db import DatabaseError
+from django.dispatch import receiver
+from django.utils import timezone
+from main import models
+
+logger = logging.getLogger(__name__)
+
+_lock = threading.Lock()
+_buffer = []
+_last_flush = time.monotonic()
+
+
+def _setting(name, default):
+    return getattr(settings, "ANALYTICS", {}).get(name, default)
+
+
+def track(request, kind, user=None):
+    meta = request.META
+    platform = meta.get("HTTP_SEC_CH_UA_PLATFORM", "").strip('"')
+    user_agent = meta.get("HTTP_USER_AGENT", "")
+    event = models.AuthEvent(
+        kind=kind,
+        user=user,
+        platform=platform[:32],
+        mobile=(meta.get("HTTP_SEC_CH_UA_MOBILE") == "?1"
+                or "Mobi" in user_agent),
+        user_agent=user_agent[:200],
+        referrer=urlsplit(meta.get("HTTP_REFERER", "")).netloc[:200],
+        date_added=timezone.now(),
+    )
+    with _lock:
+        _buffer.append(event)
+
+
+def flush():
+    global _buffer, _last_flush
+    with _lock:
+        events, _buffer = _buffer, []
+        _last_flush = time.monotonic()
+    if not events:
+        return 0
+    try:
+        models.AuthEvent.objects.bulk_create(events, batch_size=500)
+    except DatabaseError as e:
+        # analytics must never break the site, the batch is dropped
+        logger.warning("Dropped %d auth events: %s", len(events), e)
+        return 0
+    return len(events)
+
+
+def discard():
+    """Drops the buffered events, returns how many there were"""
+    global _buffer, _last_flush
+    with _lock:
+        events, _buffer = _buffer, []
+        _last_flush = time.monotonic()
+    return len(events)
+
+
+def flush_if_due():
+    due = (
+        len(_buffer) >= _setting("FLUSH_SIZE", 100)
+        or time.monotonic() - _last_flush >= _setting("FLUSH_INTERVAL", 60)
+    )
+    if _buffer and due:
+        flush()
+
+
+@receiver(request_finished)
+def flush_after_response(sender, **kwargs):
+    flush_if_due()
+
+
+atexit.register(flush)
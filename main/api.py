@@ -0,0 +1,174 @@
+"""
+    Read-only JSON API of the catalogue
+
+Rows are serialized straight from .values(), pages use keyset
+pagination on the primary key (?after=<id>) and ?fields= selects the
+returned fields. The ETag of a list is derived from the newest
+date_updated of the whole filtered set, so a client revalidating any
+page gets a 304 until something in the catalogue changes.
+"""
+from collections import defaultdict
+import hashlib
+
+from django.core.files.storage import default_storage
+from django.db.models import Count, Max
+from django.http import Http404, JsonResponse
+from django.utils.encoding import filepath_to_uri
+from django.views.decorators.http import etag, require_safe
+
+from main import models
+
+PRODUCT_FIELDS = ("id", "name", "slug", "description", "price",
+                  "in_stock", "date_updated")
+PRODUCT_RELATIONS = ("tags", "images")
+TAG_FIELDS = ("id", "name", "slug", "description", "date_updated")
+DEFAULT_LIMIT = 100
+MAX_LIMIT = 1000
+
+
+class ApiError(Exception):
+    pass
+
+
+def select_fields(request, fields, relations=()):
+    requested = request.GET.get("fields")
+    if not requested:
+        return list(fields), list(relations)
+    requested = [name.strip() for name in requested.split(",")]
+    unknown = set(requested) - set(fields) - set(relations)
+    if unknown:
+        raise ApiError("Unknown fields: %s" % ", ".join(sorted(unknown)))
+    return ([name for name in fields if name in requested],
+            [name for name in relations if name in requested])
+
+
+def page_params(request):
+    try:
+        limit = int(request.GET.get("limit", DEFAULT_LIMIT))
+        after = int(request.GET.get("after", 0))
+    except ValueError:
+        raise ApiError("limit and after must be integers")
+    if not 0 < limit <= MAX_LIMIT:
+        raise ApiError("limit must be between 1 and %d" % MAX_LIMIT)
+    return limit, after
+
+
+def collection_etag(queryset, request):
+    state = queryset.aggregate(updated=Max("date_updated"), count=Count("id"))
+    key = "%s|%s|%s" % (
+        state["updated"], state["count"], request.GET.urlencode())
+    return hashlib.md5(key.encode("utf-8")).hexdigest()
+
+
+def paginate(request, queryset, fields, relations=(), attach=None):
+    """
+        One page of queryset as a JSON response. The id is always
+    read, for the cursor and the relations, and dropped when it was
+    not asked for.
+    """
+    limit, after = page_params(request)
+    page = queryset.filter(pk__gt=after).order_by("pk")
+    rows = list(page.values("id", *fields)[:limit + 1])
+    more = len(rows) > limit
+    rows = rows[:limit]
+    if rows and relations:
+        last = rows[-1]["id"]
+        attach(rows, relations, queryset.filter(pk__gt=after, pk__lte=last))
+    next_url = None
+    if more:
+        params = request.GET.copy()
+        params["after"] = rows[-1]["id"]
+        next_url = "%s?%s" % (request.path, params.urlencode())
+    if "id" not in fields:
+        for row in rows:
+            del row["id"]
+    return JsonResponse({"results": rows, "next": next_url})
+
+
+def attach_product_relations(rows, relations, products):
+    """
+        Adds tags and images to the product rows, with one query per
+    relation for the whole page.
+    """
+    by_id = {row["id"]: row for row in rows}
+    if "tags" in relations:
+        tags = defaultdict(list)
+        links = models.Product.tags.through.objects.filter(
+            product__in=products.values("pk"), producttag__active=True
+        ).order_by("pk").values_list("product_id", "producttag__slug")
+        for product_id, slug in links:
+            tags[product_id].append(slug)
+        for product_id, row in by_id.items():
+            row["tags"] = tags[product_id]
+    if "images" in relations:
+        # storage.url() without its urljoin() per file
+        base_url = default_storage.base_url
+        images = defaultdict(list)
+        files = models.ProductImage.objects.filter(
+            product__in=products.values("pk")
+        ).order_by("pk").values_list("product_id", "image", "thumbnail")
+        for product_id, image, thumbnail in files:
+            images[product_id].append({
+                "image": base_url + filepath_to_uri(image),
+                "thumbnail": (
+                    base_url + filepath_to_uri(thumbnail)
+                    if thumbnail else None),
+            })
+        for product_id, row in by_id.items():
+            row["images"] = images[product_id]
+
+
+def products(request):
+    queryset = models.Product.objects.active()
+    tag = request.GET.get("tag")
+    if tag:
+        queryset = queryset.filter(tags__slug=tag)
+    return queryset
+
+
+def bad_request(error):
+    return JsonResponse({"error": str(error)}, status=400)
+
+
+@require_safe
+@etag(lambda request: collection_etag(products(request), request))
+def product_list(request):
+    try:
+        fields, relations = select_fields(
+            request, PRODUCT_FIELDS, PRODUCT_RELATIONS)
+        return paginate(request, products(request), fields, relations,
+                        attach_product_relations)
+    except ApiError as e:
+        return bad_request(e)
+
+
+@require_safe
+@etag(lambda request, pk: collection_etag(
+    models.Product.objects.active().filter(pk=pk), request))
+def product_detail(request, pk):
+    try:
+        fields, relations = select_fields(
+            request, PRODUCT_FIELDS, PRODUCT_RELATIONS)
+    except ApiError as e:
+        return bad_request(e)
+    queryset = models.Product.objects.active().filter(pk=pk)
+    rows = list(queryset.values("id", *fields))
+    if not rows:
+        raise Http404("No such product")
+    if relations:
+        attach_product_relations(rows, relations, queryset)
+    if "id" not in fields:
+        del rows[0]["id"]
+    return JsonResponse(rows[0])
+
+
+@require_safe
+@etag(lambda request: collection_etag(
+    models.ProductTag.objects.filter(active=True), request))
+def tag_list(request):
+    try:
+        fields, relations = select_fields(request, TAG_FIELDS)
+        return paginate(request, models.ProductTag.objects.filter(
+            active=True), fields)
+    except ApiError as e:
+        return bad_request(e)
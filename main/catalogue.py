@@ -0,0 +1,41 @@
+"""
+    Catalogue version used in the cache keys of every cached
+catalogue page or fragment. Any change to a product, tag or image
+bumps it (see main.signals), so stale entries are never read again
+and simply expire.
+"""
+from django.conf import settings
+from django.core.cache import cache
+
+from main import models, singleflight
+
+VERSION_KEY = "catalogue-version"
+
+
+def version():
+    value = cache.get(VERSION_KEY)
+    if value is None:
+        # never expires on its own, add() keeps a concurrent bump
+        cache.add(VERSION_KEY, 1, timeout=None)
+        value = cache.get(VERSION_KEY, 1)
+    return value
+
+
+def bump_version():
+    try:
+        return cache.incr(VERSION_KEY)
+    except ValueError:
+        cache.set(VERSION_KEY, 2, timeout=None)
+        return 2
+
+
+def get_tag(slug):
+    """
+        The tag with slug or None, from the cache
+    """
+    key = "tag:%d:%s" % (version(), slug)
+    # a list, so that a missing tag is cached too
+    tags = singleflight.get_or_set(
+        key, lambda: list(models.ProductTag.objects.filter(slug=slug)),
+        settings.TEMPLATE_FRAGMENT_TIMEOUT)
+    return tags[0] if tags else None
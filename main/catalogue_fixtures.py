@@ -0,0 +1,293 @@
+"""
+    Bulk loading and dumping of catalogue fixtures
+
+The format is the one of dumpdata/loaddata with natural keys
+(--natural-foreign --natural-primary), either as a JSON array or as
+NDJSON (one object per line), optionally gzipped. Both sides stream:
+objects are read and written one at a time, and are loaded in batches
+whose natural keys are resolved with one query and whose rows are
+written with bulk_create()/bulk_update().
+"""
+from collections import defaultdict
+import gzip
+import json
+
+from django.core.serializers.base import DeserializationError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
+
+from main import models
+
+BATCH_SIZE = 1000
+CHUNK_SIZE = 64 * 1024
+PRODUCT_FIELDS = ("name", "slug", "description", "price", "active",
+                  "in_stock", "date_updated")
+TAG_FIELDS = ("name", "slug", "description", "active", "date_updated")
+
+
+def open_fixture(path, mode):
+    if path.endswith(".gz"):
+        return gzip.open(path, mode + "t", encoding="utf-8")
+    return open(path, mode, encoding="utf-8")
+
+
+def is_ndjson(path):
+    return path.replace(".gz", "").endswith((".ndjson", ".jsonl"))
+
+
+def read_objects(f, ndjson=False):
+    """
+        Yields the objects of a JSON array or NDJSON file without
+    reading it all in memory
+    """
+    if ndjson:
+        for line in f:
+            if line.strip():
+                yield json.loads(line)
+        return
+    decoder = json.JSONDecoder()
+    buffer = f.read(CHUNK_SIZE).lstrip()
+    if not buffer.startswith("["):
+        raise ValueError("A fixture must be a JSON array")
+    buffer = buffer[1:]
+    eof = False
+    while True:
+        buffer = buffer.lstrip().lstrip(",").lstrip()
+        if buffer.startswith("]"):
+            return
+        try:
+            obj, end = decoder.raw_decode(buffer)
+        except json.JSONDecodeError:
+            if eof:
+                raise
+            chunk = f.read(CHUNK_SIZE)
+            eof = not chunk
+            buffer += chunk
+            continue
+        yield obj
+        buffer = buffer[end:]
+
+
+def write_objects(f, objects, ndjson=False):
+    count = 0
+    if not ndjson:
+        f.write("[")
+    for obj in objects:
+        if not ndjson:
+            f.write(",\n" if count else "\n")
+        f.write(json.dumps(obj, cls=DjangoJSONEncoder))
+        if ndjson:
+            f.write("\n")
+        count += 1
+    if not ndjson:
+        f.write("\n]\n")
+    return count
+
+
+def dump():
+    """
+        Tags, products and images, in that order, as fixture objects
+    """
+    for row in models.ProductTag.objects.order_by("pk").values(
+            *TAG_FIELDS).iterator():
+        yield {"model": "main.producttag", "fields": row}
+
+    last = 0
+    while True:
+        rows = list(
+            models.Product.objects.filter(pk__gt=last).order_by("pk")
+            .values("pk", *PRODUCT_FIELDS)[:BATCH_SIZE]
+        )
+        if not rows:
+            break
+        last = rows[-1]["pk"]
+        tags = defaultdict(list)
+        links = models.Product.tags.through.objects.filter(
+            product_id__gt=rows[0]["pk"] - 1, product_id__lte=last
+        ).order_by("pk").values_list("product_id", "producttag__slug")
+        for product_id, slug in links:
+            tags[product_id].append([slug])
+        for row in rows:
+            row["tags"] = tags[row.pop("pk")]
+            yield {"model": "main.product", "fields": row}
+
+    for row in models.ProductImage.objects.order_by("pk").values(
+            "product__slug", "image", "thumbnail").iterator():
+        yield {
+            "model": "main.productimage",
+            "fields": {
+                "product": [row["product__slug"]],
+                "image": row["image"],
+                "thumbnail": row["thumbnail"],
+            },
+        }
+
+
+class Loader:
+    """
+        Loads fixture objects in batches. Objects must come after the
+    ones they refer to, as dumpdata and dump() write them.
+    """
+
+    def __init__(self, batch_size=BATCH_SIZE):
+        self.batch_size = batch_size
+        self.created = self.updated = 0
+        self.touched = set()
+        self.touched_tags = set()
+        self.now = timezone.now()
+
+    def load(self, objects):
+        model, batch = None, []
+        for obj in objects:
+            if obj["model"] != model or len(batch) >= self.batch_size:
+                self.flush(model, batch)
+                model, batch = obj["model"], []
+            batch.append(obj)
+        self.flush(model, batch)
+        if self.touched_tags:
+            models.CatalogueChange.objects.record(
+                models.CatalogueChange.TAG, self.touched_tags)
+        if self.touched:
+            models.CatalogueChange.objects.record(
+                models.CatalogueChange.PRODUCT, self.touched)
+
+    def flush(self, model, batch):
+        if not batch:
+            return
+        if model == "main.producttag":
+            self.load_tags(batch)
+        elif model == "main.product":
+            self.load_products(batch)
+        elif model == "main.productimage":
+            self.load_images(batch)
+        else:
+            raise ValueError("%s is not a catalogue model" % model)
+
+    def describe(self, obj):
+        fields = obj["fields"]
+        if "slug" in fields:
+            return "%s %r" % (obj["model"], fields["slug"])
+        return "%s %r" % (obj["model"], (fields.get("product"),
+                                         fields.get("image")))
+
+    def resolve(self, Model, batch, keys):
+        """
+            The pk by slug of the natural keys keys(obj) of the objects
+        of batch. Like loaddata, an unknown key is an error naming the
+        object, raised before anything of the batch is written.
+        """
+        slugs = {key for obj in batch for key in keys(obj)}
+        pks = dict(Model.objects.filter(
+            slug__in=slugs).values_list("slug", "pk"))
+        for obj in batch:
+            for key in keys(obj):
+                if key not in pks:
+                    raise DeserializationError(
+                        "%s: %s matching natural key %r does not exist" % (
+                            self.describe(obj), Model._meta.label, [key]))
+        return pks
+
+    def upsert(self, Model, batch, fields):
+        """
+            Creates or updates the rows of batch, matched on slug.
+        Returns the pk of every row by slug.
+        """
+        rows = []
+        for obj in batch:
+            if "slug" not in obj["fields"]:
+                raise DeserializationError(
+                    "%s without a slug, its natural key" % obj["model"])
+            row = {f: obj["fields"][f] for f in fields if f in obj["fields"]}
+            if isinstance(row.get("date_updated"), str):
+                row["date_updated"] = parse_datetime(row["date_updated"])
+            else:
+                row.setdefault("date_updated", self.now)
+            rows.append(row)
+        existing = dict(Model.objects.filter(
+            slug__in=[row["slug"] for row in rows]).values_list("slug", "pk"))
+
+        Model.objects.bulk_create([
+            Model(**row) for row in rows if row["slug"] not in existing
+        ])
+        # rows missing a field keep the stored value
+        updates = defaultdict(list)
+        for row in rows:
+            if row["slug"] in existing:
+                updates[tuple(sorted(row))].append(
+                    Model(pk=existing[row["slug"]], **row))
+        for names, objs in updates.items():
+            Model.objects.bulk_update(objs, names)
+
+        created = len(rows) - sum(len(objs) for objs in updates.values())
+        self.created += created
+        self.updated += len(rows) - created
+        if created:
+            existing = dict(Model.objects.filter(
+                slug__in=[row["slug"] for row in rows]
+            ).values_list("slug", "pk"))
+        return existing
+
+    def load_tags(self, batch):
+        ids = self.upsert(models.ProductTag, batch, TAG_FIELDS)
+        self.touched_tags.update(ids.values())
+
+    def load_products(self, batch):
+        tagged = [obj for obj in batch if "tags" in obj["fields"]]
+        tags = self.resolve(
+            models.ProductTag, tagged,
+            lambda obj: [key[0] for key in obj["fields"]["tags"]])
+        ids = self.upsert(models.Product, batch, PRODUCT_FIELDS)
+        self.touched.update(ids.values())
+
+        Link = models.Product.tags.through
+        # like loaddata, the fixture replaces the tags of a product
+        product_ids = [ids[obj["fields"]["slug"]] for obj in tagged]
+        Link.objects.filter(product_id__in=product_ids).delete()
+        Link.objects.bulk_create([
+            Link(product_id=ids[obj["fields"]["slug"]],
+                 producttag_id=tags[key[0]])
+            for obj in tagged for key in obj["fields"]["tags"]
+        ])
+
+    def load_images(self, batch):
+        """
+            Images are matched on their product and image name, a pk
+        from another database could be any image here
+        """
+        products = self.resolve(
+            models.Product, batch, lambda obj: [obj["fields"]["product"][0]])
+        existing = defaultdict(list)
+        for pk, product_id, name, thumbnail in models.ProductImage.objects \
+                .filter(product_id__in=products.values(),
+                        image__in={obj["fields"]["image"] for obj in batch}) \
+                .order_by("pk") \
+                .values_list("pk", "product_id", "image", "thumbnail"):
+            existing[product_id, name].append((pk, thumbnail))
+
+        new, updated, added, removed = [], [], [], []
+        for obj in batch:
+            image = models.ProductImage(
+                product_id=products[obj["fields"]["product"][0]],
+                image=obj["fields"]["image"],
+                thumbnail=obj["fields"].get("thumbnail"))
+            # a product holding the same image twice has two rows
+            matches = existing[image.product_id, image.image.name]
+            if not matches:
+                new.append(image)
+                added += [image.image.name, image.thumbnail.name]
+                continue
+            image.pk, thumbnail = matches.pop(0)
+            updated.append(image)
+            if (thumbnail or None) != (image.thumbnail.name or None):
+                added.append(image.thumbnail.name)
+                removed.append(thumbnail)
+
+        models.ProductImage.objects.bulk_create(new)
+        models.ProductImage.objects.bulk_update(updated, ["thumbnail"])
+        # bulk writes send no signals, see also gc_media --recount
+        models.MediaBlob.objects.adjust(added, 1)
+        models.MediaBlob.objects.adjust(removed, -1)
+        self.created += len(new)
+        self.updated += len(updated)
+        self.touched.update(image.product_id for image in new + updated)
@@ -0,0 +1,140 @@
+"""
+    Change feed of the catalogue
+
+A consumer keeps the cursor (a CatalogueChange id) of the last change
+it applied and asks for the following ones. The changes read in one
+go are compacted to one entry per object. Each entry carries the
+current row of the object, or says "deleted" when the object is gone
+or inactive, so applying an entry twice does no harm.
+
+New consumers start from a gzipped NDJSON snapshot, which records the
+cursor it was taken at, and then follow the feed or the delta files.
+"""
+import gzip
+import json
+import os
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import JsonResponse
+from django.views.decorators.http import require_safe
+
+from main import api, models
+
+CatalogueChange = models.CatalogueChange
+KIND_NAMES = {
+    CatalogueChange.PRODUCT: "product",
+    CatalogueChange.TAG: "tag",
+}
+BATCH_SIZE = 500
+
+
+def load(kind, ids):
+    """
+        Current rows of the active objects among ids, by id
+    """
+    ids = list(ids)
+    rows = {}
+    for start in range(0, len(ids), BATCH_SIZE):
+        chunk = ids[start:start + BATCH_SIZE]
+        if kind == CatalogueChange.PRODUCT:
+            products = models.Product.objects.active().filter(pk__in=chunk)
+            batch = list(products.values(*api.PRODUCT_FIELDS))
+            api.attach_product_relations(
+                batch, api.PRODUCT_RELATIONS, products)
+        else:
+            batch = list(models.ProductTag.objects.filter(
+                active=True, pk__in=chunk).values(*api.TAG_FIELDS))
+        rows.update((row["id"], row) for row in batch)
+    return rows
+
+
+def entries_for(keys):
+    rows = {
+        kind: load(kind, [object_id for k, object_id in keys if k == kind])
+        for kind in KIND_NAMES
+    }
+    for kind, object_id in keys:
+        row = rows[kind].get(object_id)
+        entry = {"type": KIND_NAMES[kind], "id": object_id}
+        if row is None:
+            entry["action"] = "deleted"
+        else:
+            entry["action"] = "updated"
+            entry["data"] = row
+        yield entry
+
+
+def changes_since(cursor, limit):
+    """
+        (entries, cursor, more) for at most limit logged changes
+    after cursor
+    """
+    log = list(
+        CatalogueChange.objects.filter(pk__gt=cursor).order_by("pk")
+        .values_list("pk", "kind", "object_id")[:limit + 1]
+    )
+    more = len(log) > limit
+    log = log[:limit]
+    if not log:
+        return [], cursor, False
+    # ordered by the last change of every object
+    keys = {}
+    for pk, kind, object_id in log:
+        keys.pop((kind, object_id), None)
+        keys[(kind, object_id)] = pk
+    return list(entries_for(keys)), log[-1][0], more
+
+
+def latest_cursor():
+    return CatalogueChange.objects.order_by("-pk").values_list(
+        "pk", flat=True).first() or 0
+
+
+def snapshot():
+    """
+        An entry for every active tag and product, in pk batches
+    """
+    querysets = [
+        (CatalogueChange.TAG, models.ProductTag.objects.filter(active=True)),
+        (CatalogueChange.PRODUCT, models.Product.objects.active()),
+    ]
+    for kind, queryset in querysets:
+        last = 0
+        while True:
+            ids = list(
+                queryset.filter(pk__gt=last).order_by("pk")
+                .values_list("pk", flat=True)[:BATCH_SIZE]
+            )
+            if not ids:
+                break
+            last = ids[-1]
+            yield from entries_for([(kind, pk) for pk in ids])
+
+
+def write_ndjson(path, header, entries):
+    """
+        Writes header and entries, one JSON document per line, to a
+    gzip file. The file only appears once it is complete.
+    """
+    count = 0
+    with gzip.open(path + ".tmp", "wt", encoding="utf-8") as f:
+        f.write(json.dumps(header, cls=DjangoJSONEncoder) + "\n")
+        for entry in entries:
+            f.write(json.dumps(entry, cls=DjangoJSONEncoder) + "\n")
+            count += 1
+    os.replace(path + ".tmp", path)
+    return count
+
+
+@require_safe
+def feed(request):
+    try:
+        cursor = int(request.GET.get("since", 0))
+        limit = int(request.GET.get("limit", api.DEFAULT_LIMIT))
+    except ValueError:
+        return api.bad_request("since and limit must be integers")
+    if not 0 < limit <= api.MAX_LIMIT:
+        return api.bad_request(
+            "limit must be between 1 and %d" % api.MAX_LIMIT)
+    entries, cursor, more = changes_since(cursor, limit)
+    return JsonResponse({"changes": entries, "cursor": cursor, "more": more})
@@ -0,0 +1,10 @@
+from django.conf import settings
+from . import catalogue
+
+
+def catalogue_cache(request):
+    # used as the timeout and version of the {% cache %} fragments
+    return {
+        "catalogue_version": catalogue.version(),
+        "fragment_timeout": settings.TEMPLATE_FRAGMENT_TIMEOUT,
+    }
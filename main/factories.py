@@ -12,6 +12,7 @@ class UserFactory(factory.django.DjangoModelFactory):
 
 
 class ProductFactory(factory.django.DjangoModelFactory):
+    slug = factory.Sequence(lambda n: "product-%d" % n)
     price = fuzzy.FuzzyDecimal(low=1.0, high=1000.0, precision=2)
 
     class Meta:
@@ -1,11 +1,12 @@
 import logging
+import uuid
 from django import forms
 from django.core.mail import send_mail
 from django.contrib.auth import authenticate
 from django.contrib.auth.forms import UserCreationForm as DjangoUserCreationForm
 from django.contrib.auth.forms import UsernameField
 
-from . import models, widgets
+from . import models, ratelimit, widgets
 logger = logging.getLogger(__name__)
 
 
@@ -18,15 +19,75 @@ BasketLineFormSet = forms.inlineformset_factory(
 )
 
 
+class AddressChoiceField(forms.ModelChoiceField):
+    """
+        ModelChoiceField over an already loaded list of addresses,
+    rendering and validating it never queries the database (the form
+    reads the selected addresses again, see AddressSelectionForm)
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("queryset", models.Address.objects.none())
+        super().__init__(*args, **kwargs)
+        self.addresses = {}
+
+    def set_addresses(self, addresses):
+        self.addresses = {str(address.pk): address for address in addresses}
+        choices = [(address.pk, self.label_from_instance(address))
+                   for address in addresses]
+        if self.empty_label is not None:
+            choices.insert(0, ("", self.empty_label))
+        self.choices = choices
+
+    def to_python(self, value):
+        if value in self.empty_values:
+            return None
+        try:
+            return self.addresses[str(value)]
+        except KeyError:
+            raise forms.ValidationError(
+                self.error_messages['invalid_choice'],
+                code='invalid_choice'
+            )
+
+
 class AddressSelectionForm(forms.Form):
-    billing_address = forms.ModelChoiceField(queryset=None)
-    shipping_address = forms.ModelChoiceField(queryset=None)
+    billing_address = AddressChoiceField()
+    shipping_address = AddressChoiceField()
+    # a fresh key per rendered form, resubmitting it is a no-op
+    idempotency_key = forms.UUIDField(
+        initial=uuid.uuid4, widget=forms.HiddenInput)
 
     def __init__(self, user, *args, **kwargs):
         super().__init__(*args, **kwargs)
-        queryset = models.Address.objects.filter(user=user)
-        self.fields['billing_address'].queryset = queryset
-        self.fields['shipping_address'].queryset = queryset
+        self.user = user
+        addresses = models.Address.objects.address_book(user)
+        self.fields['billing_address'].set_addresses(addresses)
+        self.fields['shipping_address'].set_addresses(addresses)
+
+    def clean(self):
+        """
+            The cached address book can be stale in other processes,
+        the selected addresses are read again before the order
+        snapshots them
+        """
+        cleaned_data = super().clean()
+        names = [name for name in ("billing_address", "shipping_address")
+                 if cleaned_data.get(name)]
+        if not names:
+            return cleaned_data
+        current = models.Address.objects.filter(user=self.user).in_bulk(
+            {cleaned_data[name].pk for name in names})
+        for name in names:
+            address = current.get(cleaned_data[name].pk)
+            if address is None:
+                del cleaned_data[name]
+                self.add_error(name, forms.ValidationError(
+                    self.fields[name].error_messages['invalid_choice'],
+                    code='invalid_choice'))
+            else:
+                cleaned_data[name] = address
+        return cleaned_data
 
 
 class ContactForm(forms.Form):
@@ -87,18 +148,37 @@ class AuthenticationForm(forms.Form):
         password = self.cleaned_data.get("password")
 
         if email is not None and password:
+            keys = {"ip": ratelimit.client_ip(self.request),
+                    "email": email.lower()}
+            limits = ratelimit.get_limits("login")
+            # rejected before authenticate() so throttled attempts
+            # never pay for the password hasher
+            if any(limit.is_limited(keys[per])
+                   for per, limit in limits.items()):
+                ratelimit.record("login", "rejected")
+                logger.warning(
+                    "Throttled login for email=%s from ip=%s",
+                    email, keys["ip"]
+                )
+                raise forms.ValidationError(
+                    "Too many login attempts, please try again later."
+                )
+
             self.user = authenticate(
                 self.request, email=email, password=password
             )
 
             if self.user is None:
+                for per, limit in limits.items():
+                    limit.hit(keys[per])
+                ratelimit.record("login", "failed")
+                logger.warning(
+                    "Authentication failed for email=%s from ip=%s",
+                    email, keys["ip"]
+                )
                 raise forms.ValidationError(
                     "invalid email or password"
                 )
-                # TODO get Device info & IP
-                # logger.warning(
-                #     "Authentication failed user"
-                # )
             logger.info(
                 "Authentication successful for email=%s", email
             )
@@ -0,0 +1,97 @@
+import base64
+import hashlib
+from collections import OrderedDict
+from django.conf import settings
+from django.contrib.auth.hashers import (
+    Argon2PasswordHasher, BasePasswordHasher, PBKDF2PasswordHasher,
+    mask_hash,
+)
+from django.utils.crypto import constant_time_compare
+from django.utils.translation import gettext_noop as _
+
+
+def get_cost(name, default):
+    return getattr(settings, "PASSWORD_HASHER_COST", {}).get(name, default)
+
+
+class TunedPBKDF2PasswordHasher(PBKDF2PasswordHasher):
+    """
+        PBKDF2 with the iteration count taken from
+    PASSWORD_HASHER_COST, existing hashes with another count are
+    rehashed on the next successful login
+    """
+
+    @property
+    def iterations(self):
+        return get_cost("pbkdf2_iterations", PBKDF2PasswordHasher.iterations)
+
+
+class TunedArgon2PasswordHasher(Argon2PasswordHasher):
+    # needs the optional argon2-cffi package
+
+    @property
+    def time_cost(self):
+        return get_cost("argon2_time_cost", Argon2PasswordHasher.time_cost)
+
+    @property
+    def memory_cost(self):
+        return get_cost("argon2_memory_cost",
+                        Argon2PasswordHasher.memory_cost)
+
+
+class ScryptPasswordHasher(BasePasswordHasher):
+    """
+        scrypt from the standard library, Django only ships it
+    from 4.0 on. Encoded as scrypt$n$salt$r$p$hash
+    """
+    algorithm = "scrypt"
+    block_size = 8
+    parallelism = 1
+
+    @property
+    def work_factor(self):
+        return get_cost("scrypt_work_factor", 2 ** 14)
+
+    def encode(self, password, salt, n=None, r=None, p=None):
+        assert password is not None
+        assert salt and '$' not in salt
+        n = n or self.work_factor
+        r = r or self.block_size
+        p = p or self.parallelism
+        hash_ = hashlib.scrypt(
+            password.encode(), salt=salt.encode(), n=n, r=r, p=p,
+            maxmem=256 * n * r * p, dklen=64,
+        )
+        hash_ = base64.b64encode(hash_).decode('ascii').strip()
+        return "%s$%d$%s$%d$%d$%s" % (self.algorithm, n, salt, r, p, hash_)
+
+    def _split(self, encoded):
+        algorithm, n, salt, r, p, hash_ = encoded.split('$', 5)
+        assert algorithm == self.algorithm
+        return int(n), salt, int(r), int(p), hash_
+
+    def verify(self, password, encoded):
+        n, salt, r, p, _hash = self._split(encoded)
+        return constant_time_compare(
+            encoded, self.encode(password, salt, n, r, p))
+
+    def safe_summary(self, encoded):
+        n, salt, r, p, hash_ = self._split(encoded)
+        return OrderedDict([
+            (_('algorithm'), self.algorithm),
+            (_('work factor'), n),
+            (_('block size'), r),
+            (_('parallelism'), p),
+            (_('salt'), mask_hash(salt)),
+            (_('hash'), mask_hash(hash_)),
+        ])
+
+    def must_update(self, encoded):
+        n, salt, r, p, _hash = self._split(encoded)
+        return (n, r, p) != (
+            self.work_factor, self.block_size, self.parallelism)
+
+    def harden_runtime(self, password, encoded):
+        # scrypt cost cannot be topped up like PBKDF2 iterations
+        pass
+
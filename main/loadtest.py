@@ -0,0 +1,186 @@
+"""
+    HTTP load test of the shopping funnel
+
+Every funnel is one anonymous visitor with its own cookies: a tag
+page, a product page, add to basket, the basket, the login form, the
+login itself and the address selection of the checkout. Funnels run
+on a thread pool against a server started separately (or by the
+load_test command), so the whole stack is measured, middleware and
+sessions included. Redirects are not followed, a 302 is the expected
+answer of add_to_basket and of a successful login.
+"""
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from http.cookiejar import CookieJar
+import math
+import random
+import threading
+import time
+from urllib.error import HTTPError, URLError
+from urllib.parse import urlencode
+from urllib.request import HTTPCookieProcessor, HTTPRedirectHandler, \
+    Request, build_opener
+
+STEPS = ("products", "product", "add_to_basket", "basket", "login_form",
+         "login", "address_select")
+TIMEOUT = 30
+
+
+class NoRedirect(HTTPRedirectHandler):
+
+    def redirect_request(self, *args, **kwargs):
+        return None
+
+
+class Visitor:
+    """
+        A browser session: cookies are kept from one request to the
+    next, like the session and csrftoken cookies of Django
+    """
+
+    def __init__(self, base_url):
+        self.base_url = base_url.rstrip("/")
+        self.cookies = CookieJar()
+        self.opener = build_opener(
+            HTTPCookieProcessor(self.cookies), NoRedirect)
+
+    def cookie(self, name):
+        for cookie in self.cookies:
+            if cookie.name == name:
+                return cookie.value
+        return None
+
+    def request(self, path, data=None):
+        """
+            (status, seconds) of one request, the status is None when
+        no response came back
+        """
+        body = urlencode(data).encode("ascii") if data else None
+        started = time.perf_counter()
+        try:
+            response = self.opener.open(
+                Request(self.base_url + path, body), timeout=TIMEOUT)
+            response.read()
+            status = response.status
+        except HTTPError as e:
+            e.read()
+            status = e.code
+        except (URLError, OSError):
+            status = None
+        return status, time.perf_counter() - started
+
+
+class Results:
+    """
+        Latencies and errors per step, shared by the worker threads
+    """
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.latencies = defaultdict(list)
+        self.errors = defaultdict(int)
+        self.statuses = defaultdict(lambda: defaultdict(int))
+
+    def add(self, step, status, seconds, ok):
+        with self.lock:
+            self.statuses[step][str(status)] += 1
+            if ok:
+                self.latencies[step].append(seconds * 1000)
+            else:
+                self.errors[step] += 1
+
+    def summary(self, elapsed):
+        steps = {}
+        for step in STEPS:
+            latencies = sorted(self.latencies[step])
+            requests = sum(self.statuses[step].values())
+            steps[step] = {
+                "requests": requests,
+                "errors": self.errors[step],
+                "error_rate": round(
+                    self.errors[step] / requests, 4) if requests else 0,
+                "statuses": dict(sorted(self.statuses[step].items())),
+                "p50_ms": percentile(latencies, 50),
+                "p95_ms": percentile(latencies, 95),
+                "p99_ms": percentile(latencies, 99),
+                "requests_per_s": round(requests / elapsed, 1),
+            }
+        requests = sum(step["requests"] for step in steps.values())
+        errors = sum(step["errors"] for step in steps.values())
+        everything = sorted(
+            ms for step in STEPS for ms in self.latencies[step])
+        return steps, {
+            "requests": requests,
+            "errors": errors,
+            "error_rate": round(errors / requests, 4) if requests else 0,
+            "p50_ms": percentile(everything, 50),
+            "p95_ms": percentile(everything, 95),
+            "p99_ms": percentile(everything, 99),
+            "requests_per_s": round(requests / elapsed, 1),
+        }
+
+
+def percentile(ordered, p):
+    """Nearest rank percentile of a sorted list, in ms"""
+    if not ordered:
+        return None
+    rank = max(math.ceil(p / 100 * len(ordered)), 1)
+    return round(ordered[rank - 1], 2)
+
+
+def funnel(base_url, rng, tags, products, user, password, results):
+    """
+        One visitor going through the funnel, stops at the first
+    failed step as a visitor would
+    """
+    visitor = Visitor(base_url)
+    product_id, slug = rng.choice(products)
+    steps = [
+        ("products", "/products/%s/" % rng.choice(tags), None),
+        ("product", "/product/%s/" % slug, None),
+        ("add_to_basket", "/add_to_basket/?product_id=%d" % product_id,
+         None),
+        ("basket", "/basket/", None),
+        ("login_form", "/login/", None),
+        ("login", "/login/", lambda: {
+            "email": user, "password": password,
+            "csrfmiddlewaretoken": visitor.cookie("csrftoken") or ""}),
+        ("address_select", "/order/address_select/", None),
+    ]
+    for step, path, data in steps:
+        status, seconds = visitor.request(path, data and data())
+        # a login form shown again is a failed login
+        ok = status is not None and status < 400 and (
+            step != "login" or status == 302)
+        results.add(step, status, seconds, ok)
+        if not ok:
+            return False
+    return True
+
+
+def run(base_url, tags, products, users, password, funnels=100,
+        concurrency=10, seed=0):
+    """
+        Runs funnels visitors, concurrency at a time. Returns a dict
+    of results, see Results.summary().
+    """
+    results = Results()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        completed = sum(executor.map(
+            lambda i: funnel(
+                base_url, random.Random("%s-%d" % (seed, i)), tags,
+                products, users[i % len(users)], password, results),
+            range(funnels)))
+    elapsed = time.perf_counter() - started
+    steps, total = results.summary(elapsed)
+    return {
+        "steps": steps,
+        "total": total,
+        "funnels": {
+            "started": funnels,
+            "completed": completed,
+            "per_s": round(completed / elapsed, 2),
+        },
+        "elapsed_s": round(elapsed, 2),
+    }
@@ -0,0 +1,94 @@
+import time
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.http import JsonResponse
+from django.test import RequestFactory
+from main import api, models
+
+
+class Command(BaseCommand):
+    help = 'Measure catalogue API responses per second on a large page'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=1000)
+        parser.add_argument("--requests", type=int, default=20)
+
+    def handle(self, *args, **options):
+        # the data only lives for the duration of the benchmark
+        with transaction.atomic():
+            self.build(options["products"])
+            params = {"tag": "bench-api", "limit": options["products"]}
+            etag = api.product_list(self.get(params))["ETag"]
+            cases = [
+                ("model instances", self.instances, params),
+                ("values, all fields", api.product_list, params),
+                ("values, name+price", api.product_list,
+                 dict(params, fields="name,price")),
+                ("values, tags+images", api.product_list,
+                 dict(params, fields="id,name,tags,images")),
+                ("304 not modified", api.product_list,
+                 dict(params, HTTP_IF_NONE_MATCH=etag)),
+            ]
+            for label, view, case_params in cases:
+                elapsed = self.measure(view, case_params, options["requests"])
+                self.stdout.write(
+                    "%s: responses/s=%.1f (%.2f ms)" % (
+                        label, options["requests"] / elapsed,
+                        elapsed / options["requests"] * 1000)
+                )
+            transaction.set_rollback(True)
+
+    def build(self, count):
+        tag = models.ProductTag.objects.create(
+            name="Bench API", slug="bench-api")
+        models.Product.objects.bulk_create([
+            models.Product(name="Bench API %d" % i,
+                           slug="bench-api-%d" % i,
+                           description="A book " * 20,
+                           price=Decimal("9.99"))
+            for i in range(count)
+        ])
+        products = models.Product.objects.filter(
+            slug__startswith="bench-api-")
+        tag.product_set.add(*products)
+        models.ProductImage.objects.bulk_create([
+            models.ProductImage(product=product,
+                                image="blobs/00/bench.jpg",
+                                thumbnail="blobs/00/bench-thumb.jpg")
+            for product in products
+        ])
+
+    def get(self, params):
+        params = dict(params)
+        headers = {key: params.pop(key) for key in list(params)
+                   if key.startswith("HTTP_")}
+        return RequestFactory().get("/api/products/", params, **headers)
+
+    def measure(self, view, params, requests):
+        started = time.perf_counter()
+        for _ in range(requests):
+            response = view(self.get(params))
+            assert response.status_code in (200, 304), response.status_code
+        return time.perf_counter() - started
+
+    def instances(self, request):
+        # what a serializer over model instances would do
+        products = models.Product.objects.active().filter(
+            tags__slug="bench-api").order_by("pk").prefetch_related(
+            "tags", "productimage_set")[:1000]
+        return JsonResponse({"results": [
+            {
+                "id": product.id,
+                "name": product.name,
+                "slug": product.slug,
+                "description": product.description,
+                "price": product.price,
+                "in_stock": product.in_stock,
+                "date_updated": product.date_updated,
+                "tags": [tag.slug for tag in product.tags.all()],
+                "images": [image.image.url
+                           for image in product.productimage_set.all()],
+            }
+            for product in products
+        ]})
@@ -0,0 +1,75 @@
+import random
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+from django.core.management.base import BaseCommand
+from django.db import OperationalError, connection
+from main import models
+
+
+class Command(BaseCommand):
+    help = 'Measure mixed read/write throughput against the database'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--seconds", type=float, default=10)
+        parser.add_argument("--write-ratio", type=float, default=0.1,
+                            help="Share of operations that are basket writes")
+
+    def handle(self, *args, **options):
+        product = models.Product.objects.create(
+            name="bench_db product", slug="bench-db-product",
+            price=Decimal("1.00"), active=False,
+        )
+        self.lock = threading.Lock()
+        self.counts = Counter()
+        self.baskets = []
+        deadline = time.monotonic() + options["seconds"]
+        try:
+            with ThreadPoolExecutor(max_workers=options["threads"]) as pool:
+                futures = [
+                    pool.submit(self.worker, product, deadline,
+                                options["write_ratio"])
+                    for _ in range(options["threads"])
+                ]
+                for future in futures:
+                    future.result()
+        finally:
+            models.Basket.objects.filter(pk__in=self.baskets).delete()
+            product.delete()
+
+        seconds = options["seconds"]
+        self.stdout.write(
+            "Reads=%d (%.0f/s)" % (self.counts["reads"],
+                                   self.counts["reads"] / seconds)
+        )
+        self.stdout.write(
+            "Writes=%d (%.0f/s)" % (self.counts["writes"],
+                                    self.counts["writes"] / seconds)
+        )
+        self.stdout.write("Lock errors=%d" % self.counts["errors"])
+
+    def worker(self, product, deadline, write_ratio):
+        counts = Counter()
+        basket = models.Basket.objects.create()
+        try:
+            while time.monotonic() < deadline:
+                try:
+                    if random.random() < write_ratio:
+                        basket.add_product(product.pk)
+                        counts["writes"] += 1
+                    else:
+                        # what ProductListView runs for a page
+                        list(models.Product.objects.active()
+                             .order_by("name")[:4])
+                        basket.totals()
+                        counts["reads"] += 1
+                except OperationalError:
+                    counts["errors"] += 1
+        finally:
+            connection.close()
+            with self.lock:
+                self.counts.update(counts)
+                self.baskets.append(basket.pk)
@@ -0,0 +1,80 @@
+import os
+import shutil
+import tempfile
+import time
+from decimal import Decimal
+from django.core.management import call_command
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from main import models
+
+
+class Command(BaseCommand):
+    help = 'Compare dumpdata/loaddata with dump_catalogue/load_catalogue ' \
+           'on a large catalogue'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=10000)
+        parser.add_argument("--tags", type=int, default=50)
+
+    def handle(self, *args, **options):
+        directory = tempfile.mkdtemp()
+        try:
+            # the data only lives for the duration of the benchmark
+            with transaction.atomic():
+                self.build(options["products"], options["tags"])
+                self.compare(directory)
+                transaction.set_rollback(True)
+        finally:
+            shutil.rmtree(directory)
+
+    def build(self, products, tags):
+        models.ProductTag.objects.bulk_create([
+            models.ProductTag(name="Bench fixtures %d" % i,
+                              slug="bench-fixtures-%d" % i)
+            for i in range(tags)
+        ])
+        models.Product.objects.bulk_create([
+            models.Product(name="Bench fixtures %d" % i,
+                           slug="bench-fixtures-%d" % i,
+                           description="A book " * 20,
+                           price=Decimal("9.99"))
+            for i in range(products)
+        ], batch_size=500)
+        tag_ids = list(models.ProductTag.objects.filter(
+            slug__startswith="bench-fixtures-").values_list("pk", flat=True))
+        Link = models.Product.tags.through
+        Link.objects.bulk_create([
+            Link(product_id=product_id,
+                 producttag_id=tag_ids[product_id % len(tag_ids)])
+            for product_id in models.Product.objects.filter(
+                slug__startswith="bench-fixtures-").values_list(
+                "pk", flat=True)
+        ], batch_size=500)
+
+    def compare(self, directory):
+        dumpdata = os.path.join(directory, "dumpdata.json")
+        dump_catalogue = os.path.join(directory, "catalogue.ndjson")
+        self.measure("dumpdata", lambda: call_command(
+            "dumpdata", "main.producttag", "main.product",
+            natural_foreign=True, natural_primary=True, output=dumpdata))
+        self.measure("dump_catalogue", lambda: call_command(
+            "dump_catalogue", dump_catalogue))
+        for label, path in [("loaddata", dumpdata),
+                            ("load_catalogue", dumpdata),
+                            ("load_catalogue ndjson", dump_catalogue)]:
+            # every run creates the bench rows and updates the others
+            with transaction.atomic():
+                models.Product.objects.filter(
+                    slug__startswith="bench-fixtures-").delete()
+                models.ProductTag.objects.filter(
+                    slug__startswith="bench-fixtures-").delete()
+                command = label.split()[0]
+                self.measure(label, lambda: call_command(command, path))
+                transaction.set_rollback(True)
+
+    def measure(self, label, function):
+        started = time.perf_counter()
+        function()
+        self.stdout.write(
+            "%s: %.2f s" % (label, time.perf_counter() - started))
@@ -0,0 +1,58 @@
+import math
+import statistics
+import time
+from django.core.management.base import BaseCommand
+from django.test import override_settings
+from main import hashers
+
+
+class Command(BaseCommand):
+    help = 'Measure password hash latency on this host and recommend ' \
+           'PASSWORD_HASHER_COST values for a target login latency'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--target-ms", type=float, default=250)
+        parser.add_argument("--samples", type=int, default=5)
+
+    def handle(self, *args, **options):
+        self.samples = options["samples"]
+        target = options["target_ms"] / 1000
+
+        with override_settings(PASSWORD_HASHER_COST={
+                "pbkdf2_iterations": 100000}):
+            elapsed = self.measure(hashers.TunedPBKDF2PasswordHasher())
+        iterations = max(
+            10000, int(round(100000 * target / elapsed, -4)))
+        self.report("pbkdf2", elapsed, "pbkdf2_iterations", iterations)
+
+        with override_settings(PASSWORD_HASHER_COST={
+                "scrypt_work_factor": 2 ** 14}):
+            elapsed = self.measure(hashers.ScryptPasswordHasher())
+        # scrypt time grows linearly with the work factor, which
+        # has to be a power of two
+        exponent = max(10, 14 + int(math.floor(math.log2(target / elapsed))))
+        self.report("scrypt", elapsed, "scrypt_work_factor",
+                    "2 ** %d" % exponent)
+
+        with override_settings(PASSWORD_HASHER_COST={"argon2_time_cost": 1}):
+            try:
+                elapsed = self.measure(hashers.TunedArgon2PasswordHasher())
+            except ValueError:
+                self.stdout.write("argon2: argon2-cffi is not installed")
+            else:
+                self.report("argon2", elapsed, "argon2_time_cost",
+                            max(1, int(target // elapsed)))
+
+    def measure(self, hasher):
+        timings = []
+        for _ in range(self.samples):
+            started = time.perf_counter()
+            hasher.encode("correct horse battery staple", hasher.salt())
+            timings.append(time.perf_counter() - started)
+        return statistics.median(timings)
+
+    def report(self, profile, elapsed, setting, value):
+        self.stdout.write(
+            "%s: %.1f ms at the reference cost, recommended %s=%s" % (
+                profile, elapsed * 1000, setting, value)
+        )
@@ -0,0 +1,41 @@
+import time
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory, override_settings
+from main import forms, models
+
+
+class Command(BaseCommand):
+    help = 'Measure CPU spent on a burst of failed logins with and ' \
+           'without throttling'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--attempts", type=int, default=200)
+
+    def handle(self, *args, **options):
+        email = "bench-login@booktime.domain"
+        user = models.User.objects.create_user(email, "correct-password")
+        try:
+            with override_settings(RATE_LIMITS={}):
+                unthrottled = self.attack(email, options["attempts"])
+            throttled = self.attack(email, options["attempts"])
+        finally:
+            user.delete()
+
+        self.stdout.write(
+            "Without throttling: %.2fs CPU" % unthrottled
+        )
+        self.stdout.write(
+            "With throttling: %.2fs CPU (%.0f%% saved)" % (
+                throttled, 100 * (1 - throttled / max(unthrottled, 1e-6)))
+        )
+
+    def attack(self, email, attempts):
+        cache.clear()
+        request = RequestFactory().post("/login/", REMOTE_ADDR="10.0.0.1")
+        started = time.process_time()
+        for _ in range(attempts):
+            form = forms.AuthenticationForm(request, data={
+                "email": email, "password": "wrong-password"})
+            form.is_valid()
+        return time.process_time() - started
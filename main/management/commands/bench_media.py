@@ -0,0 +1,89 @@
+import os
+import shutil
+import tempfile
+import time
+from django.core.files.base import ContentFile
+from django.core.management.base import BaseCommand
+from django.test import RequestFactory
+from django.test.utils import override_settings
+from django.views import static
+from main import media
+from main.storage import ContentAddressedStorage
+
+
+class Command(BaseCommand):
+    help = 'Compare media serving through static() and main.media.serve'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--size", type=int, default=512,
+                            help="Size of the served file in KiB")
+        parser.add_argument("--requests", type=int, default=500)
+
+    def handle(self, *args, **options):
+        media_root = tempfile.mkdtemp()
+        try:
+            with override_settings(MEDIA_ROOT=media_root,
+                                   MEDIA_SENDFILE_HEADER=None):
+                storage = ContentAddressedStorage(location=media_root)
+                content = os.urandom(options["size"] * 1024)
+                # bypasses _save(), no MediaBlob row is needed here
+                name = storage.blob_name(
+                    storage.content_name(ContentFile(content), "x.jpg"),
+                    "x.jpg")
+                os.makedirs(os.path.dirname(storage.path(name)))
+                with open(storage.path(name), "wb") as f:
+                    f.write(content)
+                self.run_all(media_root, name, options["requests"])
+        finally:
+            shutil.rmtree(media_root)
+
+    def run_all(self, media_root, name, count):
+        factory = RequestFactory()
+        with open(os.devnull, "wb") as devnull:
+            self.devnull = devnull
+            etag = media.serve(factory.get("/"), name)["ETag"]
+            cases = [
+                ("static() full", lambda: static.serve(
+                    factory.get("/"), name, document_root=media_root),
+                    self.iterate),
+                ("serve full", lambda: media.serve(
+                    factory.get("/"), name), self.iterate),
+                ("serve sendfile", lambda: media.serve(
+                    factory.get("/"), name), self.sendfile),
+                ("serve range 64k", lambda: media.serve(
+                    factory.get("/", HTTP_RANGE="bytes=0-65535"), name),
+                    self.iterate),
+                ("serve 304", lambda: media.serve(
+                    factory.get("/", HTTP_IF_NONE_MATCH=etag), name),
+                    self.iterate),
+            ]
+            for label, request, consume in cases:
+                sent = 0
+                started = time.perf_counter()
+                for _ in range(count):
+                    sent += consume(request())
+                elapsed = time.perf_counter() - started
+                self.stdout.write(
+                    "%s: requests/s=%.0f MB/s=%.1f" % (
+                        label, count / elapsed, sent / elapsed / 1e6)
+                )
+
+    def iterate(self, response):
+        sent = 0
+        for chunk in response:
+            self.devnull.write(chunk)
+            sent += len(chunk)
+        response.close()
+        return sent
+
+    def sendfile(self, response):
+        # what a sendfile() based wsgi.file_wrapper does
+        filelike = response.file_to_stream
+        length = int(response["Content-Length"])
+        offset = os.lseek(filelike.fileno(), 0, os.SEEK_CUR)
+        sent = 0
+        while sent < length:
+            sent += os.sendfile(self.devnull.fileno(), filelike.fileno(),
+                                offset + sent, length - sent)
+        response.close()
+        return sent
@@ -0,0 +1,48 @@
+import time
+from importlib import import_module
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+
+
+ENGINES = [
+    "django.contrib.sessions.backends.db",
+    "django.contrib.sessions.backends.cached_db",
+    "django.contrib.sessions.backends.cache",
+    "django.contrib.sessions.backends.signed_cookies",
+]
+
+
+class Command(BaseCommand):
+    help = 'Compare the per request overhead of the session backends'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--requests", type=int, default=1000)
+        parser.add_argument("--engine", action="append", dest="engines",
+                            help="Session engine to measure (repeatable)")
+
+    def handle(self, *args, **options):
+        count = options["requests"]
+        for engine in options["engines"] or ENGINES:
+            SessionStore = import_module(engine).SessionStore
+            elapsed = self.run(SessionStore, count)
+            self.stdout.write(
+                "%s: %.3f ms/request" % (engine, elapsed * 1000 / count)
+            )
+
+    def run(self, SessionStore, count):
+        # a request that reads the basket id from the session and
+        # writes it back, like add_to_basket does
+        session_key = None
+        created = set()
+        started = time.perf_counter()
+        for i in range(count):
+            session = SessionStore(session_key)
+            session.get("basket_id")
+            session["basket_id"] = i
+            session.save()
+            session_key = session.session_key
+            created.add(session_key)
+        elapsed = time.perf_counter() - started
+
+        Session.objects.filter(session_key__in=created).delete()
+        return elapsed
@@ -0,0 +1,86 @@
+import time
+from decimal import Decimal
+from django.contrib.auth.models import AnonymousUser
+from django.core.cache import cache
+from django.core.management.base import BaseCommand
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.template.loader import render_to_string
+from django.test import RequestFactory
+from main import forms, models
+
+
+class Command(BaseCommand):
+    help = 'Measure render times of the storefront templates, with ' \
+           'cold and warm fragment caches'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--products", type=int, default=200)
+        parser.add_argument("--tags", type=int, default=20)
+        parser.add_argument("--basket-lines", type=int, default=20)
+        parser.add_argument("--renders", type=int, default=100)
+
+    def handle(self, *args, **options):
+        # the data only lives for the duration of the benchmark
+        with transaction.atomic():
+            pages = self.build(options)
+            for name, context in pages:
+                cold, warm = self.measure(name, context, options["renders"])
+                self.stdout.write(
+                    "%s: cold %.2f ms, warm %.2f ms" % (
+                        name, cold * 1000, warm * 1000)
+                )
+            transaction.set_rollback(True)
+
+    def build(self, options):
+        tags = [
+            models.ProductTag.objects.create(
+                name="Bench tag %d" % i, slug="bench-tag-%d" % i)
+            for i in range(options["tags"])
+        ]
+        models.Product.objects.bulk_create([
+            models.Product(name="Bench product %d" % i,
+                           slug="bench-product-%d" % i,
+                           price=Decimal("9.99"))
+            for i in range(options["products"])
+        ])
+        products = list(models.Product.objects.filter(
+            slug__startswith="bench-product-").order_by("name"))
+        products[0].tags.add(*tags)
+
+        basket = models.Basket.objects.create()
+        models.BasketLine.objects.bulk_create([
+            models.BasketLine(basket=basket, product=product)
+            for product in products[:options["basket_lines"]]
+        ])
+
+        page = Paginator(products, 4).page(2)
+        return [
+            ("main/product_list.html", {
+                "page_obj": page, "object_list": page.object_list}),
+            ("main/product_detail.html", {"object": products[0]}),
+            ("basket.html", {
+                "formset": forms.BasketLineFormSet(
+                    instance=basket,
+                    queryset=models.BasketLine.objects.select_related(
+                        "product"))}),
+        ]
+
+    def measure(self, name, context, renders):
+        request = RequestFactory().get("/products/all/?page=2")
+        request.user = AnonymousUser()
+        request.basket = None
+
+        cold = 0
+        for _ in range(renders):
+            cache.clear()
+            started = time.perf_counter()
+            render_to_string(name, context, request)
+            cold += time.perf_counter() - started
+
+        render_to_string(name, context, request)
+        started = time.perf_counter()
+        for _ in range(renders):
+            render_to_string(name, context, request)
+        warm = time.perf_counter() - started
+        return cold / renders, warm / renders
@@ -0,0 +1,57 @@
+import time
+from datetime import timedelta
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from main import models
+
+
+class Command(BaseCommand):
+    help = 'Delete abandoned open baskets in small batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--days", type=int, default=30,
+                            help="Age of the last basket update")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--pause", type=float, default=0.05,
+                            help="Seconds to sleep between batches")
+        parser.add_argument("--include-users", action="store_true",
+                            help="Also delete baskets owned by users")
+
+    def handle(self, *args, **options):
+        cutoff = timezone.now() - timedelta(days=options["days"])
+        stale = models.Basket.objects.filter(
+            status=models.Basket.OPEN, date_updated__lt=cutoff
+        )
+        if not options["include_users"]:
+            stale = stale.filter(user__isnull=True)
+
+        self.stdout.write("Cleaning baskets not updated since %s" % cutoff)
+        baskets = lines = 0
+        started = time.monotonic()
+        while True:
+            # every batch is its own short transaction so the sqlite
+            # write lock is released between batches
+            with transaction.atomic():
+                ids = list(
+                    stale.order_by("pk")
+                    .values_list("pk", flat=True)[:options["batch_size"]]
+                )
+                if not ids:
+                    break
+                # the filters are repeated so that a basket touched after
+                # the select above is left alone
+                batch = stale.filter(pk__in=ids)
+                lines += models.BasketLine.objects.filter(
+                    basket__in=batch.values("pk")
+                ).delete()[0]
+                baskets += batch.delete()[1].get("main.Basket", 0)
+            time.sleep(options["pause"])
+
+        elapsed = time.monotonic() - started
+        self.stdout.write(
+            "Baskets deleted=%d (lines=%d)" % (baskets, lines)
+        )
+        self.stdout.write(
+            "Rows per second=%.0f" % ((baskets + lines) / max(elapsed, 1e-6))
+        )
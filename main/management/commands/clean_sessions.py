@@ -0,0 +1,36 @@
+import time
+from django.contrib.sessions.models import Session
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+
+
+class Command(BaseCommand):
+    help = 'Delete expired database sessions in small batches'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch-size", type=int, default=1000)
+        parser.add_argument("--pause", type=float, default=0.05,
+                            help="Seconds to sleep between batches")
+
+    def handle(self, *args, **options):
+        expired = Session.objects.filter(expire_date__lt=timezone.now())
+        deleted = 0
+        started = time.monotonic()
+        while True:
+            with transaction.atomic():
+                keys = list(
+                    expired.values_list("session_key", flat=True)
+                    [:options["batch_size"]]
+                )
+                if not keys:
+                    break
+                deleted += expired.filter(
+                    session_key__in=keys).delete()[0]
+            time.sleep(options["pause"])
+
+        elapsed = time.monotonic() - started
+        self.stdout.write("Sessions deleted=%d" % deleted)
+        self.stdout.write(
+            "Rows per second=%.0f" % (deleted / max(elapsed, 1e-6))
+        )
@@ -0,0 +1,18 @@
+from django.core.management.base import BaseCommand
+from main import catalogue_fixtures
+
+
+class Command(BaseCommand):
+    help = 'Dump tags, products and images as a natural key fixture'
+
+    def add_arguments(self, parser):
+        parser.add_argument("output", type=str,
+                            help="A .json or .ndjson file, may end in .gz")
+
+    def handle(self, *args, **options):
+        path = options["output"]
+        with catalogue_fixtures.open_fixture(path, "w") as f:
+            count = catalogue_fixtures.write_objects(
+                f, catalogue_fixtures.dump(),
+                ndjson=catalogue_fixtures.is_ndjson(path))
+        self.stdout.write("Objects dumped=%d" % count)
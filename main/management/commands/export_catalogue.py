@@ -0,0 +1,50 @@
+import os
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from main import api, changes
+
+
+class Command(BaseCommand):
+    help = 'Write a gzipped NDJSON snapshot of the catalogue, or the ' \
+           'changes since a cursor'
+
+    def add_arguments(self, parser):
+        parser.add_argument("directory", type=str)
+        parser.add_argument("--since", type=int,
+                            help="Cursor of the last applied change, "
+                                 "writes a delta instead of a snapshot")
+
+    def handle(self, *args, **options):
+        os.makedirs(options["directory"], exist_ok=True)
+        since = options["since"]
+        if since is None:
+            # taken first, changes made while reading are replayed
+            cursor = changes.latest_cursor()
+            name = "catalogue-%d.ndjson.gz" % cursor
+            header = {"cursor": cursor, "date": timezone.now()}
+            entries = changes.snapshot()
+        else:
+            # the end is taken first as well, the changes logged while
+            # writing go to the next delta
+            cursor = max(changes.latest_cursor(), since)
+            entries = self.delta(since, cursor)
+            name = "catalogue-%d-%d.ndjson.gz" % (since, cursor)
+            header = {"since": since, "cursor": cursor,
+                      "date": timezone.now()}
+
+        path = os.path.join(options["directory"], name)
+        count = changes.write_ndjson(path, header, entries)
+        self.stdout.write(
+            "Entries written=%d (cursor=%d) to %s" % (count, cursor, path)
+        )
+
+    def delta(self, since, until):
+        """
+            Entries of the changes after since, up to until at least,
+        fetched and written one batch at a time
+        """
+        cursor, more = since, True
+        while more and cursor < until:
+            batch, cursor, more = changes.changes_since(
+                cursor, api.MAX_LIMIT)
+            yield from batch
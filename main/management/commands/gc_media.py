@@ -0,0 +1,74 @@
+from collections import Counter
+from datetime import timedelta
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from main import models
+
+
+class Command(BaseCommand):
+    help = 'Delete media blobs that no file field references any more'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--hours", type=int, default=24,
+                            help="Age of the last use of a blob")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--recount", action="store_true",
+                            help="Recompute every reference count first")
+
+    def handle(self, *args, **options):
+        if options["recount"]:
+            self.recount(options["batch_size"])
+
+        # the grace period protects uploads whose row is not saved yet
+        cutoff = timezone.now() - timedelta(hours=options["hours"])
+        orphans = models.MediaBlob.objects.filter(
+            refcount=0, date_updated__lt=cutoff)
+
+        blobs = size = 0
+        last_pk = 0
+        while True:
+            with transaction.atomic():
+                batch = list(
+                    orphans.filter(pk__gt=last_pk).order_by("pk")
+                    .values_list("pk", "name", "size")[:options["batch_size"]]
+                )
+                if not batch:
+                    break
+                last_pk = batch[-1][0]
+                ids = [pk for pk, name, blob_size in batch]
+                # filtered again, a blob reused meanwhile is kept
+                orphans.filter(pk__in=ids).delete()
+                kept = set(models.MediaBlob.objects.filter(
+                    pk__in=ids).values_list("pk", flat=True))
+            for pk, name, blob_size in batch:
+                if pk in kept:
+                    continue
+                # an upload of the same bytes since the commit created
+                # the row again and relies on the file
+                if models.MediaBlob.objects.filter(name=name).exists():
+                    continue
+                default_storage.delete(name)
+                blobs += 1
+                size += blob_size
+
+        self.stdout.write(
+            "Blobs deleted=%d (bytes=%d)" % (blobs, size)
+        )
+
+    def recount(self, batch_size):
+        references = Counter()
+        for names in models.ProductImage.objects.values_list(
+                "image", "thumbnail").iterator():
+            references.update(name for name in names if name)
+
+        changed = []
+        for blob in models.MediaBlob.objects.only(
+                "pk", "name", "refcount").iterator():
+            if blob.refcount != references[blob.name]:
+                blob.refcount = references[blob.name]
+                changed.append(blob)
+        models.MediaBlob.objects.bulk_update(
+            changed, ["refcount"], batch_size=batch_size)
+        self.stdout.write("Blobs recounted=%d" % len(changed))
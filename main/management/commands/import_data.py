@@ -1,56 +1,264 @@
-from collections import Counter
+from collections import Counter, defaultdict
 import csv
+from decimal import Decimal, InvalidOperation
 import os.path
 from django.core.files.images import ImageFile
-from django.core.management.base import BaseCommand
+from django.core.management import call_command
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
 from django.template.defaultfilters import slugify
-from main import models
+from django.utils import timezone
+from main import catalogue, models
+from main.management.commands.warm_cache import is_process_local
+
+PRODUCT_FIELDS = ("name", "description", "price")
+
+
+def tag_slugs(row):
+    return {slug for slug, name in row["tags"]}
 
 
 class Command(BaseCommand):
-    help = 'Import products in BookTime'
+    help = 'Import products in BookTime, matched on their slug'
 
     def add_arguments(self, parser):
         parser.add_argument("csvfile", type=open)
         parser.add_argument("image_basedir", type=str)
+        parser.add_argument("--dry-run", action="store_true",
+                            help="Only report what would change")
+        parser.add_argument("--deactivate-missing", action="store_true",
+                            help="Deactivate products missing from the file")
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--warm-cache", action="store_true",
+                            help="Run warm_cache once the import is done")
+        parser.add_argument("--warm-cache-url",
+                            help="Server warm_cache requests, implies "
+                                 "--warm-cache")
 
     def handle(self, *args, **options):
-        self.stdout.write("Importing products....")
-        c = Counter()
-        reader = csv.DictReader(options.pop("csvfile"))
-
-        for row in reader:
-            product, created = models.Product.objects.get_or_create(
-                name=row['name'], price=row['price']
-            )
-            product.description = row["description"]
-            product.slug = slugify(row["name"])
-
-            tags = row["tags"].split("|")
-            for import_tag in tags:
-                tag, tag_created = models.ProductTag.objects.get_or_create(
-                    name=import_tag)
-                product.tags.add(tag)
-                c['tags'] += 1
-                if tag_created:
-                    c["tags_created"] += 1
-            with open(os.path.join(options["image_basedir"], row["image_filename"]), "rb") as f:
-                image = models.ProductImage(
-                    product=product,
-                    image=ImageFile(f, name=row["image_filename"]))
-                image.save()
-                c["images"] += 1
+        warm_url = options["warm_cache_url"]
+        warm = options["warm_cache"] or warm_url
+        # checked first, the import is not run to fail at the end
+        if warm and not warm_url and is_process_local():
+            raise CommandError(
+                "The cache is local to every process, give the running "
+                "server to warm with --warm-cache-url")
+        self.stdout.write("Importing products")
+        self.batch_size = options["batch_size"]
+        self.verbosity = options["verbosity"]
+        self.c = Counter()
+        rows = self.read(options.pop("csvfile"))
+        # the whole catalogue is read once, then only differences are written
+        products = {}
+        for product in models.Product.objects.values(
+                "pk", "slug", "active", *PRODUCT_FIELDS).iterator():
+            products[product["slug"]] = product
+        tags = dict(models.ProductTag.objects.values_list("slug", "pk"))
+        # tag slug -> link pk, per product
+        linked = defaultdict(dict)
+        for pk, product_id, tag_slug in models.Product.tags.through.objects \
+                .values_list("pk", "product_id", "producttag__slug") \
+                .iterator():
+            linked[product_id][tag_slug] = pk
+        with_images = set(models.ProductImage.objects.values_list(
+            "product_id", flat=True).distinct())
 
-            c["products"] += 1
-            if created:
-                c["products_created"] += 1
+        new, changed = [], []
+        for slug, row in rows.items():
+            product = products.get(slug)
+            if product is None:
+                new.append(row)
+            elif not product["active"] or any(
+                    product[field] != row[field] for field in PRODUCT_FIELDS
+            ) or set(linked[product["pk"]]) != tag_slugs(row):
+                changed.append((product, row))
+            else:
+                self.c["products_unchanged"] += 1
+        removed = [
+            product for slug, product in products.items()
+            if slug not in rows and product["active"]
+        ]
+        new_tags = {
+            tag_slug: name for row in rows.values()
+            for tag_slug, name in row["tags"] if tag_slug not in tags
+        }
+
+        if options["dry_run"]:
+            self.report(new, changed, removed, new_tags, linked)
+            return
+
+        with transaction.atomic():
+            touched = self.write_products(new, changed, products)
+            if options["deactivate_missing"] and removed:
+                touched.extend(self.deactivate(removed))
+            # products whose links change are new or changed, their
+            # date_updated is set by write_products()
+            self.write_tags(rows, products, tags, linked, new_tags)
+            if touched:
+                models.CatalogueChange.objects.record(
+                    models.CatalogueChange.PRODUCT, set(touched))
+                transaction.on_commit(catalogue.bump_version)
+        self.import_images(rows, products, with_images,
+                           options["image_basedir"])
 
         self.stdout.write(
             "Products processed=%d (created=%d)" % (
-                c["products"], c["products_created"])
+                self.c["products"], len(new))
         )
         self.stdout.write(
-            "Tags processed=%d (created=%d)" % (c["tags"], c["tags_created"])
+            "Tags processed=%d (created=%d)" % (
+                self.c["tags"], len(new_tags))
         )
+        self.stdout.write("Images processed=%d" % self.c["images"])
+        if warm:
+            call_command("warm_cache", url=warm_url, stdout=self.stdout)
+
+    def read(self, csvfile):
+        rows = {}
+        tag_slugs = {}
+        for line, row in enumerate(csv.DictReader(csvfile), start=2):
+            try:
+                price = Decimal(row["price"])
+            except (InvalidOperation, TypeError):
+                self.stderr.write(
+                    "Line %d skipped, invalid price %r" % (line, row["price"]))
+                continue
+            tags = []
+            for name in row["tags"].split("|"):
+                name = name.strip()
+                if name:
+                    if name not in tag_slugs:
+                        tag_slugs[name] = slugify(name)
+                    tags.append((tag_slugs[name], name))
+            slug = slugify(row["name"])
+            # the last row of a slug wins
+            rows[slug] = {
+                "slug": slug,
+                "name": row["name"],
+                "description": row["description"],
+                "price": price,
+                "tags": tags,
+                "image_filename": row["image_filename"],
+            }
+            self.c["products"] += 1
+            self.c["tags"] += len(tags)
+        return rows
 
-        self.stdout.write("Image processed=%d" % c["images"])
+    def report(self, new, changed, removed, new_tags, linked):
+        self.stdout.write("Dry run, nothing is written")
+        self.stdout.write(
+            "Products new=%d changed=%d unchanged=%d removed=%d" % (
+                len(new), len(changed), self.c["products_unchanged"],
+                len(removed))
+        )
+        links_added = sum(len(tag_slugs(row)) for row in new)
+        links_removed = 0
+        for product, row in changed:
+            before, after = set(linked[product["pk"]]), tag_slugs(row)
+            links_added += len(after - before)
+            links_removed += len(before - after)
+        self.stdout.write("Tags new=%d" % len(new_tags))
+        self.stdout.write(
+            "Tag links added=%d removed=%d" % (links_added, links_removed))
+        if self.verbosity < 2:
+            return
+        for row in new:
+            self.stdout.write("+ %s" % row["slug"])
+        for product, row in changed:
+            fields = [
+                "%s: %s -> %s" % (field, product[field], row[field])
+                for field in PRODUCT_FIELDS if product[field] != row[field]
+            ]
+            before = sorted(linked[product["pk"]])
+            after = sorted(tag_slugs(row))
+            if before != after:
+                fields.append("tags: %s -> %s" % (
+                    ", ".join(before) or "none", ", ".join(after) or "none"))
+            fields = fields or ["active: False -> True"]
+            self.stdout.write(
+                "~ %s (%s)" % (product["slug"], ", ".join(fields)))
+        for product in removed:
+            self.stdout.write("- %s" % product["slug"])
+
+    def write_products(self, new, changed, products):
+        now = timezone.now()
+        models.Product.objects.bulk_create([
+            models.Product(slug=row["slug"], date_updated=now,
+                           **{field: row[field] for field in PRODUCT_FIELDS})
+            for row in new
+        ], batch_size=self.batch_size)
+        # bulk_create() does not return primary keys on sqlite
+        slugs = [row["slug"] for row in new]
+        for start in range(0, len(slugs), self.batch_size):
+            for product in models.Product.objects.filter(
+                    slug__in=slugs[start:start + self.batch_size]).values(
+                    "pk", "slug", "active", *PRODUCT_FIELDS):
+                products[product["slug"]] = product
+
+        updates = [
+            models.Product(pk=product["pk"], active=True, date_updated=now,
+                           **{field: row[field] for field in PRODUCT_FIELDS})
+            for product, row in changed
+        ]
+        models.Product.objects.bulk_update(
+            updates, ["active", "date_updated"] + list(PRODUCT_FIELDS),
+            batch_size=self.batch_size)
+        return ([products[row["slug"]]["pk"] for row in new] +
+                [product["pk"] for product, row in changed])
+
+    def deactivate(self, removed):
+        ids = [product["pk"] for product in removed]
+        for start in range(0, len(ids), self.batch_size):
+            models.Product.objects.filter(
+                pk__in=ids[start:start + self.batch_size]
+            ).update(active=False, date_updated=timezone.now())
+        return ids
+
+    def write_tags(self, rows, products, tags, linked, new_tags):
+        """
+            Links every product of the file to its tags, the links to
+        tags no longer listed for a product are deleted
+        """
+        models.ProductTag.objects.bulk_create([
+            models.ProductTag(slug=slug, name=name)
+            for slug, name in new_tags.items()
+        ], batch_size=self.batch_size)
+        if new_tags:
+            tags.update(models.ProductTag.objects.filter(
+                slug__in=list(new_tags)).values_list("slug", "pk"))
+
+        missing, dropped = set(), []
+        for slug, row in rows.items():
+            product_id = products[slug]["pk"]
+            current = linked.get(product_id, {})
+            wanted = tag_slugs(row)
+            for tag_slug in wanted - set(current):
+                missing.add((product_id, tags[tag_slug]))
+            dropped.extend(
+                pk for tag_slug, pk in current.items()
+                if tag_slug not in wanted)
+        Link = models.Product.tags.through
+        Link.objects.bulk_create([
+            Link(product_id=product_id, producttag_id=tag_id)
+            for product_id, tag_id in missing
+        ], batch_size=self.batch_size)
+        for start in range(0, len(dropped), self.batch_size):
+            Link.objects.filter(
+                pk__in=dropped[start:start + self.batch_size]).delete()
+
+    def import_images(self, rows, products, with_images, image_basedir):
+        """
+            Images of products that have none yet, saved one by one
+        for the thumbnail generation.
+        """
+        for slug, row in rows.items():
+            product_id = products[slug]["pk"]
+            if product_id in with_images or not row["image_filename"]:
+                continue
+            path = os.path.join(image_basedir, row["image_filename"])
+            with open(path, "rb") as f:
+                image = models.ProductImage(
+                    product_id=product_id,
+                    image=ImageFile(f, name=row["image_filename"]))
+                image.save()
+            self.c["images"] += 1
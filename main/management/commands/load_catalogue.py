@@ -0,0 +1,33 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.base import DeserializationError
+from django.db import transaction
+from main import catalogue, catalogue_fixtures
+
+
+class Command(BaseCommand):
+    help = 'Load a natural key fixture of tags, products and images ' \
+           'in bulk'
+
+    def add_arguments(self, parser):
+        parser.add_argument("fixture", type=str,
+                            help="A .json or .ndjson file, may end in .gz")
+        parser.add_argument("--batch-size", type=int,
+                            default=catalogue_fixtures.BATCH_SIZE)
+
+    def handle(self, *args, **options):
+        path = options["fixture"]
+        loader = catalogue_fixtures.Loader(options["batch_size"])
+        try:
+            with transaction.atomic():
+                with catalogue_fixtures.open_fixture(path, "r") as f:
+                    loader.load(catalogue_fixtures.read_objects(
+                        f, ndjson=catalogue_fixtures.is_ndjson(path)))
+                transaction.on_commit(catalogue.bump_version)
+        except DeserializationError as e:
+            raise CommandError(
+                "Problem installing fixture '%s': %s" % (path, e))
+        self.stdout.write(
+            "Objects loaded=%d (created=%d, updated=%d)" % (
+                loader.created + loader.updated, loader.created,
+                loader.updated)
+        )
@@ -0,0 +1,117 @@
+import json
+import os
+import socket
+import subprocess
+import sys
+import time
+from urllib.parse import urlsplit
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db.models import Count
+from django.utils import timezone
+from main import loadtest, models
+from main.management.commands.seed_perf_data import PASSWORD
+
+
+class Command(BaseCommand):
+    help = 'Replay the shopping funnel over HTTP against a local server ' \
+           'and a database seeded by seed_perf_data'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--url", default="http://127.0.0.1:8000")
+        parser.add_argument("--serve", action="store_true",
+                            help="Start runserver on the host and port "
+                                 "of --url for the duration of the test")
+        parser.add_argument("--funnels", type=int, default=200)
+        parser.add_argument("--concurrency", type=int, default=10)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--output", default="loadtest.json",
+                            help="JSON file of the results")
+
+    def handle(self, *args, **options):
+        tags, products, users = self.targets()
+        server = self.serve(options["url"]) if options["serve"] else None
+        try:
+            results = loadtest.run(
+                options["url"], tags, products, users, PASSWORD,
+                funnels=options["funnels"],
+                concurrency=options["concurrency"], seed=options["seed"])
+        finally:
+            if server:
+                server.terminate()
+                server.wait()
+
+        results["meta"] = {
+            "url": options["url"],
+            "funnels": options["funnels"],
+            "concurrency": options["concurrency"],
+            "seed": options["seed"],
+            "commit": self.commit(),
+            "date": timezone.now().isoformat(),
+        }
+        with open(options["output"], "w") as f:
+            json.dump(results, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+        for step in loadtest.STEPS:
+            self.write_step(step, results["steps"][step])
+        self.write_step("total", results["total"])
+        self.stdout.write(
+            "Funnels completed=%d/%d (%.2f/s), results in %s" % (
+                results["funnels"]["completed"], options["funnels"],
+                results["funnels"]["per_s"], options["output"])
+        )
+
+    def targets(self):
+        """
+            Tag slugs, (product id, slug) and emails the visitors pick
+        from, all from the seeded data
+        """
+        users = list(models.User.objects.filter(
+            email__startswith="perf-", address__isnull=False
+        ).distinct().order_by("pk").values_list("email", flat=True)[:1000])
+        if not users:
+            raise CommandError(
+                "No seeded users, run seed_perf_data first")
+        tags = list(models.ProductTag.objects.filter(active=True).annotate(
+            products=Count("product")).filter(products__gt=0).order_by(
+            "-products", "pk").values_list("slug", flat=True)[:50])
+        products = list(models.Product.objects.active().order_by(
+            "pk").values_list("pk", "slug")[:1000])
+        if not tags or not products:
+            raise CommandError("No tagged products to browse")
+        return tags, products, users
+
+    def serve(self, url):
+        address = urlsplit(url).netloc
+        host, port = address.rsplit(":", 1)
+        server = subprocess.Popen(
+            [sys.executable, os.path.join(settings.BASE_DIR, "manage.py"),
+             "runserver", "--noreload", address],
+            stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        deadline = time.monotonic() + 30
+        while time.monotonic() < deadline:
+            try:
+                socket.create_connection((host, int(port)), 1).close()
+                return server
+            except OSError:
+                time.sleep(0.2)
+        server.terminate()
+        raise CommandError("The server did not start on %s" % address)
+
+    def commit(self):
+        try:
+            return subprocess.check_output(
+                ["git", "rev-parse", "--short", "HEAD"],
+                cwd=settings.BASE_DIR, stderr=subprocess.DEVNULL
+            ).decode().strip()
+        except (OSError, subprocess.CalledProcessError):
+            return None
+
+    def write_step(self, name, step):
+        self.stdout.write(
+            "%s: requests=%d errors=%d p50=%s p95=%s p99=%s ms "
+            "(%.1f/s)" % (
+                name, step["requests"], step["errors"], step["p50_ms"],
+                step["p95_ms"], step["p99_ms"], step["requests_per_s"])
+        )
@@ -0,0 +1,362 @@
+from contextlib import contextmanager
+from datetime import datetime, time as dt_time, timedelta
+from io import BytesIO
+from itertools import accumulate
+import random
+import time
+import factory.random
+from PIL import Image
+from django.contrib.auth.hashers import make_password
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management.base import BaseCommand, CommandError
+from django.core.management.color import no_style
+from django.db import connection, transaction
+from django.db.models import Max
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from main import catalogue, factories, models
+from main.models.user import SUPPORTED_COUNTRIES
+
+ADJECTIVES = ["Silent", "Red", "Hidden", "Last", "Little", "Broken", "Old",
+              "Golden", "Lost", "Wild", "Dark", "Bright", "Secret", "Long"]
+NOUNS = ["River", "House", "Garden", "Desert", "Empire", "Letters", "Night",
+         "Kingdom", "Journey", "Stories", "Python", "Recipes", "Algorithms",
+         "Poems", "Music", "Islands"]
+WORDS = ["a", "the", "of", "book", "story", "guide", "life", "world", "new",
+         "history", "first", "edition", "classic", "modern", "about", "and"]
+FIRST_NAMES = ["Ali", "Sara", "Omar", "Mona", "Ahmed", "Huda", "Khalid",
+               "Amna", "Yousif", "Reem"]
+CITIES = {"SD": ["Khartoum", "Omdurman", "Port Sudan", "Kassala"],
+          "KSA": ["Riyadh", "Jeddah", "Dammam", "Mecca"]}
+PASSWORD = "seed-password"
+
+
+class Zipf:
+    """
+        Picks offsets in range(n), offset k with a weight of 1 / (k+1)^s,
+    so a few items get most of the picks
+    """
+
+    def __init__(self, rng, n, s):
+        self.rng = rng
+        self.offsets = range(n)
+        self.cum_weights = list(accumulate(
+            1 / (rank ** s) for rank in range(1, n + 1)))
+
+    def pick(self, k=1):
+        return self.rng.choices(self.offsets, cum_weights=self.cum_weights,
+                                k=k)
+
+    def distinct(self, k):
+        # a few draws more than needed, popular offsets repeat
+        return list(dict.fromkeys(self.pick(k * 2)))[:k]
+
+
+@contextmanager
+def historic_dates(*model_classes):
+    """
+        Lets bulk_create() write the dates it is given to auto_now and
+    auto_now_add fields
+    """
+    fields = [
+        (field, field.auto_now, field.auto_now_add)
+        for model in model_classes for field in model._meta.concrete_fields
+        if getattr(field, "auto_now", False) or
+        getattr(field, "auto_now_add", False)
+    ]
+    for field, auto_now, auto_now_add in fields:
+        field.auto_now = field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, auto_now, auto_now_add in fields:
+            field.auto_now, field.auto_now_add = auto_now, auto_now_add
+
+
+def next_pk(model):
+    return (model.objects.aggregate(last=Max("pk"))["last"] or 0) + 1
+
+
+class Command(BaseCommand):
+    help = 'Seed a large, repeatable dataset for performance tests'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=1000)
+        parser.add_argument("--products", type=int, default=1000)
+        parser.add_argument("--tags", type=int, default=50)
+        parser.add_argument("--orders", type=int, default=5000)
+        parser.add_argument("--baskets", type=int, default=500,
+                            help="Open baskets, on top of the ones of "
+                                 "the orders")
+        parser.add_argument("--days", type=int, default=365,
+                            help="Orders are spread over this many days")
+        parser.add_argument("--end", type=str,
+                            help="Last day of the range, YYYY-MM-DD, "
+                                 "defaults to today")
+        parser.add_argument("--zipf", type=float, default=1.1,
+                            help="Skew of tags, products and customers")
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        if options["tags"] < 1 or options["products"] < 1 or \
+                options["users"] < 1:
+            raise CommandError("At least one user, product and tag needed")
+        end = parse_date(options["end"]) if options["end"] else \
+            timezone.localdate()
+        if end is None:
+            raise CommandError("--end must be a date, YYYY-MM-DD")
+        self.end = timezone.make_aware(
+            datetime.combine(end + timedelta(days=1), dt_time.min))
+        self.start = self.end - timedelta(days=options["days"])
+        self.batch_size = options["batch_size"]
+        self.zipf = options["zipf"]
+        # the same seed always gives the same rows, apart from the pks
+        self.rng = random.Random(options["seed"])
+        factory.random.reseed_random(options["seed"])
+
+        started = time.perf_counter()
+        with transaction.atomic(), historic_dates(
+                models.Product, models.ProductTag, models.Basket,
+                models.Order):
+            tag_ids = self.seed_tags(options["tags"])
+            products = self.seed_products(options["products"], tag_ids)
+            users = self.seed_users(options["users"])
+            self.seed_orders(options["orders"], products, users)
+            self.seed_baskets(options["baskets"], products, users)
+            self.reset_sequences()
+            transaction.on_commit(catalogue.bump_version)
+        self.stdout.write("Seeded in %.1f s" % (
+            time.perf_counter() - started))
+
+    def random_date(self, start=None):
+        start = start or self.start
+        return start + (self.end - start) * self.rng.random()
+
+    def seed_tags(self, count):
+        first = next_pk(models.ProductTag)
+        tags = []
+        for pk in range(first, first + count):
+            words = self.rng.sample(NOUNS, 2)
+            tags.append(models.ProductTag(
+                pk=pk, name=" & ".join(words)[:32],
+                slug="perf-tag-%d" % pk,
+                description=self.sentence(8),
+                date_updated=self.random_date()))
+        models.ProductTag.objects.bulk_create(
+            tags, batch_size=self.batch_size)
+        models.CatalogueChange.objects.record(
+            models.CatalogueChange.TAG, range(first, first + count))
+        self.stdout.write("Tags created=%d" % count)
+        return list(range(first, first + count))
+
+    def seed_products(self, count, tag_ids):
+        """
+            Products with Zipf distributed tags and an image for four
+        products out of five. Returns (pk, name, price) tuples in
+        popularity order.
+        """
+        first = next_pk(models.Product)
+        tag_zipf = Zipf(self.rng, len(tag_ids), self.zipf)
+        images = self.placeholder_images()
+        Link = models.Product.tags.through
+        products = []
+        links = images_created = 0
+        for start in range(first, first + count, self.batch_size):
+            batch, batch_links, batch_images = [], [], []
+            for pk in range(start, min(start + self.batch_size,
+                                       first + count)):
+                product = factories.ProductFactory.build(
+                    pk=pk, slug="perf-%d" % pk,
+                    name=("%s %s" % (self.rng.choice(ADJECTIVES),
+                                     self.rng.choice(NOUNS)))[:32],
+                    description=self.sentence(self.rng.randint(10, 60)),
+                    in_stock=self.rng.random() < 0.9,
+                    date_updated=self.random_date())
+                batch.append(product)
+                products.append((pk, product.name, product.price))
+                for offset in tag_zipf.distinct(self.rng.randint(1, 3)):
+                    batch_links.append(Link(
+                        product_id=pk, producttag_id=tag_ids[offset]))
+                if self.rng.random() < 0.8:
+                    image, thumbnail = self.rng.choice(images)
+                    batch_images.append(models.ProductImage(
+                        product_id=pk, image=image, thumbnail=thumbnail))
+            models.Product.objects.bulk_create(batch)
+            Link.objects.bulk_create(batch_links)
+            models.ProductImage.objects.bulk_create(batch_images)
+            # bulk writes send no signals, see also gc_media --recount
+            models.MediaBlob.objects.adjust(
+                [image.image.name for image in batch_images] +
+                [image.thumbnail.name for image in batch_images], 1)
+            links += len(batch_links)
+            images_created += len(batch_images)
+        models.CatalogueChange.objects.record(
+            models.CatalogueChange.PRODUCT, range(first, first + count))
+        self.stdout.write(
+            "Products created=%d (tags=%d, images=%d)" % (
+                count, links, images_created)
+        )
+        # popularity does not follow the pk order
+        self.rng.shuffle(products)
+        return products
+
+    def placeholder_images(self):
+        images = []
+        for hue in range(0, 256, 32):
+            names = []
+            for size in (300, 150):
+                f = BytesIO()
+                Image.new("RGB", (size, size), (hue, 96, 255 - hue)).save(
+                    f, "JPEG")
+                names.append(default_storage.save(
+                    "product-images/seed-%d.jpg" % size,
+                    ContentFile(f.getvalue())))
+            images.append(tuple(names))
+        return images
+
+    def seed_users(self, count):
+        """
+            Users with one or two addresses, returns (user pk, order
+        address pk) tuples
+        """
+        first = next_pk(models.User)
+        address_pk = next_pk(models.Address)
+        snapshot_pk = next_pk(models.OrderAddress)
+        password = make_password(PASSWORD)
+        users = []
+        for start in range(first, first + count, self.batch_size):
+            batch, addresses, snapshots = [], [], []
+            for pk in range(start, min(start + self.batch_size,
+                                       first + count)):
+                name = self.rng.choice(FIRST_NAMES)
+                batch.append(factories.UserFactory.build(
+                    pk=pk, email="perf-%d@example.com" % pk,
+                    first_name=name, password=password,
+                    date_joined=self.random_date()))
+                first = len(addresses)
+                for _ in range(self.rng.randint(1, 2)):
+                    country = self.rng.choice(SUPPORTED_COUNTRIES)[0]
+                    address = factories.AddressFactory.build(
+                        pk=address_pk,
+                        user_id=pk, name="%s %d" % (name, pk),
+                        address1="%d %s Street" % (
+                            self.rng.randint(1, 200),
+                            self.rng.choice(NOUNS)),
+                        zip_code="%05d" % self.rng.randint(0, 99999),
+                        city=self.rng.choice(CITIES[country]),
+                        country=country)
+                    addresses.append(address)
+                    address_pk += 1
+                # orders ship to the first address
+                fields = {name: getattr(addresses[first], name)
+                          for name in models.OrderAddress.FIELDS}
+                snapshots.append(models.OrderAddress(
+                    pk=snapshot_pk,
+                    digest=models.OrderAddress.make_digest(fields),
+                    **fields))
+                users.append((pk, snapshot_pk))
+                snapshot_pk += 1
+            models.User.objects.bulk_create(batch)
+            models.Address.objects.bulk_create(addresses)
+            models.OrderAddress.objects.bulk_create(snapshots)
+        self.stdout.write("Users created=%d" % count)
+        return users
+
+    def seed_orders(self, count, products, users):
+        """
+            Submitted baskets and their orders, evenly spread over the
+        date range so that pks follow the dates
+        """
+        product_zipf = Zipf(self.rng, len(products), self.zipf)
+        user_zipf = Zipf(self.rng, len(users), self.zipf)
+        basket_pk = next_pk(models.Basket)
+        order_pk = next_pk(models.Order)
+        span = (self.end - self.start) / max(count, 1)
+        recent = self.end - timedelta(days=7)
+        items_created = 0
+        for start in range(0, count, self.batch_size):
+            baskets, lines, orders, items = [], [], [], []
+            for i in range(start, min(start + self.batch_size, count)):
+                date = self.start + span * (i + self.rng.random())
+                user_id, address_id = users[user_zipf.pick()[0]]
+                baskets.append(models.Basket(
+                    pk=basket_pk, user_id=user_id,
+                    status=models.Basket.SUBMITTED,
+                    date_added=date, date_updated=date))
+                chosen = []
+                for offset in product_zipf.distinct(
+                        self.rng.choice((1, 1, 1, 2, 2, 3, 4))):
+                    product_id, name, price = products[offset]
+                    quantity = self.rng.choice((1, 1, 1, 1, 2, 3))
+                    chosen.append((product_id, name, price, quantity))
+                    lines.append(models.BasketLine(
+                        basket_id=basket_pk, product_id=product_id,
+                        quantity=quantity))
+                    items.append(models.OrderItem(
+                        order_id=order_pk, product_id=product_id,
+                        quantity=quantity, unit_price=price,
+                        status=models.OrderItem.NEW if date > recent
+                        else models.OrderItem.SENT))
+                orders.append(models.Order(
+                    pk=order_pk, user_id=user_id, basket_id=basket_pk,
+                    billing_address_id=address_id,
+                    shipping_address_id=address_id,
+                    status=models.Order.NEW if date > recent
+                    else models.Order.DONE,
+                    subtotal=sum(price * q for _, _, price, q in chosen),
+                    item_count=sum(q for _, _, _, q in chosen),
+                    summary=models.Order.summarize(
+                        (q, name) for _, name, _, q in chosen),
+                    date_added=date, date_updated=date))
+                basket_pk += 1
+                order_pk += 1
+            models.Basket.objects.bulk_create(baskets)
+            models.BasketLine.objects.bulk_create(lines)
+            models.Order.objects.bulk_create(orders)
+            models.OrderItem.objects.bulk_create(items)
+            items_created += len(items)
+        self.stdout.write(
+            "Orders created=%d (items=%d)" % (count, items_created))
+
+    def seed_baskets(self, count, products, users):
+        """
+            Open baskets of the last week, half of them anonymous
+        """
+        product_zipf = Zipf(self.rng, len(products), self.zipf)
+        basket_pk = next_pk(models.Basket)
+        recent = self.end - timedelta(days=7)
+        for start in range(0, count, self.batch_size):
+            baskets, lines = [], []
+            for _ in range(start, min(start + self.batch_size, count)):
+                date = self.random_date(max(recent, self.start))
+                user_id = None
+                if self.rng.random() < 0.5:
+                    user_id = self.rng.choice(users)[0]
+                baskets.append(models.Basket(
+                    pk=basket_pk, user_id=user_id, date_added=date,
+                    date_updated=date))
+                for offset in product_zipf.distinct(self.rng.randint(1, 3)):
+                    lines.append(models.BasketLine(
+                        basket_id=basket_pk, product_id=products[offset][0],
+                        quantity=self.rng.choice((1, 1, 2))))
+                basket_pk += 1
+            models.Basket.objects.bulk_create(baskets)
+            models.BasketLine.objects.bulk_create(lines)
+        self.stdout.write("Baskets created=%d" % count)
+
+    def sentence(self, words):
+        return " ".join(self.rng.choices(WORDS, k=words)).capitalize() + "."
+
+    def reset_sequences(self):
+        # rows were written with explicit pks, as loaddata does
+        statements = connection.ops.sequence_reset_sql(no_style(), [
+            models.ProductTag, models.Product, models.ProductImage,
+            models.User, models.Address, models.OrderAddress,
+            models.Basket, models.BasketLine, models.Order,
+            models.OrderItem,
+        ])
+        with connection.cursor() as cursor:
+            for statement in statements:
+                cursor.execute(statement)
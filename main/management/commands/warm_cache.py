@@ -0,0 +1,144 @@
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+import math
+import threading
+import time
+from urllib.error import HTTPError, URLError
+from urllib.request import Request, urlopen
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connections
+from django.db.models import Count, Q, Sum
+from django.test import Client
+from django.urls import reverse
+from django.utils import timezone
+from main import models, pagecache
+from main.models.user import SUPPORTED_COUNTRIES
+from main.views import ProductListView
+
+
+def is_process_local():
+    """
+        Whether the cache lives in the memory of each process, where
+    pages rendered by this command would not be seen by the server
+    """
+    return isinstance(caches["default"], (LocMemCache, DummyCache))
+
+
+class Command(BaseCommand):
+    help = 'Render the most visited storefront pages into the page cache'
+
+    def add_arguments(self, parser):
+        parser.add_argument("--tags", type=int, default=20,
+                            help="Tags with the most products")
+        parser.add_argument("--pages", type=int, default=3,
+                            help="List pages of every tag")
+        parser.add_argument("--products", type=int, default=200,
+                            help="Products ordered the most lately")
+        parser.add_argument("--days", type=int, default=30)
+        parser.add_argument("--threads", type=int, default=8)
+        parser.add_argument("--url",
+                            help="Warm a running server over HTTP, "
+                                 "required when the cache is local to "
+                                 "its processes (locmem)")
+
+    def handle(self, *args, **options):
+        if not options["url"] and is_process_local():
+            raise CommandError(
+                "The cache is local to every process, warm the running "
+                "server with --url")
+        paths = self.paths(options)
+        countries = [code for code, name in SUPPORTED_COUNTRIES]
+        jobs = [(path, country) for path in paths for country in countries]
+        if options["url"]:
+            fetch = self.fetch_url(options["url"].rstrip("/"))
+        else:
+            fetch = self.fetch_local()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["threads"]) as executor:
+            statuses = list(executor.map(lambda job: fetch(*job), jobs))
+        failed = sum(1 for status in statuses if status != 200)
+        self.stdout.write(
+            "Pages warmed=%d (failed=%d) in %.1f s" % (
+                len(jobs) - failed, failed, time.perf_counter() - started)
+        )
+
+    def paths(self, options):
+        """
+            Home, the list pages of all products and of the top tags,
+        then the product pages, most ordered first
+        """
+        paths = [reverse("home")]
+        counts = dict(
+            models.ProductTag.objects.filter(active=True).annotate(
+                products=Count("product", filter=Q(product__active=True)))
+            .filter(products__gt=0).order_by("-products", "pk")
+            .values_list("slug", "products")[:options["tags"]])
+        counts["all"] = models.Product.objects.active().count()
+        tags = ["all"] + [tag for tag in counts if tag != "all"]
+        for tag in tags:
+            url = reverse("products", kwargs={"tag": tag})
+            pages = math.ceil(counts[tag] / ProductListView.paginate_by)
+            paths.append(url)
+            for page in range(2, min(pages, options["pages"]) + 1):
+                paths.append("%s?page=%d" % (url, page))
+
+        since = timezone.now() - timedelta(days=options["days"])
+        slugs = list(
+            models.Product.objects.active().filter(
+                orderitem__order__date_added__gte=since)
+            .annotate(ordered=Sum("orderitem__quantity"))
+            .order_by("-ordered", "pk").values_list("slug", flat=True)
+            [:options["products"]])
+        if len(slugs) < options["products"]:
+            # too few orders, the newest products make up the rest
+            slugs += list(
+                models.Product.objects.active().exclude(slug__in=slugs)
+                .order_by("-date_updated").values_list("slug", flat=True)
+                [:options["products"] - len(slugs)])
+        paths.extend(
+            reverse("product", kwargs={"slug": slug}) for slug in slugs)
+        return paths
+
+    def fetch_local(self):
+        """
+            Requests through the whole stack of this process, which
+        fills the cache every server process shares (memcached, redis)
+        """
+        host = next(
+            (host.lstrip(".") for host in settings.ALLOWED_HOSTS
+             if host != "*"), "localhost")
+        local = threading.local()
+
+        def fetch(path, country):
+            if not hasattr(local, "client"):
+                local.client = Client(HTTP_HOST=host)
+            try:
+                local.client.cookies.clear()
+                local.client.cookies[pagecache.COUNTRY_COOKIE] = country
+                return local.client.get(path).status_code
+            except Exception as e:
+                # one broken page does not stop the warm-up
+                self.stderr.write("%s (%s) failed: %r" % (path, country, e))
+                return None
+            finally:
+                connections.close_all()
+        return fetch
+
+    def fetch_url(self, base_url):
+        def fetch(path, country):
+            request = Request(base_url + path, headers={
+                "Cookie": "%s=%s" % (pagecache.COUNTRY_COOKIE, country)})
+            try:
+                with urlopen(request, timeout=30) as response:
+                    response.read()
+                    return response.status
+            except HTTPError as e:
+                return e.code
+            except (URLError, OSError):
+                return None
+        return fetch
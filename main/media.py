@@ -0,0 +1,182 @@
+"""
+    Media files (product images and thumbnails) served by Django
+
+Full files go through FileResponse, so the WSGI server's file wrapper
+can use os.sendfile(). Conditional (ETag, If-Modified-Since) and single
+byte range requests are answered here. Behind a local proxy, set
+MEDIA_SENDFILE_HEADER and the proxy sends the file itself.
+"""
+import mimetypes
+import os
+import posixpath
+import re
+import stat as stat_module
+from urllib.parse import quote
+
+from django.conf import settings
+from django.core.exceptions import SuspiciousFileOperation
+from django.http import (FileResponse, Http404, HttpResponse,
+                         HttpResponseNotModified)
+from django.utils._os import safe_join
+from django.utils.cache import patch_cache_control
+from django.utils.http import http_date
+from django.views.decorators.http import require_safe
+from django.views.static import was_modified_since
+
+from .storage import ContentAddressedStorage
+
+BLOB_RE = re.compile(
+    r"^%s/[0-9a-f]{2}/(?P<digest>[0-9a-f]{64})(\.\w+)?$"
+    % ContentAddressedStorage.prefix
+)
+RANGE_RE = re.compile(r"^bytes=(?P<start>\d*)-(?P<end>\d*)$")
+IMMUTABLE_MAX_AGE = 365 * 24 * 60 * 60
+
+
+class FileRange:
+    """
+        At most length bytes of file, starting at offset. fileno()
+    is kept so that sendfile() based wrappers, which stop at the
+    Content-Length, still work.
+    """
+
+    def __init__(self, file, offset, length):
+        file.seek(offset)
+        self.file = file
+        self.remaining = length
+
+    def read(self, size=-1):
+        if size < 0 or size > self.remaining:
+            size = self.remaining
+        data = self.file.read(size)
+        self.remaining -= len(data)
+        return data
+
+    def fileno(self):
+        return self.file.fileno()
+
+    def close(self):
+        self.file.close()
+
+
+def etag_for(blob, stat):
+    if blob:
+        # the name of a content addressed blob is its checksum
+        return '"%s"' % blob.group("digest")
+    return '"%x-%x"' % (int(stat.st_mtime), stat.st_size)
+
+
+def etag_matches(header, etag):
+    if header.strip() == "*":
+        return True
+    # weak comparison, as required for If-None-Match
+    tags = (tag.strip() for tag in header.split(","))
+    return etag in (tag[2:] if tag.startswith("W/") else tag for tag in tags)
+
+
+def parse_range(header, size):
+    """
+        (start, end) of a single byte range, inclusive. None when the
+    whole file must be sent, ValueError when it cannot be satisfied.
+    """
+    match = RANGE_RE.match(header.replace(" ", ""))
+    if match is None:
+        # malformed or several ranges, both may be ignored
+        return None
+    start, end = match.group("start"), match.group("end")
+    if not start:
+        if not end:
+            return None
+        start, end = max(size - int(end), 0), size - 1
+    else:
+        start = int(start)
+        end = min(int(end), size - 1) if end else size - 1
+    if start >= size or start > end:
+        raise ValueError(header)
+    return start, end
+
+
+def sendfile_response(path, full_path):
+    header = settings.MEDIA_SENDFILE_HEADER
+    response = HttpResponse()
+    if header == "X-Accel-Redirect":
+        response[header] = settings.MEDIA_ACCEL_PREFIX + quote(path)
+    else:
+        response[header] = full_path
+    # let the proxy set it from the file
+    del response["Content-Type"]
+    return response
+
+
+def file_response(request, full_path, stat, etag):
+    content_type, encoding = mimetypes.guess_type(full_path)
+    content_type = content_type or "application/octet-stream"
+    size = stat.st_size
+
+    byte_range = None
+    range_header = request.META.get("HTTP_RANGE")
+    if_range = request.META.get("HTTP_IF_RANGE")
+    if range_header and (if_range is None or if_range == etag):
+        try:
+            byte_range = parse_range(range_header, size)
+        except ValueError:
+            response = HttpResponse(status=416)
+            response["Content-Range"] = "bytes */%d" % size
+            return response
+
+    file = open(full_path, "rb")
+    if byte_range is None:
+        response = FileResponse(file, content_type=content_type)
+        response["Content-Length"] = size
+    else:
+        start, end = byte_range
+        response = FileResponse(
+            FileRange(file, start, end - start + 1),
+            content_type=content_type, status=206)
+        response["Content-Length"] = end - start + 1
+        response["Content-Range"] = "bytes %d-%d/%d" % (start, end, size)
+    response["Accept-Ranges"] = "bytes"
+    if encoding:
+        response["Content-Encoding"] = encoding
+    return response
+
+
+@require_safe
+def serve(request, path):
+    path = posixpath.normpath(path).lstrip("/")
+    try:
+        full_path = safe_join(settings.MEDIA_ROOT, path)
+    except SuspiciousFileOperation:
+        raise Http404("Invalid path")
+    try:
+        stat = os.stat(full_path)
+    except (FileNotFoundError, NotADirectoryError):
+        raise Http404("No such file")
+    if not stat_module.S_ISREG(stat.st_mode):
+        raise Http404("No such file")
+
+    blob = BLOB_RE.match(path)
+    etag = etag_for(blob, stat)
+    if_none_match = request.META.get("HTTP_IF_NONE_MATCH")
+    if if_none_match is not None:
+        not_modified = etag_matches(if_none_match, etag)
+    else:
+        not_modified = not was_modified_since(
+            request.META.get("HTTP_IF_MODIFIED_SINCE"),
+            stat.st_mtime, stat.st_size)
+    if not_modified:
+        response = HttpResponseNotModified()
+    elif settings.MEDIA_SENDFILE_HEADER:
+        response = sendfile_response(path, full_path)
+    else:
+        response = file_response(request, full_path, stat, etag)
+
+    response["ETag"] = etag
+    response["Last-Modified"] = http_date(stat.st_mtime)
+    if blob:
+        patch_cache_control(
+            response, public=True, max_age=IMMUTABLE_MAX_AGE, immutable=True)
+    else:
+        patch_cache_control(
+            response, public=True, max_age=settings.MEDIA_MAX_AGE)
+    return response
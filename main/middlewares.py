@@ -3,12 +3,14 @@ from . import models
 
 def basket_middleware(get_response):
     def middleware(request):
+        request.basket = None
         if 'basket_id' in request.session:
             basket_id = request.session['basket_id']
-            basket = models.Basket.objects.get(pk=basket_id)
-            request.basket = basket
-        else:
-            request.basket = None
+            request.basket = models.Basket.objects.filter(
+                pk=basket_id).first()
+            if request.basket is None:
+                # the basket was swept by the clean_baskets command
+                del request.session['basket_id']
         response = get_response(request)
         return response
 
@@ -0,0 +1,33 @@
+# Generated by Django 2.2.28 on 2026-10-19 11:27
+
+from django.db import migrations
+from django.db.models import Count, Min, Sum
+
+
+def merge_duplicate_lines(apps, schema_editor):
+    BasketLine = apps.get_model("main", "BasketLine")
+    duplicates = (
+        BasketLine.objects.values("basket", "product")
+        .annotate(n=Count("id"), keep=Min("id"), total=Sum("quantity"))
+        .filter(n__gt=1)
+    )
+    for dup in duplicates:
+        lines = BasketLine.objects.filter(
+            basket=dup["basket"], product=dup["product"])
+        lines.filter(id=dup["keep"]).update(quantity=dup["total"])
+        lines.exclude(id=dup["keep"]).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0004_auto_20230428_1921'),
+    ]
+
+    operations = [
+        migrations.RunPython(merge_duplicate_lines, migrations.RunPython.noop),
+        migrations.AlterUniqueTogether(
+            name='basketline',
+            unique_together={('basket', 'product')},
+        ),
+    ]
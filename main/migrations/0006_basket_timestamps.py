@@ -0,0 +1,31 @@
+# Generated by Django 2.2.28 on 2026-10-19 11:40
+
+from django.db import migrations, models
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0005_basketline_unique'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='basket',
+            name='date_added',
+            field=models.DateTimeField(
+                auto_now_add=True, default=django.utils.timezone.now),
+            preserve_default=False,
+        ),
+        migrations.AddField(
+            model_name='basket',
+            name='date_updated',
+            field=models.DateTimeField(auto_now=True),
+        ),
+        migrations.AddIndex(
+            model_name='basket',
+            index=models.Index(fields=['status', 'date_updated'],
+                               name='main_basket_status_5e8504_idx'),
+        ),
+    ]
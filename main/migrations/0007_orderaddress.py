@@ -0,0 +1,48 @@
+# Generated by Django 2.2.28 on 2026-10-19 12:05
+
+from django.db import migrations, models
+import django.core.validators
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0006_basket_timestamps'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='OrderAddress',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('digest', models.CharField(editable=False, max_length=64, unique=True)),
+                ('name', models.CharField(max_length=60)),
+                ('address1', models.CharField(max_length=60)),
+                ('address2', models.CharField(blank=True, max_length=60, null=True)),
+                ('zip_code', models.CharField(max_length=12)),
+                ('city', models.CharField(max_length=60)),
+                ('country', models.CharField(max_length=3)),
+            ],
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='billing_address',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='main.OrderAddress'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='shipping_address',
+            field=models.ForeignKey(null=True, on_delete=django.db.models.deletion.PROTECT, related_name='+', to='main.OrderAddress'),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='quantity',
+            field=models.PositiveIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1)]),
+        ),
+        migrations.AddField(
+            model_name='orderitem',
+            name='unit_price',
+            field=models.DecimalField(decimal_places=2, max_digits=6, null=True),
+        ),
+    ]
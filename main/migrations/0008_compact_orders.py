@@ -0,0 +1,86 @@
+import hashlib
+
+from django.db import migrations
+from django.db.models import Count, Min
+
+BATCH_SIZE = 500
+ADDRESS_FIELDS = ("name", "address1", "address2", "zip_code", "city",
+                  "country")
+
+
+def make_digest(fields):
+    # kept in sync with OrderAddress.make_digest
+    raw = "\x1f".join(fields.get(name) or "" for name in ADDRESS_FIELDS)
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def snapshot_addresses(apps, schema_editor):
+    Order = apps.get_model("main", "Order")
+    OrderAddress = apps.get_model("main", "OrderAddress")
+    snapshots = {}
+
+    def snapshot(order, prefix):
+        fields = {
+            name: getattr(order, prefix + name) for name in ADDRESS_FIELDS
+        }
+        digest = make_digest(fields)
+        if digest not in snapshots:
+            snapshots[digest], _ = OrderAddress.objects.get_or_create(
+                digest=digest, defaults=fields)
+        return snapshots[digest]
+
+    last_pk = 0
+    while True:
+        batch = list(
+            Order.objects.filter(pk__gt=last_pk).order_by("pk")[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+        for order in batch:
+            order.billing_address = snapshot(order, "billing_")
+            order.shipping_address = snapshot(order, "shipping_")
+        Order.objects.bulk_update(
+            batch, ["billing_address", "shipping_address"])
+        last_pk = batch[-1].pk
+
+
+def collapse_items(apps, schema_editor):
+    OrderItem = apps.get_model("main", "OrderItem")
+    duplicates = (
+        OrderItem.objects.values("order", "product")
+        .annotate(n=Count("id"), keep=Min("id"))
+        .filter(n__gt=1)
+        .order_by()
+    )
+    for dup in duplicates.iterator():
+        items = OrderItem.objects.filter(
+            order=dup["order"], product=dup["product"])
+        items.filter(pk=dup["keep"]).update(quantity=dup["n"])
+        items.exclude(pk=dup["keep"]).delete()
+
+    # the price paid was never stored, the current price is the best
+    # figure available for historic items
+    last_pk = 0
+    while True:
+        batch = list(
+            OrderItem.objects.filter(pk__gt=last_pk, unit_price__isnull=True)
+            .select_related("product").order_by("pk")[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+        for item in batch:
+            item.unit_price = item.product.price
+        OrderItem.objects.bulk_update(batch, ["unit_price"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0007_orderaddress'),
+    ]
+
+    operations = [
+        migrations.RunPython(snapshot_addresses, migrations.RunPython.noop),
+        migrations.RunPython(collapse_items, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,45 @@
+# Generated by Django 2.2.28 on 2026-10-19 12:10
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0008_compact_orders'),
+    ]
+
+    operations = [
+        migrations.RemoveField(model_name='order', name='billing_name'),
+        migrations.RemoveField(model_name='order', name='billing_address1'),
+        migrations.RemoveField(model_name='order', name='billing_address2'),
+        migrations.RemoveField(model_name='order', name='billing_zip_code'),
+        migrations.RemoveField(model_name='order', name='billing_city'),
+        migrations.RemoveField(model_name='order', name='billing_country'),
+        migrations.RemoveField(model_name='order', name='shipping_name'),
+        migrations.RemoveField(model_name='order', name='shipping_address1'),
+        migrations.RemoveField(model_name='order', name='shipping_address2'),
+        migrations.RemoveField(model_name='order', name='shipping_zip_code'),
+        migrations.RemoveField(model_name='order', name='shipping_city'),
+        migrations.RemoveField(model_name='order', name='shipping_country'),
+        migrations.AlterField(
+            model_name='order',
+            name='billing_address',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='main.OrderAddress'),
+        ),
+        migrations.AlterField(
+            model_name='order',
+            name='shipping_address',
+            field=models.ForeignKey(on_delete=django.db.models.deletion.PROTECT, related_name='+', to='main.OrderAddress'),
+        ),
+        migrations.AlterField(
+            model_name='orderitem',
+            name='unit_price',
+            field=models.DecimalField(decimal_places=2, max_digits=6),
+        ),
+        migrations.AlterUniqueTogether(
+            name='orderitem',
+            unique_together={('order', 'product')},
+        ),
+    ]
@@ -0,0 +1,56 @@
+# Generated by Django 2.2.28 on 2026-10-19 12:30
+
+from django.db import migrations, models
+from django.db.models import DecimalField, F, Sum
+
+BATCH_SIZE = 500
+
+
+def compute_totals(apps, schema_editor):
+    Order = apps.get_model("main", "Order")
+    OrderItem = apps.get_model("main", "OrderItem")
+    last_pk = 0
+    while True:
+        batch = list(
+            Order.objects.filter(pk__gt=last_pk).order_by("pk")[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+        totals = {
+            row["order"]: row
+            for row in OrderItem.objects.filter(order__in=batch)
+            .values("order")
+            .annotate(
+                subtotal=Sum(F("unit_price") * F("quantity"),
+                             output_field=DecimalField()),
+                item_count=Sum("quantity"),
+            )
+            .order_by()
+        }
+        for order in batch:
+            row = totals.get(order.pk, {})
+            order.subtotal = row.get("subtotal") or 0
+            order.item_count = row.get("item_count") or 0
+        Order.objects.bulk_update(batch, ["subtotal", "item_count"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0009_remove_order_address_columns'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='item_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='subtotal',
+            field=models.DecimalField(decimal_places=2, default=0, max_digits=10),
+        ),
+        migrations.RunPython(compute_totals, migrations.RunPython.noop),
+    ]
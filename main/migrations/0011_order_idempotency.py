@@ -0,0 +1,24 @@
+# Generated by Django 2.2.28 on 2026-10-19 11:35
+
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0010_order_totals'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='basket',
+            field=models.OneToOneField(blank=True, editable=False, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='order', to='main.Basket'),
+        ),
+        migrations.AddField(
+            model_name='order',
+            name='idempotency_key',
+            field=models.UUIDField(blank=True, editable=False, null=True, unique=True),
+        ),
+    ]
@@ -0,0 +1,50 @@
+# Generated by Django 2.2.28 on 2026-10-19 11:36
+
+from collections import defaultdict
+
+from django.db import migrations, models
+from django.utils.text import Truncator
+
+BATCH_SIZE = 500
+
+
+def summarize_orders(apps, schema_editor):
+    Order = apps.get_model("main", "Order")
+    OrderItem = apps.get_model("main", "OrderItem")
+    last_pk = 0
+    while True:
+        batch = list(
+            Order.objects.filter(pk__gt=last_pk).order_by("pk")[:BATCH_SIZE]
+        )
+        if not batch:
+            break
+        items = defaultdict(list)
+        for order_id, quantity, name in (
+            OrderItem.objects.filter(order__in=batch).order_by("pk")
+            .values_list("order", "quantity", "product__name")
+        ):
+            items[order_id].append("%d x %s" % (quantity, name))
+        for order in batch:
+            order.summary = Truncator(", ".join(items[order.pk])).chars(255)
+        Order.objects.bulk_update(batch, ["summary"])
+        last_pk = batch[-1].pk
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0011_order_idempotency'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='order',
+            name='summary',
+            field=models.CharField(blank=True, max_length=255),
+        ),
+        migrations.RunPython(summarize_orders, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name='order',
+            index=models.Index(fields=['user', '-date_added', '-id'], name='main_order_user_id_047da3_idx'),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 2.2.28 on 2026-10-19 11:40
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0012_order_history'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AuthEvent',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.IntegerField(choices=[(10, 'Signup'), (20, 'Login')])),
+                ('platform', models.CharField(blank=True, max_length=32)),
+                ('mobile', models.BooleanField(default=False)),
+                ('user_agent', models.CharField(blank=True, max_length=200)),
+                ('referrer', models.CharField(blank=True, max_length=200)),
+                ('date_added', models.DateTimeField(db_index=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, to=settings.AUTH_USER_MODEL)),
+            ],
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 2.2.28 on 2026-10-19 11:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0014_mediablob'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='producttag',
+            name='date_updated',
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,28 @@
+# Generated by Django 2.2.28 on 2026-10-19 11:54
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0015_producttag_date_updated'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CatalogueChange',
+            fields=[
+                ('id', models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('kind', models.IntegerField(choices=[(10, 'Product'), (20, 'Tag')])),
+                ('object_id', models.IntegerField()),
+                ('action', models.IntegerField(choices=[(10, 'Updated'), (20, 'Deleted')], default=10)),
+                ('date_added', models.DateTimeField(auto_now_add=True, db_index=True)),
+            ],
+        ),
+        migrations.AlterField(
+            model_name='product',
+            name='date_updated',
+            field=models.DateTimeField(auto_now=True, db_index=True),
+        ),
+    ]
@@ -0,0 +1,42 @@
+# Generated by Django 2.2.28 on 2026-10-19 11:58
+
+from django.db import migrations, models
+from django.utils.text import slugify
+
+
+def deduplicate_slugs(apps, schema_editor):
+    # blank slugs get one from the name, repeated ones the pk as suffix
+    for model_name in ("Product", "ProductTag"):
+        Model = apps.get_model("main", model_name)
+        seen = set()
+        changed = []
+        for obj in Model.objects.order_by("pk").only("pk", "name", "slug"):
+            slug = obj.slug or slugify(obj.name)[:40] or "item"
+            if slug in seen:
+                slug = "%s-%d" % (slug[:40], obj.pk)
+            seen.add(slug)
+            if slug != obj.slug:
+                obj.slug = slug
+                changed.append(obj)
+        Model.objects.bulk_update(changed, ["slug"], batch_size=500)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0016_catalogue_change'),
+    ]
+
+    operations = [
+        migrations.RunPython(deduplicate_slugs, migrations.RunPython.noop),
+        migrations.AlterField(
+            model_name='product',
+            name='slug',
+            field=models.SlugField(max_length=48, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='producttag',
+            name='slug',
+            field=models.SlugField(max_length=48, unique=True),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 2.2.28 on 2026-10-19 12:42
+
+import django.core.validators
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('main', '0017_unique_slugs'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='basketline',
+            name='quantity',
+            field=models.PositiveIntegerField(default=1, validators=[django.core.validators.MinValueValidator(1), django.core.validators.MaxValueValidator(10)]),
+        ),
+    ]
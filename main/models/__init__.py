@@ -1,3 +1,6 @@
 from .user import (User, Address)
-from .store import (Product, ProductImage, ProductTag,
-                    Basket, BasketLine, Order, OrderItem)
+from .store import (Product, ProductImage, ProductTag, CatalogueChange,
+                    Basket, BasketException, BasketLine,
+                    Order, OrderAddress, OrderItem)
+from .analytics import AuthEvent
+from .media import MediaBlob
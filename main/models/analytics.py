@@ -0,0 +1,26 @@
+from django.db import models
+from . import User
+
+
+class AuthEvent(models.Model):
+    """
+        A signup or login, written in bulk by main.analytics
+    """
+    SIGNUP = 10
+    LOGIN = 20
+    KINDS = [
+        (SIGNUP, "Signup"),
+        (LOGIN, "Login"),
+    ]
+
+    kind = models.IntegerField(choices=KINDS)
+    user = models.ForeignKey(
+        User, on_delete=models.SET_NULL, blank=True, null=True)
+    platform = models.CharField(max_length=32, blank=True)
+    mobile = models.BooleanField(default=False)
+    user_agent = models.CharField(max_length=200, blank=True)
+    referrer = models.CharField(max_length=200, blank=True)
+    date_added = models.DateTimeField(db_index=True)
+
+    def __str__(self):
+        return "%s %s" % (self.get_kind_display(), self.date_added)
@@ -0,0 +1,45 @@
+from collections import Counter, defaultdict
+from django.db import models
+from django.db.models import F
+
+
+class MediaBlobManager(models.Manager):
+
+    def adjust(self, names, delta, batch_size=500):
+        """
+            Add delta to the reference count of every stored name,
+        names missing from the table (files kept by another storage)
+        are ignored.
+        """
+        by_count = defaultdict(list)
+        for name, count in Counter(n for n in names if n).items():
+            by_count[count].append(name)
+        for count, group in by_count.items():
+            for start in range(0, len(group), batch_size):
+                blobs = self.filter(name__in=group[start:start + batch_size])
+                if delta < 0:
+                    blobs = blobs.filter(refcount__gte=count * -delta)
+                blobs.update(refcount=F("refcount") + count * delta)
+
+
+class MediaBlob(models.Model):
+    """
+        A file of main.storage.ContentAddressedStorage, stored once
+    under the SHA-256 of its content. refcount is the number of file
+    fields pointing at it, gc_media deletes the blobs nobody uses.
+    """
+    name = models.CharField(max_length=100, unique=True)
+    digest = models.CharField(max_length=64, db_index=True)
+    size = models.PositiveIntegerField()
+    refcount = models.PositiveIntegerField(default=0)
+    date_added = models.DateTimeField(auto_now_add=True)
+    # set again every time an upload is deduplicated to this blob
+    date_updated = models.DateTimeField(auto_now=True)
+
+    objects = MediaBlobManager()
+
+    class Meta:
+        indexes = [models.Index(fields=["refcount", "date_updated"])]
+
+    def __str__(self):
+        return self.name
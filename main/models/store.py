@@ -1,7 +1,12 @@
+import hashlib
 import logging
-from django.db import models
+from django.db import IntegrityError, models, transaction
+from django.db.models import Count, DecimalField, F, Sum
+from django.db.models.functions import Coalesce, Least
 from django.core import exceptions
-from django.core.validators import MinValueValidator
+from django.utils import timezone
+from django.utils.text import Truncator
+from django.core.validators import MaxValueValidator, MinValueValidator
 from . import User
 
 
@@ -13,6 +18,9 @@ class ActiveManager(models.Manager):
 
         return super().filter(active=True)
 
+    def get_by_natural_key(self, slug):
+        return self.get(slug=slug)
+
 
 class ProductTagManager(models.Manager):
 
@@ -24,10 +32,10 @@ class Product(models.Model):
     name = models.CharField(max_length=32)
     description = models.TextField(blank=True)
     price = models.DecimalField(max_digits=6, decimal_places=2)
-    slug = models.SlugField(max_length=48)
+    slug = models.SlugField(max_length=48, unique=True)
     active = models.BooleanField(default=True)
     in_stock = models.BooleanField(default=True)
-    date_updated = models.DateTimeField(auto_now=True)
+    date_updated = models.DateTimeField(auto_now=True, db_index=True)
 
     tags = models.ManyToManyField('ProductTag')
     objects = ActiveManager()
@@ -35,6 +43,9 @@ class Product(models.Model):
     def __str__(self) -> str:
         return self.name
 
+    def natural_key(self):
+        return (self.slug,)
+
 
 class ProductImage(models.Model):
     product = models.ForeignKey(
@@ -48,9 +59,10 @@ class ProductImage(models.Model):
 
 class ProductTag(models.Model):
     name = models.CharField(max_length=32)
-    slug = models.SlugField(max_length=48)
+    slug = models.SlugField(max_length=48, unique=True)
     description = models.TextField(blank=True)
     active = models.BooleanField(default=True)
+    date_updated = models.DateTimeField(auto_now=True)
 
     objects = ProductTagManager()
 
@@ -61,6 +73,53 @@ class ProductTag(models.Model):
         return (self.slug,)
 
 
+class CatalogueChangeManager(models.Manager):
+
+    def record(self, kind, ids, action=None):
+        self.bulk_create([
+            self.model(kind=kind, object_id=object_id,
+                       action=action or self.model.UPDATED)
+            for object_id in ids
+        ])
+
+
+class CatalogueChange(models.Model):
+    """
+        Append-only log of catalogue changes, written by main.signals.
+    The primary key is the cursor of the change feed (main.changes).
+    Images and tag links are part of their product, so their changes
+    are logged as product updates.
+    """
+    PRODUCT = 10
+    TAG = 20
+    KINDS = [
+        (PRODUCT, "Product"),
+        (TAG, "Tag"),
+    ]
+    UPDATED = 10
+    DELETED = 20
+    ACTIONS = [
+        (UPDATED, "Updated"),
+        (DELETED, "Deleted"),
+    ]
+
+    kind = models.IntegerField(choices=KINDS)
+    object_id = models.IntegerField()
+    action = models.IntegerField(choices=ACTIONS, default=UPDATED)
+    date_added = models.DateTimeField(auto_now_add=True, db_index=True)
+
+    objects = CatalogueChangeManager()
+
+    def __str__(self):
+        return "%s %s %d" % (
+            self.get_action_display(), self.get_kind_display(),
+            self.object_id)
+
+
+class BasketException(Exception):
+    pass
+
+
 class Basket(models.Model):
     OPEN = 10
     SUBMITTED = 20
@@ -71,80 +130,216 @@ class Basket(models.Model):
     user = models.ForeignKey(
         User, on_delete=models.CASCADE, blank=True, null=True)
     status = models.IntegerField(choices=STATUSES, default=OPEN)
+    date_updated = models.DateTimeField(auto_now=True)
+    date_added = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [models.Index(fields=["status", "date_updated"])]
 
     def __str__(self):
         return str(self.pk)
 
+    def touch(self):
+        Basket.objects.filter(pk=self.pk).update(date_updated=timezone.now())
+
     def is_empty(self):
         return self.basketline_set.all().count() == 0
 
     def count(self):
-        return sum([i.quantity for i in self.basketline_set.all()])
+        return self.totals()["items"]
+
+    def totals(self):
+        # one aggregate query instead of loading every line and product
+        return self.basketline_set.aggregate(
+            lines=Count("id"),
+            items=Coalesce(Sum("quantity"), 0),
+            total=Coalesce(
+                Sum(
+                    F("quantity") * F("product__price"),
+                    output_field=DecimalField(max_digits=10, decimal_places=2)
+                ),
+                0,
+                output_field=DecimalField(max_digits=10, decimal_places=2)
+            ),
+        )
 
-    def create_order(self, billing_address, shipping_address):
+    def add_product(self, product_id, quantity=1):
+        """
+            Upsert a line for the product, incrementing in SQL so
+        concurrent adds never lose an update. The quantity of the
+        line is capped at BasketLine.MAX_QUANTITY.
+        """
+        quantity = min(quantity, BasketLine.MAX_QUANTITY)
+        added = Least(F("quantity") + quantity, BasketLine.MAX_QUANTITY)
+        lines = self.basketline_set.filter(product_id=product_id)
+        with transaction.atomic():
+            self.touch()
+            if lines.update(quantity=added):
+                return
+            try:
+                with transaction.atomic():
+                    BasketLine.objects.create(
+                        basket=self, product_id=product_id, quantity=quantity
+                    )
+            except IntegrityError:
+                # another request inserted the line first
+                lines.update(quantity=added)
+
+    def create_order(self, billing_address, shipping_address,
+                     idempotency_key=None):
+        """
+            Turn the basket into an order exactly once, a repeated
+        submit (same basket or same idempotency key) returns the
+        order created by the first one
+        """
         if not self.user:
-            raise exceptions.BasketExceptions(
+            raise BasketException(
                 "Cannot create order without user."
             )
         logger.info(
-            logger.info(
-                "Creating order for basket_id=%d"
-                ", shipping_address_id=%d, billing_address_id=%d",
-                self.id,
-                shipping_address.id,
-                billing_address.id,
-            )
+            "Creating order for basket_id=%d"
+            ", shipping_address_id=%d, billing_address_id=%d",
+            self.id,
+            shipping_address.id,
+            billing_address.id,
         )
 
-        order_data = {
-            "user": self.user,
-            "billing_name": billing_address.name,
-            "billing_address1": billing_address.address1,
-            "billing_address2": billing_address.address2,
-            "billing_zip_code": billing_address.zip_code,
-            "billing_city": billing_address.city,
-            "billing_country": billing_address.country,
-            "shipping_name": shipping_address.name,
-            "shipping_address1": shipping_address.address1,
-            "shipping_address2": shipping_address.address2,
-            "shipping_zip_code": shipping_address.zip_code,
-            "shipping_city": shipping_address.city,
-            "shipping_country": shipping_address.country
-        }
-
-        order = Order.objects.create(**order_data)
-        counter = 0
-        for line in self.basketline_set.all():
-            for item in range(line.quantity):
-                order_item_data = {
-                    "order": order,
-                    "product": line.product,
-                }
-                order_item = OrderItem.objects.create(
-                    **order_item_data
+        with transaction.atomic():
+            # claiming the basket is the first statement: on SQLite a
+            # transaction that read first cannot wait for the write
+            # lock, it fails at once if another submit committed
+            claimed = Basket.objects.filter(
+                pk=self.pk, status=Basket.OPEN
+            ).update(status=Basket.SUBMITTED, date_updated=timezone.now())
+            order = None
+            if idempotency_key:
+                order = Order.objects.filter(
+                    user=self.user, idempotency_key=idempotency_key
+                ).first()
+            if order is None and not claimed:
+                order = Order.objects.filter(basket=self).first()
+                if order is None:
+                    raise BasketException(
+                        "Basket %d is not open." % self.id
+                    )
+            if order is not None:
+                if claimed:
+                    # the key was used for another basket, this one
+                    # stays open
+                    transaction.set_rollback(True)
+                else:
+                    self.status = Basket.SUBMITTED
+                logger.info(
+                    "Order id=%d already created for this submit",
+                    order.id
+                )
+                return order
+            self.status = Basket.SUBMITTED
+
+            billing = OrderAddress.objects.snapshot(billing_address)
+            if shipping_address.pk == billing_address.pk:
+                shipping = billing
+            else:
+                shipping = OrderAddress.objects.snapshot(shipping_address)
+            # lines are already unique per product, so each becomes
+            # a single item carrying its quantity and the price paid
+            items = [
+                OrderItem(
+                    product=line.product,
+                    quantity=line.quantity,
+                    unit_price=line.product.price,
                 )
-                counter += 1
+                for line in self.basketline_set.select_related("product")
+            ]
+            order = Order.objects.create(
+                user=self.user,
+                basket=self,
+                idempotency_key=idempotency_key,
+                billing_address=billing,
+                shipping_address=shipping,
+                subtotal=sum(i.unit_price * i.quantity for i in items),
+                item_count=sum(i.quantity for i in items),
+                summary=Order.summarize(
+                    (i.quantity, i.product.name) for i in items),
+            )
+            for item in items:
+                item.order = order
+            OrderItem.objects.bulk_create(items)
         logger.info(
-            "Created order with id=%d and lines_count=%d", order.id, counter
+            "Created order with id=%d and lines_count=%d",
+            order.id, len(items)
         )
-
-        self.status = Basket.SUBMITTED
-        self.save()
         return order
 
 
 class BasketLine(models.Model):
+    # the most units of a product one basket can hold
+    MAX_QUANTITY = 10
+
     basket = models.ForeignKey(Basket, on_delete=models.CASCADE)
     product = models.ForeignKey(Product, on_delete=models.CASCADE)
 
     quantity = models.PositiveIntegerField(
-        default=1, validators=[MinValueValidator(1)]
+        default=1,
+        validators=[MinValueValidator(1), MaxValueValidator(MAX_QUANTITY)]
     )
 
+    class Meta:
+        unique_together = ("basket", "product")
+
     def __str__(self) -> str:
         return str(self.pk)
 
 
+class OrderAddressManager(models.Manager):
+
+    def snapshot(self, address):
+        """
+            Return the stored copy of the address, creating it only
+        when no identical snapshot exists yet
+        """
+        fields = {
+            name: getattr(address, name) for name in OrderAddress.FIELDS
+        }
+        snapshot, _ = self.get_or_create(
+            digest=OrderAddress.make_digest(fields), defaults=fields
+        )
+        return snapshot
+
+
+class OrderAddress(models.Model):
+    """
+        Immutable copy of an Address taken at checkout, shared by
+    every order that shipped or billed to the same details
+    """
+    FIELDS = ("name", "address1", "address2", "zip_code", "city", "country")
+
+    digest = models.CharField(max_length=64, unique=True, editable=False)
+    name = models.CharField(max_length=60)
+    address1 = models.CharField(max_length=60)
+    address2 = models.CharField(max_length=60, blank=True, null=True)
+    zip_code = models.CharField(max_length=12)
+    city = models.CharField(max_length=60)
+    country = models.CharField(max_length=3)
+
+    objects = OrderAddressManager()
+
+    def __str__(self):
+        return ", ".join(
+            value for value in (
+                self.name, self.address1, self.address2,
+                self.zip_code, self.city, self.country
+            ) if value
+        )
+
+    @staticmethod
+    def make_digest(fields):
+        raw = "\x1f".join(
+            fields.get(name) or "" for name in OrderAddress.FIELDS
+        )
+        return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
 class Order(models.Model):
     NEW = 10
     PAID = 20
@@ -153,24 +348,59 @@ class Order(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
     status = models.IntegerField(choices=STATUSES, default=NEW)
-    billing_name = models.CharField(max_length=60)
-    billing_address1 = models.CharField(max_length=60)
-    billing_address2 = models.CharField(max_length=60, blank=True, null=True)
-    billing_zip_code = models.CharField(max_length=12)
-    billing_city = models.CharField(max_length=60)
-    billing_country = models.CharField(max_length=3)
-    shipping_name = models.CharField(max_length=60)
-    shipping_address1 = models.CharField(max_length=60)
-    shipping_address2 = models.CharField(max_length=60, blank=True, null=True)
-    shipping_zip_code = models.CharField(max_length=12)
-    shipping_city = models.CharField(max_length=60)
-    shipping_country = models.CharField(max_length=3)
+    basket = models.OneToOneField(
+        Basket, on_delete=models.SET_NULL, blank=True, null=True,
+        related_name="order", editable=False)
+    idempotency_key = models.UUIDField(
+        blank=True, null=True, unique=True, editable=False)
+    billing_address = models.ForeignKey(
+        OrderAddress, on_delete=models.PROTECT, related_name="+")
+    shipping_address = models.ForeignKey(
+        OrderAddress, on_delete=models.PROTECT, related_name="+")
+    # stored at checkout so reports never have to read the items
+    subtotal = models.DecimalField(
+        max_digits=10, decimal_places=2, default=0)
+    item_count = models.PositiveIntegerField(default=0)
+    # e.g. "2 x Siddhartha, 1 x Backgammon for dummies", shown in the
+    # customer order history without loading the items
+    summary = models.CharField(max_length=255, blank=True)
     date_updated = models.DateTimeField(auto_now=True)
     date_added = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [models.Index(fields=["user", "-date_added", "-id"])]
+
     def __str__(self):
         return str(self.items)
 
+    @staticmethod
+    def summarize(items):
+        summary = ", ".join(
+            "%d x %s" % (quantity, name) for quantity, name in items
+        )
+        return Truncator(summary).chars(255)
+
+    def update_totals(self):
+        totals = self.items.aggregate(
+            subtotal=Coalesce(
+                Sum(
+                    F("unit_price") * F("quantity"),
+                    output_field=DecimalField(max_digits=10, decimal_places=2)
+                ),
+                0,
+                output_field=DecimalField(max_digits=10, decimal_places=2)
+            ),
+            item_count=Coalesce(Sum("quantity"), 0),
+        )
+        totals["summary"] = Order.summarize(
+            self.items.values_list("quantity", "product__name")
+            .order_by("pk")
+        )
+        Order.objects.filter(pk=self.pk).update(**totals)
+        self.subtotal = totals["subtotal"]
+        self.item_count = totals["item_count"]
+        self.summary = totals["summary"]
+
 
 class OrderItem(models.Model):
     NEW = 10
@@ -186,7 +416,14 @@ class OrderItem(models.Model):
     order = models.ForeignKey(
         Order, on_delete=models.CASCADE, related_name="items")
     product = models.ForeignKey(Product, on_delete=models.PROTECT)
+    quantity = models.PositiveIntegerField(
+        default=1, validators=[MinValueValidator(1)]
+    )
+    unit_price = models.DecimalField(max_digits=6, decimal_places=2)
     status = models.IntegerField(choices=STATUSES, default=NEW)
 
+    class Meta:
+        unique_together = ("order", "product")
+
     def __str__(self) -> str:
         return self.product.name
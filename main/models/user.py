@@ -1,3 +1,4 @@
+from django.core.cache import cache
 from django.db import models
 from django.contrib.auth.models import AbstractUser, BaseUserManager
 
@@ -66,6 +67,27 @@ SUPPORTED_COUNTRIES = [
 ]
 
 
+class AddressManager(models.Manager):
+
+    def address_book(self, user):
+        """
+            All addresses of the user, cached until one of them
+        changes (see main.signals.invalidate_address_book). With a
+        cache per process the copy of another process can be stale,
+        so it is only used for display and choices.
+        """
+        key = self.address_book_key(user.pk)
+        addresses = cache.get(key)
+        if addresses is None:
+            addresses = list(self.filter(user=user).order_by("pk"))
+            cache.set(key, addresses)
+        return addresses
+
+    @staticmethod
+    def address_book_key(user_id):
+        return "address-book:%d" % user_id
+
+
 class Address(models.Model):
 
     user = models.ForeignKey(User, on_delete=models.CASCADE)
@@ -78,6 +100,8 @@ class Address(models.Model):
     city = models.CharField(max_length=60)
     country = models.CharField(choices=SUPPORTED_COUNTRIES, max_length=3)
 
+    objects = AddressManager()
+
     def __str__(self) -> str:
         return ", ".join(
             [
@@ -0,0 +1,141 @@
+"""
+    Full page cache of the anonymous storefront
+
+Pages show the basket count and the navigation of logged in users,
+so only visitors without a session share a cached copy: the session
+only carries the basket id and the auth keys, no session cookie means
+an anonymous visitor without a basket. Their pages are cached per
+country and language, everyone else gets a page rendered for them.
+
+An entry records the catalogue version it was rendered at. Once it is
+older than PAGE_CACHE["TIMEOUT"], or the catalogue changed, it is
+stale: the first request to see it takes a lock and renders the page
+again, while the others keep getting the stale copy for up to
+PAGE_CACHE["STALE"] more seconds. A page missing from the cache is
+rendered by one request as well, the others wait for its copy (see
+main.singleflight). A catalogue update or a cold cache therefore costs
+one render per page instead of one per visitor.
+"""
+from functools import wraps
+import hashlib
+import time
+
+from django.conf import settings
+from django.contrib.messages.storage.cookie import CookieStorage
+from django.core.cache import cache
+from django.utils.cache import patch_vary_headers
+from django.utils.translation import get_language
+
+from main import catalogue, singleflight
+from main.models.user import SUPPORTED_COUNTRIES
+
+COUNTRIES = [code for code, name in SUPPORTED_COUNTRIES]
+COUNTRY_COOKIE = "country"
+# ISO 3166 codes, as sent by CDNs, of the SUPPORTED_COUNTRIES codes
+COUNTRY_ALIASES = {"SA": "KSA"}
+
+
+def get_country(request):
+    """
+        The country cookie, else the country header of the proxy,
+    else the first supported country
+    """
+    header = settings.PAGE_CACHE.get("COUNTRY_HEADER")
+    values = [request.COOKIES.get(COUNTRY_COOKIE)]
+    if header:
+        values.append(request.META.get(header))
+    for value in values:
+        if value:
+            code = COUNTRY_ALIASES.get(value.upper(), value.upper())
+            if code in COUNTRIES:
+                return code
+    return COUNTRIES[0]
+
+
+def vary_headers():
+    """
+        Cookie, and the country header of the proxy when there is one,
+    e.g. CF-Ipcountry for the HTTP_CF_IPCOUNTRY key of request.META
+    """
+    header = settings.PAGE_CACHE.get("COUNTRY_HEADER")
+    if not header:
+        return ("Cookie",)
+    if header.startswith("HTTP_"):
+        header = header[len("HTTP_"):]
+    return ("Cookie", "-".join(
+        part.capitalize() for part in header.split("_")))
+
+
+def is_shared(request):
+    return (
+        request.method in ("GET", "HEAD") and
+        settings.SESSION_COOKIE_NAME not in request.COOKIES and
+        CookieStorage.cookie_name not in request.COOKIES
+    )
+
+
+def cache_key(request):
+    url = hashlib.md5(request.get_full_path().encode("utf-8")).hexdigest()
+    return "page:%s:%s:%s" % (request.country, get_language(), url)
+
+
+def is_storable(response):
+    return (
+        response.status_code == 200 and
+        not response.streaming and
+        not response.cookies and
+        "private" not in response.get("Cache-Control", "") and
+        "no-store" not in response.get("Cache-Control", "")
+    )
+
+
+def cached_page(view):
+    """
+        Caches the responses of view for anonymous visitors, see the
+    module docstring
+    """
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        request.country = get_country(request)
+        if not is_shared(request):
+            response = view(request, *args, **kwargs)
+            patch_vary_headers(response, vary_headers())
+            return response
+
+        key = cache_key(request)
+        version = catalogue.version()
+        entry = cache.get(key)
+        locked = False
+        if entry is None:
+            # a cold page is rendered once, the others wait for it
+            locked = singleflight.acquire(key)
+            entry = cache.get(key) if locked else singleflight.wait(key)
+        if entry is not None:
+            response, entry_version, fresh_until = entry
+            if entry_version == version and time.time() < fresh_until:
+                if locked:
+                    singleflight.release(key)
+                response["X-Page-Cache"] = "hit"
+                return response
+            if not locked:
+                locked = singleflight.acquire(key)
+            if not locked:
+                # another request is rendering it
+                response["X-Page-Cache"] = "stale"
+                return response
+
+        try:
+            response = view(request, *args, **kwargs)
+            if hasattr(response, "render") and callable(response.render):
+                response = response.render()
+            patch_vary_headers(response, vary_headers())
+            if is_storable(response):
+                timeout = settings.PAGE_CACHE["TIMEOUT"]
+                cache.set(key, (response, version, time.time() + timeout),
+                          timeout + settings.PAGE_CACHE["STALE"])
+        finally:
+            if locked:
+                singleflight.release(key)
+        response["X-Page-Cache"] = "miss"
+        return response
+    return wrapper
@@ -0,0 +1,95 @@
+import logging
+import time
+from datetime import date, timedelta
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+STATS_DAYS = 7
+
+
+class RateLimit:
+    """
+        Sliding window counter kept in the cache, the previous
+    window is weighted by how much of it still overlaps the last
+    `period` seconds. Checking costs one cache read, so it can run
+    before any password hashing.
+    """
+
+    def __init__(self, scope, limit, period):
+        self.scope = scope
+        self.limit = limit
+        self.period = period
+
+    def _key(self, key, window):
+        return "ratelimit:%s:%s:%d" % (self.scope, key, window)
+
+    def count(self, key, now=None):
+        now = time.time() if now is None else now
+        window = int(now // self.period)
+        current, previous = self._key(key, window), self._key(key, window - 1)
+        values = cache.get_many([current, previous])
+        overlap = 1 - (now % self.period) / self.period
+        return values.get(current, 0) + values.get(previous, 0) * overlap
+
+    def is_limited(self, key, now=None):
+        return self.count(key, now) >= self.limit
+
+    def hit(self, key, now=None):
+        now = time.time() if now is None else now
+        cache_key = self._key(key, int(now // self.period))
+        if not cache.add(cache_key, 1, timeout=self.period * 2):
+            try:
+                cache.incr(cache_key)
+            except ValueError:
+                # expired between add and incr
+                cache.set(cache_key, 1, timeout=self.period * 2)
+
+
+def get_limits(name):
+    """
+        RateLimit instances for a RATE_LIMITS entry, keyed by
+    what they are counted per ("ip" or "email")
+    """
+    config = getattr(settings, "RATE_LIMITS", {}).get(name, {})
+    return {
+        per: RateLimit("%s-%s" % (name, per), limit, period)
+        for per, (limit, period) in config.items()
+    }
+
+
+def client_ip(request):
+    if request is None:
+        return None
+    return request.META.get("REMOTE_ADDR")
+
+
+def record(name, outcome):
+    """Count a failed or rejected attempt for the reporting admin"""
+    key = "ratelimit-stats:%s:%s:%s" % (name, outcome, date.today())
+    if not cache.add(key, 1, timeout=86400 * (STATS_DAYS + 1)):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=86400 * (STATS_DAYS + 1))
+
+
+def stats(names, outcomes=("failed", "rejected")):
+    days = [date.today() - timedelta(days=i) for i in range(STATS_DAYS)]
+    keys = {
+        (name, outcome, day): "ratelimit-stats:%s:%s:%s" % (
+            name, outcome, day)
+        for name in names for outcome in outcomes for day in days
+    }
+    values = cache.get_many(list(keys.values()))
+    return [
+        {
+            "day": day,
+            "counts": [
+                values.get(keys[(name, outcome, day)], 0)
+                for name in names for outcome in outcomes
+            ],
+        }
+        for day in days
+    ]
@@ -0,0 +1,37 @@
+import threading
+from contextlib import contextmanager
+from django.conf import settings
+
+_state = threading.local()
+
+
+@contextmanager
+def reporting_reads():
+    """
+        Route every read made inside the block to the reporting
+    database, used by the admin reporting views
+    """
+    previous = getattr(_state, "reporting", False)
+    _state.reporting = True
+    try:
+        yield
+    finally:
+        _state.reporting = previous
+
+
+class ReportingRouter:
+    def db_for_read(self, model, **hints):
+        alias = getattr(settings, "REPORTING_DATABASE", None)
+        if getattr(_state, "reporting", False) and alias in settings.DATABASES:
+            return alias
+        return None
+
+    def db_for_write(self, model, **hints):
+        return "default"
+
+    def allow_relation(self, obj1, obj2, **hints):
+        # the reporting database is a read only view of 'default'
+        return True
+
+    def allow_migrate(self, db, app_label, model_name=None, **hints):
+        return db == "default"
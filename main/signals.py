@@ -1,37 +1,53 @@
 from io import BytesIO
 import logging
 from PIL import Image
+from django.conf import settings
 from django.core.files.base import ContentFile
-from django.db.models.signals import pre_save
+from django.db import DatabaseError
+from django.db.backends.signals import connection_created
+from django.core.cache import cache
+from django.db.models.signals import (m2m_changed, post_delete, post_save,
+                                      pre_delete, pre_save)
 from django.dispatch import receiver
 from django.contrib.auth.signals import user_logged_in
+from django.utils import timezone
 
-from .models import ProductImage, Basket
+from . import analytics, catalogue
+from .models import (Address, AuthEvent, Basket, CatalogueChange,
+                     MediaBlob, Product, ProductImage, ProductTag)
 
 THUMBANIL_SIZE = (200, 150)
 
 logger = logging.getLogger(__name__)
 
 
+@receiver(user_logged_in)
+def track_login(sender, user, request, **kwargs):
+    if request is not None:
+        analytics.track(request, AuthEvent.LOGIN, user)
+
+
 @receiver(user_logged_in)
 def merge_basket_if_found(sender, user, request, **kwargs):
     anonymous_basket = getattr(request, "basket", None)
 
     if anonymous_basket:
-        try:
-            logged_in_basket = Basket.objects.get(
-                user=user, status=Basket.OPEN
-            )
+        # a user logged in from several browsers can have more than
+        # one open basket, the last one used wins
+        logged_in_basket = Basket.objects.filter(
+            user=user, status=Basket.OPEN
+        ).exclude(pk=anonymous_basket.pk).order_by("-date_updated").first()
+        if logged_in_basket:
             for line in anonymous_basket.basketline_set.all():
-                line.basket = logged_in_basket
-                line.save()
+                logged_in_basket.add_product(line.product_id, line.quantity)
             anonymous_basket.delete()
             request.basket = logged_in_basket
+            request.session["basket_id"] = logged_in_basket.id
 
             logger.info(
                 "Merged basket to id %d", logged_in_basket.id
             )
-        except Basket.DoesNotExist:
+        else:
             anonymous_basket.user = user
             anonymous_basket.save()
             logger.info(
@@ -66,3 +82,130 @@ def generate_thumbnail(sender, instance, *args, **kwargs):
         save=False,
     )
     temp_thumb.close()
+
+
+@receiver(pre_save, sender=ProductImage)
+def remember_media_names(sender, instance, **kwargs):
+    instance._stored_media = ()
+    if instance.pk is not None:
+        instance._stored_media = ProductImage.objects.filter(
+            pk=instance.pk).values_list("image", "thumbnail").first() or ()
+
+
+@receiver(post_save, sender=ProductImage)
+def count_media_references(sender, instance, **kwargs):
+    before = set(getattr(instance, "_stored_media", ()))
+    after = {instance.image.name, instance.thumbnail.name}
+    MediaBlob.objects.adjust(after - before, 1)
+    MediaBlob.objects.adjust(before - after, -1)
+
+
+@receiver(post_delete, sender=ProductImage)
+def release_media_references(sender, instance, **kwargs):
+    MediaBlob.objects.adjust(
+        [instance.image.name, instance.thumbnail.name], -1)
+
+
+@receiver(connection_created)
+def tune_sqlite_connection(sender, connection, **kwargs):
+    if connection.vendor != "sqlite":
+        return
+    with connection.cursor() as cursor:
+        for pragma, value in getattr(settings, "SQLITE_PRAGMAS", {}).items():
+            try:
+                cursor.execute("PRAGMA %s = %s" % (pragma, value))
+            except DatabaseError:
+                # e.g. journal_mode on a read only connection
+                logger.warning("Could not apply PRAGMA %s", pragma)
+
+
+@receiver(post_save, sender=Address)
+@receiver(post_delete, sender=Address)
+def invalidate_address_book(sender, instance, **kwargs):
+    cache.delete(Address.objects.address_book_key(instance.user_id))
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductTag)
+@receiver(post_delete, sender=ProductTag)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+@receiver(m2m_changed, sender=Product.tags.through)
+def bump_catalogue_version(sender, **kwargs):
+    catalogue.bump_version()
+
+
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def touch_image_product(sender, instance, **kwargs):
+    # the product date_updated is the ETag of the catalogue API
+    Product.objects.filter(pk=instance.product_id).update(
+        date_updated=timezone.now())
+
+
+@receiver(post_save, sender=ProductTag)
+def touch_tag_products(sender, instance, created, **kwargs):
+    if not created:
+        Product.objects.filter(tags=instance).update(
+            date_updated=timezone.now())
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+def touch_tagged_products(sender, instance, action, reverse, pk_set,
+                          **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        products = Product.objects.filter(pk=instance.pk)
+    elif action == "pre_clear":
+        products = Product.objects.filter(tags=instance)
+    else:
+        products = Product.objects.filter(pk__in=pk_set)
+    products.update(date_updated=timezone.now())
+
+
+@receiver(post_save, sender=Product)
+@receiver(post_delete, sender=Product)
+@receiver(post_save, sender=ProductTag)
+@receiver(post_delete, sender=ProductTag)
+@receiver(post_save, sender=ProductImage)
+@receiver(post_delete, sender=ProductImage)
+def log_catalogue_change(sender, instance, signal, **kwargs):
+    action = (CatalogueChange.DELETED if signal is post_delete
+              else CatalogueChange.UPDATED)
+    if sender is ProductImage:
+        CatalogueChange.objects.record(
+            CatalogueChange.PRODUCT, [instance.product_id])
+    elif sender is Product:
+        CatalogueChange.objects.record(
+            CatalogueChange.PRODUCT, [instance.pk], action)
+    else:
+        CatalogueChange.objects.record(
+            CatalogueChange.TAG, [instance.pk], action)
+        if signal is post_save and not kwargs["created"]:
+            # products list the slugs of their active tags
+            CatalogueChange.objects.record(
+                CatalogueChange.PRODUCT,
+                instance.product_set.values_list("pk", flat=True))
+
+
+@receiver(pre_delete, sender=ProductTag)
+def log_untagged_products(sender, instance, **kwargs):
+    # the links are gone, without m2m_changed, once the tag is deleted
+    CatalogueChange.objects.record(
+        CatalogueChange.PRODUCT,
+        instance.product_set.values_list("pk", flat=True))
+
+
+@receiver(m2m_changed, sender=Product.tags.through)
+def log_tag_links(sender, instance, action, reverse, pk_set, **kwargs):
+    if action not in ("post_add", "post_remove", "pre_clear"):
+        return
+    if not reverse:
+        ids = [instance.pk]
+    elif action == "pre_clear":
+        ids = instance.product_set.values_list("pk", flat=True)
+    else:
+        ids = pk_set
+    CatalogueChange.objects.record(CatalogueChange.PRODUCT, ids)
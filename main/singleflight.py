@@ -0,0 +1,71 @@
+"""
+    Single-flight cache fills
+
+On a miss, the first caller takes a lock in the cache (an add(), so
+it works across processes with a shared cache) and computes the value,
+the other callers wait for it instead of computing it too. A caller
+that waited LOCK_WAIT seconds in vain computes the value itself, and
+a lock left by a crashed process expires after LOCK_TIMEOUT seconds.
+"""
+import time
+
+from django.core.cache import cache
+
+LOCK_TIMEOUT = 30
+LOCK_WAIT = 5
+POLL_INTERVAL = 0.05
+
+
+def lock_key(key):
+    return key + ":lock"
+
+
+def acquire(key):
+    return cache.add(lock_key(key), 1, LOCK_TIMEOUT)
+
+
+def release(key):
+    cache.delete(lock_key(key))
+
+
+def wait(key):
+    """
+        The value stored under key by the lock holder, None when it
+    gave up or took longer than LOCK_WAIT
+    """
+    deadline = time.monotonic() + LOCK_WAIT
+    while time.monotonic() < deadline:
+        time.sleep(POLL_INTERVAL)
+        values = cache.get_many([key, lock_key(key)])
+        if key in values:
+            return values[key]
+        if lock_key(key) not in values:
+            return None
+    return None
+
+
+def get_or_set(key, compute, timeout):
+    """
+        cache.get_or_set() computing a missing value once for all
+    concurrent callers. compute() must not return None.
+    """
+    value = cache.get(key)
+    if value is not None:
+        return value
+    locked = acquire(key)
+    if locked:
+        # filled between the miss and the lock
+        value = cache.get(key)
+    else:
+        value = wait(key)
+    if value is not None:
+        if locked:
+            release(key)
+        return value
+    try:
+        value = compute()
+        cache.set(key, value, timeout)
+    finally:
+        if locked:
+            release(key)
+    return value
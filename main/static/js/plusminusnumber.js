@@ -1,24 +1,41 @@
 $(function () {
+  // Every click is sent to the basket line API, the server answers
+  // with the new line quantity and the basket totals.
+  function updateLine(button, action) {
+    var line = button.closest(".basket-line");
+    var input = line.find(".quantity-number");
+    $.post(line.attr("data-url"), {
+      action: action,
+      csrfmiddlewaretoken: $("input[name='csrfmiddlewaretoken']").val(),
+    }).done(function (data) {
+      $("#basket-count").text(data.basket.items);
+      if (data.line.quantity == 0) {
+        line.remove();
+        if (data.basket.lines == 0) {
+          window.location.reload();
+        }
+        return;
+      }
+      input.val(data.line.quantity).change();
+      line.find(".btn-plus").attr(
+        "disabled", data.line.quantity >= parseInt(input.attr("max"))
+      );
+    });
+  }
+
   $(".btn-number").click(function (e) {
     e.preventDefault();
-    fieldName = $(this).attr("data-field");
-    type = $(this).attr("data-type");
-    var input = $("input[name='" + fieldName + "']");
+    var type = $(this).attr("data-type");
+    var input = $(this).closest(".basket-line").find(".quantity-number");
     var currentVal = parseInt(input.val());
-    if (type == "minus") {
-      if (currentVal > input.attr("min")) {
-        input.val(currentVal - 1).change();
-      }
-      if (parseInt(input.val()) == input.attr("min")) {
-        $(this).attr("disabled", true);
-      }
-    } else if (type == "plus") {
-      if (currentVal < input.attr("max")) {
-        input.val(currentVal + 1).change();
-      }
-      if (parseInt(input.val()) == input.attr("max")) {
-        $(this).attr("disabled", true);
-      }
+    if (type == "plus" && currentVal >= parseInt(input.attr("max"))) {
+      return;
     }
+    updateLine($(this), type == "plus" ? "increment" : "decrement");
+  });
+
+  $(".btn-remove").click(function (e) {
+    e.preventDefault();
+    updateLine($(this), "remove");
   });
 });
@@ -0,0 +1,115 @@
+import hashlib
+import os
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.utils import timezone
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+try:
+    import rcssmin
+    import rjsmin
+except ImportError:  # minification is optional, like brotli
+    rcssmin = rjsmin = None
+
+
+class MinifiedManifestStaticFilesStorage(
+        CompressedManifestStaticFilesStorage):
+    """
+        collectstatic storage: minifies css/js shipped unminified, hashes the
+    file names (manifest) and writes the .gz/.br variants next to them.
+    Hashed names are served by whitenoise with immutable cache headers.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run and rjsmin is not None:
+            paths = paths.copy()
+            for name in paths:
+                if self.minify(name):
+                    # hash the minified copy, not the source file
+                    paths[name] = (self, name)
+        yield from super().post_process(paths, dry_run, **options)
+
+    def minify(self, name):
+        if ".min." in name:
+            return False
+        if name.endswith(".js"):
+            minifier = rjsmin.jsmin
+        elif name.endswith(".css"):
+            minifier = rcssmin.cssmin
+        else:
+            return False
+        with self.open(name) as f:
+            content = f.read().decode("utf-8")
+        self.delete(name)
+        self._save(name, ContentFile(minifier(content).encode("utf-8")))
+        return True
+
+
+class ContentAddressedStorage(FileSystemStorage):
+    """
+        Media storage keyed by content: every file is written once as
+    blobs/<aa>/<sha256><ext>, whatever name it was uploaded with, and
+    saving the same bytes again returns the existing name. The upload
+    is hashed while it is streamed to a temporary file, chunk by chunk.
+    Each blob has a MediaBlob row holding its reference count.
+    """
+    prefix = "blobs"
+    chunk_size = 64 * 1024
+
+    def get_available_name(self, name, max_length=None):
+        # the final name only depends on the content, see _save()
+        return name
+
+    def blob_name(self, digest, name):
+        extension = os.path.splitext(name)[1].lower()
+        return "%s/%s/%s%s" % (self.prefix, digest[:2], digest, extension)
+
+    def content_name(self, content, name):
+        """
+            Name content would be stored under, without storing it
+        """
+        digest = hashlib.sha256()
+        for chunk in content.chunks(self.chunk_size):
+            digest.update(chunk)
+        return self.blob_name(digest.hexdigest(), name)
+
+    def _save(self, name, content):
+        from .models import MediaBlob
+
+        directory = self.path(self.prefix)
+        os.makedirs(directory, exist_ok=True)
+        digest = hashlib.sha256()
+        size = 0
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".upload")
+        try:
+            with os.fdopen(fd, "wb") as temp:
+                for chunk in content.chunks(self.chunk_size):
+                    digest.update(chunk)
+                    size += len(chunk)
+                    temp.write(chunk)
+            digest = digest.hexdigest()
+            name = self.blob_name(digest, name)
+            full_path = self.path(name)
+            if os.path.exists(full_path):
+                os.remove(temp_path)
+            else:
+                os.makedirs(os.path.dirname(full_path), exist_ok=True)
+                os.chmod(temp_path, self.file_permissions_mode or 0o644)
+                # atomic, a concurrent upload of the same bytes just
+                # replaces the file with an identical one
+                os.replace(temp_path, full_path)
+        except BaseException:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        blob, created = MediaBlob.objects.get_or_create(
+            name=name, defaults={"digest": digest, "size": size}
+        )
+        if not created:
+            # keeps gc_media away from a blob that is being reused
+            MediaBlob.objects.filter(pk=blob.pk).update(
+                date_updated=timezone.now())
+        return name
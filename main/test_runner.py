@@ -0,0 +1,48 @@
+import os
+import unittest
+
+from django.conf import settings
+from django.test.runner import DiscoverRunner
+
+from main import analytics
+
+
+class TestRunner(DiscoverRunner):
+    """
+        Keeps the analytics buffer to the test that filled it: it is
+    emptied before every test and before the test databases are
+    destroyed, so no event is written into another test or outlives
+    its database
+    """
+
+    def get_resultclass(self):
+        base = super().get_resultclass() or unittest.TextTestResult
+
+        class ResultClass(base):
+
+            def startTest(self, test):
+                analytics.discard()
+                super().startTest(test)
+
+        return ResultClass
+
+    def setup_databases(self, **kwargs):
+        self.remove_wal_files()
+        return super().setup_databases(**kwargs)
+
+    def teardown_databases(self, old_config, **kwargs):
+        analytics.discard()
+        super().teardown_databases(old_config, **kwargs)
+        self.remove_wal_files()
+
+    def remove_wal_files(self):
+        """
+            The WAL of a deleted test database, left by connections of
+        other threads, must not be applied to the next one
+        """
+        name = settings.DATABASES["default"].get("TEST", {}).get("NAME")
+        if not name:
+            return
+        for suffix in ("-wal", "-shm"):
+            if os.path.exists(name + suffix):
+                os.remove(name + suffix)
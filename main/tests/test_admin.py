@@ -0,0 +1,65 @@
+from decimal import Decimal
+
+from unittest.mock import patch
+
+from django.test import RequestFactory, TestCase
+from django.urls import reverse
+
+from main import analytics, models, factories, ratelimit
+
+
+class TestReporting(TestCase):
+
+    def setUp(self):
+        self.owner = models.User.objects.create_superuser(
+            "owner@domain.com", "pw432joij")
+        self.client.force_login(self.owner)
+
+    def test_revenue_uses_prices_paid(self):
+        product = factories.ProductFactory(price=Decimal("5.00"))
+        tag = product.tags.create(name="Open source", slug="opensource")
+        untagged = factories.ProductFactory(price=Decimal("3.00"))
+        address = factories.AddressFactory(
+            user=self.owner, name="Ali", address1="Flat 1",
+            zip_code="1111", city="KHA", country="SD")
+        basket = models.Basket.objects.create(user=self.owner)
+        models.BasketLine.objects.create(
+            basket=basket, product=product, quantity=2)
+        models.BasketLine.objects.create(basket=basket, product=untagged)
+        basket.create_order(address, address)
+
+        # a later price change does not rewrite history
+        product.price = Decimal("50.00")
+        product.save()
+
+        response = self.client.get(reverse("admin:index") + "revenue/")
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.context["per_day"][0]["revenue"],
+                         Decimal("13.00"))
+        self.assertEqual(response.context["per_country"][0]["country"], "SD")
+        self.assertEqual(
+            response.context["per_tag"],
+            [{"tag_id": tag.id, "tag": "Open source", "items": 2,
+              "revenue": Decimal("10.00")},
+             {"tag_id": None, "tag": None, "items": 1,
+              "revenue": Decimal("3.00")}])
+
+    def test_throttling_report_lists_counters(self):
+        ratelimit.record("login", "rejected")
+        response = self.client.get(reverse("admin:index") + "throttling/")
+        self.assertEqual(response.status_code, 200)
+        self.assertGreaterEqual(response.context["rows"][0]["counts"][1], 1)
+
+    def test_auth_events_report_counts_per_day(self):
+        request_meta = {"HTTP_SEC_CH_UA_PLATFORM": '"Windows"'}
+        with patch.object(analytics, "_buffer", []):
+            analytics.track(
+                RequestFactory().get("/", **request_meta),
+                models.AuthEvent.SIGNUP, self.owner)
+            response = self.client.get(
+                reverse("admin:index") + "auth_events/")
+        self.assertEqual(response.status_code, 200)
+        row = response.context["rows"][0]
+        self.assertEqual(
+            (row["kind"], row["platform"], row["events"]),
+            ("Signup", "Windows", 1))
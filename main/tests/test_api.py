@@ -0,0 +1,175 @@
+from decimal import Decimal
+from io import StringIO
+import gzip
+import json
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+from django.urls import reverse
+
+from main import api, changes, models
+
+
+class TestCatalogueApi(TestCase):
+
+    def setUp(self):
+        self.tag = models.ProductTag.objects.create(
+            name="Open source", slug="opensource")
+        self.products = []
+        for i in range(5):
+            product = models.Product.objects.create(
+                name="Book %d" % i, slug="book-%d" % i,
+                price=Decimal("10.00"))
+            product.tags.add(self.tag)
+            self.products.append(product)
+        models.Product.objects.create(
+            name="Hidden", slug="hidden", price=Decimal("1.00"),
+            active=False)
+
+    def test_products_are_keyset_paginated_with_selected_fields(self):
+        url = reverse("api_product_list")
+        response = self.client.get(url, {"fields": "name,price", "limit": 3})
+
+        data = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            data["results"][0], {"name": "Book 0", "price": "10.00"})
+        self.assertEqual(len(data["results"]), 3)
+
+        data = self.client.get(data["next"]).json()
+        self.assertEqual(
+            [row["name"] for row in data["results"]], ["Book 3", "Book 4"])
+        self.assertIsNone(data["next"])
+
+    def test_relations_take_one_query_each(self):
+        url = reverse("api_product_list")
+        # etag, page, tags
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {"fields": "slug,tags"})
+
+        self.assertEqual(
+            response.json()["results"][0],
+            {"slug": "book-0", "tags": ["opensource"]})
+
+    def test_unchanged_catalogue_answers_304(self):
+        url = reverse("api_product_list")
+        response = self.client.get(url)
+        etag = response["ETag"]
+
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+        self.tag.name = "Free software"
+        self.tag.save()
+        response = self.client.get(url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 200)
+
+    def test_product_detail_and_errors(self):
+        product = self.products[0]
+        response = self.client.get(
+            reverse("api_product_detail", args=[product.pk]),
+            {"fields": "id,name"})
+        self.assertEqual(
+            response.json(), {"id": product.pk, "name": "Book 0"})
+
+        response = self.client.get(
+            reverse("api_product_list"), {"fields": "name,password"})
+        self.assertEqual(response.status_code, 400)
+
+        hidden = models.Product.objects.get(slug="hidden")
+        response = self.client.get(
+            reverse("api_product_detail", args=[hidden.pk]))
+        self.assertEqual(response.status_code, 404)
+
+    def test_tags(self):
+        response = self.client.get(reverse("api_tag_list"), {"fields": "slug"})
+        self.assertEqual(response.json()["results"], [{"slug": "opensource"}])
+
+
+class TestChangeFeed(TestCase):
+
+    def setUp(self):
+        self.cursor = changes.latest_cursor()
+        self.product = models.Product.objects.create(
+            name="Book", slug="book", price=Decimal("10.00"))
+        self.tag = models.ProductTag.objects.create(
+            name="Open source", slug="opensource")
+
+    def test_changes_are_compacted_with_current_rows(self):
+        self.product.tags.add(self.tag)
+        self.product.price = Decimal("12.00")
+        self.product.save()
+
+        response = self.client.get(
+            reverse("api_changes"), {"since": self.cursor})
+        data = response.json()
+
+        self.assertEqual(
+            [(entry["type"], entry["action"]) for entry in data["changes"]],
+            [("tag", "updated"), ("product", "updated")])
+        product = data["changes"][1]["data"]
+        self.assertEqual(product["price"], "12.00")
+        self.assertEqual(product["tags"], ["opensource"])
+        self.assertFalse(data["more"])
+
+        product_id = self.product.id
+        self.product.delete()
+        response = self.client.get(
+            reverse("api_changes"), {"since": data["cursor"]})
+        self.assertEqual(response.json()["changes"], [
+            {"type": "product", "id": product_id, "action": "deleted"}])
+
+    def test_export_snapshot_and_delta(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        call_command("export_catalogue", directory, stdout=StringIO())
+        cursor = changes.latest_cursor()
+
+        path = os.path.join(directory, "catalogue-%d.ndjson.gz" % cursor)
+        with gzip.open(path, "rt") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines[0]["cursor"], cursor)
+        self.assertEqual(
+            [(line["type"], line["id"]) for line in lines[1:]],
+            [("tag", self.tag.id), ("product", self.product.id)])
+
+        self.tag.delete()
+        call_command("export_catalogue", directory, since=cursor,
+                     stdout=StringIO())
+        path = os.path.join(directory, "catalogue-%d-%d.ndjson.gz" % (
+            cursor, changes.latest_cursor()))
+        with gzip.open(path, "rt") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(
+            [(line["type"], line["action"]) for line in lines[1:]],
+            [("tag", "deleted")])
+
+    def test_export_delta_is_written_batch_by_batch(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        products = [
+            models.Product.objects.create(
+                name="Book %d" % i, slug="book-%d" % i,
+                price=Decimal("10.00"))
+            for i in range(3)
+        ]
+        cursor = changes.latest_cursor()
+        for product in products:
+            product.price = Decimal("12.00")
+            product.save()
+
+        with mock.patch.object(api, "MAX_LIMIT", 1):
+            call_command("export_catalogue", directory, since=cursor,
+                         stdout=StringIO())
+        path = os.path.join(directory, "catalogue-%d-%d.ndjson.gz" % (
+            cursor, changes.latest_cursor()))
+        with gzip.open(path, "rt") as f:
+            lines = [json.loads(line) for line in f]
+        self.assertEqual(lines[0]["cursor"], changes.latest_cursor())
+        self.assertEqual(
+            [line["id"] for line in lines[1:]],
+            [product.id for product in products])
@@ -1,9 +1,18 @@
 from io import StringIO
+from datetime import timedelta
+from decimal import Decimal
+import csv
+import os
+import shutil
 import tempfile
+from unittest import mock
 from django.conf import settings
-from django.core.management import call_command
-from django.test import TestCase, override_settings
-from main import models
+from django.contrib.sessions.models import Session
+from django.core.management import CommandError, call_command
+from django.core.serializers.base import DeserializationError
+from django.test import TestCase, TransactionTestCase, override_settings
+from django.utils import timezone
+from main import catalogue_fixtures, models, factories
 
 
 class TestImport(TestCase):
@@ -23,3 +32,314 @@ class TestImport(TestCase):
         self.assertEqual(models.Product.objects.count(), 3)
         self.assertEqual(models.ProductTag.objects.count(), 6)
         self.assertEqual(models.ProductImage.objects.count(), 3)
+
+    def write_csv(self, directory, rows):
+        path = os.path.join(directory, "products.csv")
+        with open(path, "w", newline="") as f:
+            writer = csv.writer(f)
+            writer.writerow(
+                ["name", "description", "tags", "image_filename", "price"])
+            writer.writerows(rows)
+        return path
+
+    def test_reimport_updates_by_slug_and_dry_run_reports(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        rows = [
+            ["Vim for dummies", "Editors", "Editors|Manual", "", "5.00"],
+            ["Emacs for dummies", "Editors", "Editors", "", "6.00"],
+        ]
+        call_command("import_data", self.write_csv(directory, rows),
+                     directory, stdout=StringIO())
+        vim = models.Product.objects.get(slug="vim-for-dummies")
+
+        rows[0][4] = "7.50"
+        rows[1] = ["Nano for dummies", "Editors", "Editors", "", "1.00"]
+        path = self.write_csv(directory, rows)
+        out = StringIO()
+        with self.assertNumQueries(4):
+            call_command("import_data", path, directory, dry_run=True,
+                         verbosity=2, stdout=out)
+        self.assertIn(
+            "Products new=1 changed=1 unchanged=0 removed=1", out.getvalue())
+        self.assertIn(
+            "~ vim-for-dummies (price: 5.00 -> 7.50)", out.getvalue())
+        self.assertEqual(models.Product.objects.count(), 2)
+
+        call_command("import_data", path, directory,
+                     deactivate_missing=True, stdout=StringIO())
+        vim.refresh_from_db()
+        self.assertEqual(vim.price, Decimal("7.50"))
+        self.assertEqual(models.Product.objects.count(), 3)
+        self.assertEqual(
+            list(models.Product.objects.active().order_by(
+                "slug").values_list("slug", flat=True)),
+            ["nano-for-dummies", "vim-for-dummies"])
+        self.assertEqual(
+            sorted(vim.tags.values_list("slug", flat=True)),
+            ["editors", "manual"])
+
+
+    def test_tag_only_changes_update_the_product(self):
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        rows = [["Vim for dummies", "Editors", "Editors|Manual", "", "5.00"]]
+        call_command("import_data", self.write_csv(directory, rows),
+                     directory, stdout=StringIO())
+        vim = models.Product.objects.get(slug="vim-for-dummies")
+
+        rows[0][2] = "Editors|Vim"
+        path = self.write_csv(directory, rows)
+        out = StringIO()
+        call_command("import_data", path, directory, dry_run=True,
+                     verbosity=2, stdout=out)
+        self.assertIn(
+            "Products new=0 changed=1 unchanged=0", out.getvalue())
+        self.assertIn("Tag links added=1 removed=1", out.getvalue())
+        self.assertIn(
+            "~ vim-for-dummies (tags: editors, manual -> editors, vim)",
+            out.getvalue())
+
+        call_command("import_data", path, directory, stdout=StringIO())
+        self.assertEqual(
+            sorted(vim.tags.values_list("slug", flat=True)),
+            ["editors", "vim"])
+        self.assertGreater(
+            models.Product.objects.get(pk=vim.pk).date_updated,
+            vim.date_updated)
+
+
+class TestCleanBaskets(TestCase):
+    def test_clean_baskets_deletes_only_stale_anonymous(self):
+        product = factories.ProductFactory()
+        user = factories.UserFactory()
+        stale = [models.Basket.objects.create() for _ in range(3)]
+        fresh = models.Basket.objects.create()
+        owned = models.Basket.objects.create(user=user)
+        submitted = models.Basket.objects.create(
+            status=models.Basket.SUBMITTED)
+        for basket in stale + [fresh, owned]:
+            models.BasketLine.objects.create(basket=basket, product=product)
+
+        old = timezone.now() - timedelta(days=40)
+        models.Basket.objects.exclude(pk=fresh.pk).update(date_updated=old)
+
+        out = StringIO()
+        call_command('clean_baskets', '--batch-size=2', '--pause=0',
+                     stdout=out)
+
+        self.assertIn("Baskets deleted=3 (lines=3)", out.getvalue())
+        self.assertEqual(
+            set(models.Basket.objects.values_list("pk", flat=True)),
+            {fresh.pk, owned.pk, submitted.pk},
+        )
+        self.assertEqual(models.BasketLine.objects.count(), 2)
+
+
+class TestCleanSessions(TestCase):
+    def test_clean_sessions_deletes_only_expired(self):
+        now = timezone.now()
+        for i in range(5):
+            Session.objects.create(
+                session_key="expired%d" % i, session_data="",
+                expire_date=now - timedelta(days=1))
+        Session.objects.create(
+            session_key="live", session_data="",
+            expire_date=now + timedelta(days=1))
+
+        out = StringIO()
+        call_command('clean_sessions', '--batch-size=2', '--pause=0',
+                     stdout=out)
+
+        self.assertIn("Sessions deleted=5", out.getvalue())
+        self.assertEqual(
+            list(Session.objects.values_list("session_key", flat=True)),
+            ["live"],
+        )
+
+
+class TestCatalogueFixtures(TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_load_repo_fixture_then_round_trip(self):
+        out = StringIO()
+        call_command("load_catalogue", "main/fixtures/producttags.json",
+                     stdout=out)
+        tags = models.ProductTag.objects.count()
+        self.assertIn("created=%d" % tags, out.getvalue())
+
+        product = factories.ProductFactory(name="Vim", slug="vim")
+        product.tags.add(*models.ProductTag.objects.all()[:2])
+        for name in ("catalogue.json", "catalogue.ndjson.gz"):
+            path = os.path.join(self.directory, name)
+            call_command("dump_catalogue", path, stdout=StringIO())
+            out = StringIO()
+            call_command("load_catalogue", path, stdout=out)
+            self.assertIn(
+                "created=0, updated=%d" % (tags + 1), out.getvalue())
+        self.assertEqual(product.tags.count(), 2)
+        changes = models.CatalogueChange.objects.filter(
+            kind=models.CatalogueChange.TAG)
+        self.assertEqual(
+            set(changes.values_list("object_id", flat=True)),
+            set(models.ProductTag.objects.values_list("pk", flat=True)))
+
+    def test_loads_dumpdata_natural_key_output(self):
+        product = factories.ProductFactory(name="Vim", slug="vim")
+        product.tags.create(name="Editors", slug="editors")
+        path = os.path.join(self.directory, "dumpdata.json")
+        call_command("dumpdata", "main.producttag", "main.product",
+                     natural_foreign=True, natural_primary=True,
+                     output=path, stdout=StringIO())
+        product.delete()
+        models.ProductTag.objects.all().delete()
+
+        # small reads, so objects straddle the chunks of the JSON array
+        with mock.patch.object(catalogue_fixtures, "CHUNK_SIZE", 16):
+            call_command("load_catalogue", path, stdout=StringIO())
+
+        product = models.Product.objects.get_by_natural_key("vim")
+        self.assertEqual(
+            list(product.tags.values_list("slug", flat=True)), ["editors"])
+
+
+    def test_unknown_natural_keys_are_named(self):
+        path = os.path.join(self.directory, "catalogue.ndjson")
+        with open(path, "w") as f:
+            catalogue_fixtures.write_objects(f, [
+                {"model": "main.product",
+                 "fields": {"name": "Vim", "slug": "vim", "price": "5.00",
+                            "tags": [["editors"]]}},
+            ], ndjson=True)
+        with self.assertRaisesMessage(
+                CommandError, "main.product 'vim': main.ProductTag "
+                              "matching natural key ['editors']"):
+            call_command("load_catalogue", path, stdout=StringIO())
+        self.assertFalse(models.Product.objects.exists())
+
+        with self.assertRaisesMessage(
+                DeserializationError,
+                "main.Product matching natural key ['emacs']"):
+            catalogue_fixtures.Loader().load([{
+                "model": "main.productimage",
+                "fields": {"product": ["emacs"], "image": "a.jpg"}}])
+
+    def test_images_match_on_product_and_name_not_on_pk(self):
+        vim = factories.ProductFactory(name="Vim", slug="vim")
+        emacs = factories.ProductFactory(name="Emacs", slug="emacs")
+        models.MediaBlob.objects.bulk_create([
+            models.MediaBlob(name=name, digest=name, size=1, refcount=count)
+            for name, count in (("a.jpg", 1), ("t1.jpg", 1), ("t2.jpg", 0),
+                                ("b.jpg", 1))
+        ])
+        # bulk writes, the thumbnail signal would open the files
+        models.ProductImage.objects.bulk_create([
+            models.ProductImage(product=vim, image="a.jpg",
+                                thumbnail="t1.jpg"),
+            models.ProductImage(product=emacs, image="b.jpg"),
+        ])
+        other = models.ProductImage.objects.get(product=emacs)
+
+        catalogue_fixtures.Loader().load([{
+            "model": "main.productimage",
+            "pk": other.pk,
+            "fields": {"product": ["vim"], "image": "a.jpg",
+                       "thumbnail": "t2.jpg"},
+        }])
+
+        self.assertEqual(
+            sorted(models.ProductImage.objects.values_list(
+                "product__slug", "image", "thumbnail")),
+            [("emacs", "b.jpg", ""), ("vim", "a.jpg", "t2.jpg")])
+        self.assertEqual(
+            dict(models.MediaBlob.objects.values_list("name", "refcount")),
+            {"a.jpg": 1, "t1.jpg": 0, "t2.jpg": 1, "b.jpg": 1})
+
+
+class TestSeedPerfData(TestCase):
+
+    def seed(self):
+        call_command(
+            "seed_perf_data", users=5, products=20, tags=5, orders=30,
+            baskets=4, end="2026-01-31", seed=7, stdout=StringIO())
+
+    @override_settings(MEDIA_ROOT=tempfile.mkdtemp())
+    def test_seeds_the_same_rows_for_the_same_seed(self):
+        self.addCleanup(shutil.rmtree, settings.MEDIA_ROOT)
+        self.seed()
+        self.assertEqual(models.Product.objects.count(), 20)
+        self.assertEqual(models.Order.objects.count(), 30)
+        self.assertEqual(
+            models.Basket.objects.filter(status=models.Basket.OPEN).count(), 4)
+        first_order = models.Order.objects.order_by("pk").first()
+        self.assertGreaterEqual(
+            first_order.date_added,
+            timezone.make_aware(timezone.datetime(2025, 2, 1)))
+        self.assertEqual(
+            first_order.subtotal,
+            sum(item.unit_price * item.quantity
+                for item in first_order.items.all()))
+        # image rows were written in bulk, their blobs are still counted
+        self.assertEqual(
+            sum(models.MediaBlob.objects.values_list("refcount", flat=True)),
+            2 * models.ProductImage.objects.count())
+
+        def rows():
+            return (
+                list(models.Product.objects.order_by("pk").values_list(
+                    "name", "description", "price", "in_stock")),
+                list(models.Order.objects.order_by("pk").values_list(
+                    "subtotal", "item_count", "summary", "date_added")),
+            )
+        first = rows()
+        self.seed()
+        second = rows()
+        self.assertEqual(second[0][20:], first[0])
+        self.assertEqual(second[1][30:], first[1])
+        self.assertEqual(models.User.objects.filter(
+            email__startswith="perf-").count(), 10)
+
+
+class TestWarmCache(TransactionTestCase):
+
+    def test_warms_list_and_product_pages_for_every_country(self):
+        # a cache shared by the processes, unlike the locmem default
+        location = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, location)
+        cache_settings = override_settings(CACHES={"default": {
+            "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+            "LOCATION": location,
+        }})
+        cache_settings.enable()
+        self.addCleanup(cache_settings.disable)
+        tag = models.ProductTag.objects.create(name="Editors", slug="editors")
+        for i in range(6):
+            factories.ProductFactory(name="Book %d" % i).tags.add(tag)
+        out = StringIO()
+        call_command("warm_cache", threads=2, stdout=out)
+        # home, 2 pages of all and of editors, 6 products, 2 countries
+        self.assertIn("Pages warmed=22 (failed=0)", out.getvalue())
+
+        product = models.Product.objects.first()
+        for path in ("/products/editors/?page=2",
+                     "/product/%s/" % product.slug):
+            with self.assertNumQueries(0):
+                response = self.client.get(path)
+            self.assertEqual(response["X-Page-Cache"], "hit")
+
+    def test_a_process_local_cache_needs_a_server_url(self):
+        with self.assertRaisesMessage(CommandError, "--url"):
+            call_command("warm_cache", stdout=StringIO())
+        directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, directory)
+        path = os.path.join(directory, "products.csv")
+        with open(path, "w") as f:
+            f.write("name,description,tags,image_filename,price\n"
+                    "Vim,Editors,Editors,,5.00\n")
+        with self.assertRaisesMessage(CommandError, "--warm-cache-url"):
+            call_command("import_data", path, directory, warm_cache=True,
+                         stdout=StringIO())
+        self.assertFalse(models.Product.objects.exists())
@@ -1,6 +1,8 @@
-from django.test import TestCase
+from unittest.mock import patch
+from django.test import TestCase, override_settings
 from django.core import mail
-from main import forms
+from django.core.cache import cache
+from main import forms, models
 
 
 class TestForm(TestCase):
@@ -49,3 +51,89 @@ class TestForm(TestCase):
 
         # if the output >= email instance
         self.assertGreaterEqual(len(cm.output), 1)
+
+    def test_address_selection_form_uses_cached_address_book(self):
+        cache.clear()
+        user = models.User.objects.create_user("user1@domain.com", "pw432")
+        address = models.Address.objects.create(
+            user=user, name="Ali Muhammed", address1="Flat 1",
+            zip_code="1111", city="KHA", country="SD")
+        data = {
+            "billing_address": address.id,
+            "shipping_address": address.id,
+            "idempotency_key": "7a6d3b3e-9d0a-4b5e-8a43-3c5b0e2d1f10",
+        }
+
+        # the book on a cold cache, then the selected addresses
+        with self.assertNumQueries(2):
+            form = forms.AddressSelectionForm(user, data)
+            form.as_p()
+            self.assertTrue(form.is_valid())
+        self.assertEqual(form.cleaned_data["shipping_address"], address)
+
+        with self.assertNumQueries(0):
+            forms.AddressSelectionForm(user).as_p()
+        with self.assertNumQueries(1):
+            form = forms.AddressSelectionForm(user, data)
+            self.assertTrue(form.is_valid())
+
+        # saving an address drops the cached book
+        address.city = "Omdurman"
+        address.save()
+        form = forms.AddressSelectionForm(user, data)
+        self.assertTrue(form.is_valid())
+        self.assertEqual(
+            form.cleaned_data["billing_address"].city, "Omdurman")
+
+    def test_address_selection_form_reads_selected_addresses_again(self):
+        cache.clear()
+        user = models.User.objects.create_user("user1@domain.com", "pw432")
+        kept, deleted = [
+            models.Address.objects.create(
+                user=user, name="Ali Muhammed", address1="Flat %d" % i,
+                zip_code="1111", city="KHA", country="SD")
+            for i in (1, 2)
+        ]
+        models.Address.objects.address_book(user)
+        # changed by another process, whose invalidation is not seen here
+        models.Address.objects.filter(pk=kept.pk).update(city="Omdurman")
+        models.Address.objects.filter(pk=deleted.pk).delete()
+        data = {
+            "billing_address": kept.id,
+            "shipping_address": deleted.id,
+            "idempotency_key": "7a6d3b3e-9d0a-4b5e-8a43-3c5b0e2d1f10",
+        }
+        form = forms.AddressSelectionForm(user, data)
+        self.assertFalse(form.is_valid())
+        self.assertIn("shipping_address", form.errors)
+        self.assertEqual(
+            form.cleaned_data["billing_address"].city, "Omdurman")
+
+    def test_address_selection_form_rejects_foreign_address(self):
+        cache.clear()
+        user = models.User.objects.create_user("user1@domain.com", "pw432")
+        other = models.User.objects.create_user("user2@domain.com", "pw432")
+        address = models.Address.objects.create(
+            user=other, name="Ali Muhammed", address1="Flat 1",
+            zip_code="1111", city="KHA", country="SD")
+        form = forms.AddressSelectionForm(user, {
+            "billing_address": address.id,
+            "shipping_address": address.id,
+            "idempotency_key": "7a6d3b3e-9d0a-4b5e-8a43-3c5b0e2d1f10",
+        })
+        self.assertFalse(form.is_valid())
+
+    @override_settings(RATE_LIMITS={"login": {"email": (3, 300)}})
+    def test_login_is_throttled_before_authenticate(self):
+        cache.clear()
+        models.User.objects.create_user("user1@domain.com", "pw432joij")
+        data = {"email": "user1@domain.com", "password": "wrong"}
+        for _ in range(3):
+            self.assertFalse(forms.AuthenticationForm(data=data).is_valid())
+
+        with patch("main.forms.authenticate") as mock_authenticate:
+            form = forms.AuthenticationForm(
+                data={"email": "user1@domain.com", "password": "pw432joij"})
+            self.assertFalse(form.is_valid())
+            mock_authenticate.assert_not_called()
+        self.assertIn("Too many login attempts", str(form.errors))
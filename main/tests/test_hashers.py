@@ -0,0 +1,38 @@
+from django.contrib.auth.hashers import check_password
+from django.test import TestCase, override_settings
+
+from main import hashers, models
+
+
+class TestHashers(TestCase):
+
+    @override_settings(PASSWORD_HASHER_COST={"scrypt_work_factor": 2 ** 10})
+    def test_scrypt_round_trip(self):
+        hasher = hashers.ScryptPasswordHasher()
+        encoded = hasher.encode("pw432joij", hasher.salt())
+        self.assertTrue(encoded.startswith("scrypt$1024$"))
+        self.assertTrue(hasher.verify("pw432joij", encoded))
+        self.assertFalse(hasher.verify("wrong", encoded))
+        self.assertFalse(hasher.must_update(encoded))
+        with override_settings(
+                PASSWORD_HASHER_COST={"scrypt_work_factor": 2 ** 11}):
+            self.assertTrue(hasher.must_update(encoded))
+
+    def test_login_upgrades_hash_to_configured_profile(self):
+        with override_settings(
+                PASSWORD_HASHER_COST={"pbkdf2_iterations": 1000}):
+            user = models.User.objects.create_user(
+                "user1@domain.com", "pw432joij")
+        self.assertIn("$1000$", user.password)
+
+        with override_settings(
+                PASSWORD_HASHER_COST={"scrypt_work_factor": 2 ** 10},
+                PASSWORD_HASHERS=[
+                    "main.hashers.ScryptPasswordHasher",
+                    "main.hashers.TunedPBKDF2PasswordHasher",
+                ]):
+            self.assertTrue(self.client.login(
+                email="user1@domain.com", password="pw432joij"))
+            user.refresh_from_db()
+            self.assertTrue(user.password.startswith("scrypt$1024$"))
+            self.assertTrue(check_password("pw432joij", user.password))
@@ -0,0 +1,37 @@
+from decimal import Decimal
+
+from django.test import LiveServerTestCase, SimpleTestCase
+
+from main import loadtest
+from main.models import Address, Product, User
+
+
+class TestPercentile(SimpleTestCase):
+
+    def test_nearest_rank(self):
+        ordered = list(range(1, 101))
+        self.assertEqual(loadtest.percentile(ordered, 50), 50)
+        self.assertEqual(loadtest.percentile(ordered, 99), 99)
+        self.assertEqual(loadtest.percentile([7], 95), 7)
+        self.assertIsNone(loadtest.percentile([], 50))
+
+
+class TestFunnel(LiveServerTestCase):
+
+    def test_funnels_run_through_the_checkout(self):
+        user = User.objects.create_user("perf-1@example.com", "pw432joij")
+        Address.objects.create(
+            user=user, name="Ali Muhammed", address1="Flat 1",
+            zip_code="1111", city="KHA", country="SD")
+        product = Product.objects.create(
+            name="Vim for dummies", slug="vim", price=Decimal("5.00"))
+        product.tags.create(name="Editors", slug="editors")
+
+        results = loadtest.run(
+            self.live_server_url, ["editors"], [(product.pk, "vim")],
+            [user.email], "pw432joij", funnels=2, concurrency=1)
+
+        self.assertEqual(results["funnels"]["completed"], 2)
+        self.assertEqual(results["total"]["errors"], 0)
+        self.assertEqual(results["steps"]["login"]["statuses"], {"302": 2})
+        self.assertEqual(results["steps"]["address_select"]["requests"], 2)
@@ -0,0 +1,68 @@
+import shutil
+import tempfile
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.test import TestCase, override_settings
+from django.urls import reverse
+
+
+class TestMediaServing(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.content = bytes(range(256)) * 4
+        self.name = default_storage.save("cover.jpg", ContentFile(self.content))
+        self.url = reverse("media", args=[self.name])
+
+    def test_blob_is_streamed_with_immutable_etag(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(b"".join(response.streaming_content), self.content)
+        self.assertEqual(response["Content-Type"], "image/jpeg")
+        self.assertEqual(response["Content-Length"], str(len(self.content)))
+        self.assertIn("immutable", response["Cache-Control"])
+
+        response = self.client.get(
+            self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_range_requests(self):
+        response = self.client.get(self.url, HTTP_RANGE="bytes=10-19")
+        self.assertEqual(response.status_code, 206)
+        self.assertEqual(response["Content-Range"], "bytes 10-19/1024")
+        self.assertEqual(
+            b"".join(response.streaming_content), self.content[10:20])
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=-4")
+        self.assertEqual(
+            b"".join(response.streaming_content), self.content[-4:])
+
+        response = self.client.get(self.url, HTTP_RANGE="bytes=2000-")
+        self.assertEqual(response.status_code, 416)
+        self.assertEqual(response["Content-Range"], "bytes */1024")
+
+        response = self.client.get(
+            self.url, HTTP_RANGE="bytes=10-19", HTTP_IF_RANGE='"stale"')
+        self.assertEqual(response.status_code, 200)
+
+    def test_missing_and_outside_files_are_not_found(self):
+        response = self.client.get(reverse("media", args=["nope.jpg"]))
+        self.assertEqual(response.status_code, 404)
+        response = self.client.get(
+            reverse("media", args=["../project/settings.py"]))
+        self.assertEqual(response.status_code, 404)
+
+    @override_settings(MEDIA_SENDFILE_HEADER="X-Accel-Redirect")
+    def test_proxy_sends_the_file(self):
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            response["X-Accel-Redirect"], "/protected-media/" + self.name)
+        self.assertEqual(response.content, b"")
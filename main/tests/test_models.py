@@ -1,6 +1,9 @@
 from decimal import Decimal
+import uuid
+from concurrent.futures import ThreadPoolExecutor
 
-from django.test import TestCase
+from django.db import connection
+from django.test import TestCase, TransactionTestCase
 
 from main import models, factories
 
@@ -30,10 +33,96 @@ class TestModel(TestCase):
             order.refresh_from_db()
 
             self.assertEquals(order.user, user1)
-            self.assertEquals(order.billing_address1, billing.address1)
-            self.assertEquals(order.shipping_address1, shipping.address1)
+            self.assertEquals(order.billing_address.address1,
+                              billing.address1)
+            self.assertEquals(order.shipping_address.address1,
+                              shipping.address1)
 
             self.assertEquals(order.items.all().count(), 2)
             items = order.items.all()
             self.assertEquals(items[0].product, p1)
             self.assertEquals(items[1].product, p2)
+
+    def test_create_order_collapses_items_and_shares_addresses(self):
+        p1 = factories.ProductFactory(price=Decimal("4.00"))
+        user1 = factories.UserFactory()
+        address = factories.AddressFactory(
+            user=user1, name="Ali", address1="Flat 1", zip_code="1111",
+            city="KHA", country="SD")
+        copy = factories.AddressFactory(
+            user=user1, name="Ali", address1="Flat 1", zip_code="1111",
+            city="KHA", country="SD")
+
+        for shipping in (address, copy):
+            basket = models.Basket.objects.create(user=user1)
+            models.BasketLine.objects.create(
+                basket=basket, product=p1, quantity=3)
+            order = basket.create_order(address, shipping)
+
+            item = order.items.get()
+            self.assertEqual(item.quantity, 3)
+            self.assertEqual(item.unit_price, Decimal("4.00"))
+            order.refresh_from_db()
+            self.assertEqual(order.subtotal, Decimal("12.00"))
+            self.assertEqual(order.item_count, 3)
+            self.assertEqual(order.billing_address, order.shipping_address)
+
+        self.assertEqual(models.OrderAddress.objects.count(), 1)
+
+
+class TestBasketConcurrency(TransactionTestCase):
+
+    def test_parallel_add_product_keeps_every_increment(self):
+        product = factories.ProductFactory()
+        basket = models.Basket.objects.create()
+
+        def add(_):
+            # no retry, the file test database waits for the lock
+            # (busy_timeout) and any error fails the test
+            try:
+                return basket.add_product(product.id)
+            finally:
+                connection.close()
+
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            list(pool.map(add, range(models.BasketLine.MAX_QUANTITY)))
+
+        line = models.BasketLine.objects.get(basket=basket)
+        self.assertEqual(line.quantity, models.BasketLine.MAX_QUANTITY)
+
+    def test_add_product_caps_the_quantity(self):
+        product = factories.ProductFactory()
+        basket = models.Basket.objects.create()
+        basket.add_product(product.id, 1000)
+        line = models.BasketLine.objects.get(basket=basket)
+        self.assertEqual(line.quantity, models.BasketLine.MAX_QUANTITY)
+        models.BasketLine.objects.filter(pk=line.pk).update(quantity=8)
+        basket.add_product(product.id, 5)
+        line.refresh_from_db()
+        self.assertEqual(line.quantity, models.BasketLine.MAX_QUANTITY)
+
+    def test_parallel_create_order_creates_one_order(self):
+        product = factories.ProductFactory()
+        user = factories.UserFactory()
+        address = factories.AddressFactory(
+            user=user, name="Ali", address1="Flat 1", zip_code="1111",
+            city="KHA", country="SD")
+        basket = models.Basket.objects.create(user=user)
+        models.BasketLine.objects.create(basket=basket, product=product)
+
+        key = uuid.uuid4()
+
+        def submit(_):
+            try:
+                return models.Basket.objects.get(pk=basket.pk).create_order(
+                    address, address, idempotency_key=key).pk
+            finally:
+                connection.close()
+
+        # an exception in any thread is raised again by list()
+        with ThreadPoolExecutor(max_workers=4) as pool:
+            order_ids = list(pool.map(submit, range(8)))
+
+        self.assertEqual(len(set(order_ids)), 1)
+        self.assertEqual(models.Order.objects.count(), 1)
+        self.assertEqual(models.OrderItem.objects.count(), 1)
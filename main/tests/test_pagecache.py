@@ -0,0 +1,116 @@
+from decimal import Decimal
+import threading
+import time
+from unittest import mock
+
+from django.core.cache import cache
+from django.test import RequestFactory, TestCase, override_settings
+from django.urls import reverse
+
+from main import catalogue, models, pagecache, singleflight
+
+
+class TestPageCache(TestCase):
+
+    def setUp(self):
+        cache.clear()
+        self.product = models.Product.objects.create(
+            name="The cathedral and the bazaar", slug="cathedral-bazaar",
+            price=Decimal("10.00"))
+        self.url = reverse("product", kwargs={"slug": "cathedral-bazaar"})
+
+    def test_anonymous_pages_are_cached_per_country(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "miss")
+        self.assertIn("Cookie", response["Vary"])
+        with self.assertNumQueries(0):
+            response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "hit")
+        self.assertContains(response, "The cathedral and the bazaar")
+
+        self.client.cookies["country"] = "sa"
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "miss")
+        self.assertEqual(response.wsgi_request.country, "KSA")
+
+    @override_settings(PAGE_CACHE={
+        "TIMEOUT": 60, "STALE": 600, "COUNTRY_HEADER": "HTTP_CF_IPCOUNTRY"})
+    def test_country_header_is_used_without_cookie(self):
+        response = self.client.get(self.url, HTTP_CF_IPCOUNTRY="SA")
+        self.assertEqual(response.wsgi_request.country, "KSA")
+        self.assertEqual(response["Vary"], "Cookie, Cf-Ipcountry")
+        response = self.client.get(self.url, HTTP_CF_IPCOUNTRY="FR")
+        self.assertEqual(response.wsgi_request.country, "SD")
+
+    def test_visitors_with_a_basket_are_not_served_from_cache(self):
+        self.client.get(self.url)
+        self.client.get(
+            reverse("add_to_basket"), {"product_id": self.product.id})
+        response = self.client.get(self.url)
+        self.assertNotIn("X-Page-Cache", response)
+        self.assertContains(response, "items in basket")
+
+    def test_one_request_refreshes_a_stale_page(self):
+        self.client.get(self.url)
+        models.Product.objects.filter(pk=self.product.pk).update(
+            name="Bazaar, second edition")
+        catalogue.bump_version()
+
+        # another request holds the lock, the old page is served
+        request = RequestFactory().get(self.url)
+        request.country = "SD"
+        key = pagecache.cache_key(request)
+        cache.add(key + ":lock", 1)
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "stale")
+        self.assertContains(response, "The cathedral and the bazaar")
+
+        cache.delete(key + ":lock")
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "miss")
+        self.assertContains(response, "Bazaar, second edition")
+        response = self.client.get(self.url)
+        self.assertEqual(response["X-Page-Cache"], "hit")
+
+
+class TestSingleFlight(TestCase):
+
+    def setUp(self):
+        cache.clear()
+
+    def test_concurrent_misses_compute_once(self):
+        calls = []
+
+        def compute():
+            calls.append(1)
+            time.sleep(0.2)
+            return "value"
+
+        values = []
+        threads = [
+            threading.Thread(target=lambda: values.append(
+                singleflight.get_or_set("key", compute, 60)))
+            for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(values, ["value"] * 5)
+
+    def test_waiters_compute_when_the_lock_holder_is_too_slow(self):
+        singleflight.acquire("key")
+        with mock.patch.object(singleflight, "LOCK_WAIT", 0.1):
+            self.assertEqual(
+                singleflight.get_or_set("key", lambda: "value", 60), "value")
+
+    def test_tag_lookups_are_cached_by_catalogue_version(self):
+        tag = models.ProductTag.objects.create(name="Editors", slug="editors")
+        self.assertEqual(catalogue.get_tag("editors"), tag)
+        self.assertIsNone(catalogue.get_tag("missing"))
+        with self.assertNumQueries(0):
+            self.assertEqual(catalogue.get_tag("editors"), tag)
+            self.assertIsNone(catalogue.get_tag("missing"))
+        tag.delete()
+        self.assertIsNone(catalogue.get_tag("editors"))
@@ -0,0 +1,30 @@
+from django.db import connection
+from django.test import TestCase, override_settings
+
+from main import models
+from main.routers import ReportingRouter, reporting_reads
+
+
+class TestRouter(TestCase):
+
+    @override_settings(DATABASES={"default": {}, "reporting": {}})
+    def test_reporting_reads_use_reporting_database(self):
+        router = ReportingRouter()
+        self.assertIsNone(router.db_for_read(models.Order))
+        with reporting_reads():
+            self.assertEqual(router.db_for_read(models.Order), "reporting")
+        self.assertIsNone(router.db_for_read(models.Order))
+        self.assertEqual(router.db_for_write(models.Order), "default")
+
+    @override_settings(DATABASES={"default": {}})
+    def test_reporting_reads_fall_back_to_default(self):
+        with reporting_reads():
+            self.assertIsNone(ReportingRouter().db_for_read(models.Order))
+
+    def test_sqlite_pragmas_are_applied(self):
+        with connection.cursor() as cursor:
+            cursor.execute("PRAGMA synchronous")
+            # 1 is NORMAL
+            self.assertEqual(cursor.fetchone()[0], 1)
+            cursor.execute("PRAGMA busy_timeout")
+            self.assertEqual(cursor.fetchone()[0], 20000)
@@ -0,0 +1,31 @@
+from unittest.mock import patch
+
+from django.test import RequestFactory, TestCase
+from django.test.runner import DiscoverRunner
+
+from main import analytics
+from main.models import AuthEvent
+from main.test_runner import TestRunner
+
+
+class TestTestRunner(TestCase):
+
+    def test_analytics_buffer_is_emptied_before_each_test(self):
+        result = TestRunner().get_resultclass()(None, True, 0)
+        with patch.object(analytics, "_buffer", []):
+            analytics.track(RequestFactory().get("/"), AuthEvent.LOGIN)
+            result.startTest(self)
+            self.assertEqual(analytics.flush(), 0)
+        self.assertEqual(AuthEvent.objects.count(), 0)
+
+    def test_analytics_are_not_flushed_after_the_test_databases(self):
+        with patch.object(analytics, "_buffer", []):
+            analytics.track(RequestFactory().get("/"), AuthEvent.LOGIN)
+            runner = TestRunner()
+            # the databases of this run stay, files included
+            with patch.object(DiscoverRunner, "teardown_databases") as down, \
+                    patch.object(runner, "remove_wal_files"):
+                runner.teardown_databases([])
+            down.assert_called_once_with([])
+            self.assertEqual(analytics.flush(), 0)
+        self.assertEqual(AuthEvent.objects.count(), 0)
@@ -1,9 +1,12 @@
+from datetime import timedelta
 from decimal import Decimal
 
-from django.test import TestCase
+from django.contrib.auth.signals import user_logged_in
+from django.test import RequestFactory, TestCase
 from django.core.files.images import ImageFile
 
-from main.models import Product, ProductImage, ProductTag
+from main import catalogue
+from main.models import Basket, Product, ProductImage, ProductTag, User
 
 
 class TestSignal(TestCase):
@@ -32,3 +35,37 @@ class TestSignal(TestCase):
             assert image.thumbnail.read() == expected_content
         image.thumbnail.delete(save=False)
         image.image.delete(save=False)
+
+    def test_catalogue_changes_bump_version(self):
+        product = Product.objects.create(
+            name="Vim for dummies", slug="vim", price=Decimal("5.00"))
+        tag = ProductTag.objects.create(name="Editors", slug="editors")
+        version = catalogue.version()
+
+        product.tags.add(tag)
+        self.assertGreater(catalogue.version(), version)
+
+        version = catalogue.version()
+        product.price = Decimal("6.00")
+        product.save()
+        self.assertGreater(catalogue.version(), version)
+
+    def test_login_merges_into_the_last_open_basket(self):
+        user = User.objects.create_user("user1@a.com", "pw432joij")
+        product = Product.objects.create(
+            name="Vim for dummies", slug="vim", price=Decimal("5.00"))
+        older = Basket.objects.create(user=user)
+        last = Basket.objects.create(user=user)
+        Basket.objects.filter(pk=older.pk).update(
+            date_updated=last.date_updated - timedelta(hours=1))
+        anonymous = Basket.objects.create()
+        anonymous.add_product(product.pk, 2)
+        request = RequestFactory().post("/login/")
+        request.session = {"basket_id": anonymous.pk}
+        request.basket = anonymous
+
+        user_logged_in.send(sender=User, request=request, user=user)
+
+        self.assertEqual(request.session["basket_id"], last.pk)
+        self.assertEqual(last.count(), 2)
+        self.assertFalse(Basket.objects.filter(pk=anonymous.pk).exists())
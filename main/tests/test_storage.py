@@ -0,0 +1,139 @@
+from decimal import Decimal
+from io import BytesIO, StringIO
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from PIL import Image
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.core.management import call_command
+from django.db.models.query import QuerySet
+from django.test import TestCase, override_settings
+
+from main import models
+
+
+class TestStaticPipeline(TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.static_root = tempfile.mkdtemp()
+        cls.static_settings = override_settings(
+            STATIC_ROOT=cls.static_root,
+            STATICFILES_STORAGE=(
+                "main.storage.MinifiedManifestStaticFilesStorage"),
+        )
+        cls.static_settings.enable()
+        call_command("collectstatic", interactive=False, verbosity=0)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.static_settings.disable()
+        shutil.rmtree(cls.static_root)
+        super().tearDownClass()
+
+    def test_collectstatic_hashes_minifies_and_compresses(self):
+        name = staticfiles_storage.stored_name("css/plusminusnumber.css")
+        self.assertRegex(name, r"^css/plusminusnumber\.[0-9a-f]{12}\.css$")
+        with staticfiles_storage.open(name) as f:
+            self.assertNotIn(b"\n", f.read())
+        path = os.path.join(self.static_root, name)
+        self.assertTrue(os.path.exists(path + ".gz"))
+
+    def test_hashed_files_are_served_immutable(self):
+        url = staticfiles_storage.url("js/react.production.min.js")
+        response = self.client.get(url, HTTP_ACCEPT_ENCODING="gzip")
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Encoding"], "gzip")
+        self.assertIn("immutable", response["Cache-Control"])
+
+
+def make_image(color):
+    buffer = BytesIO()
+    Image.new("RGB", (40, 30), color).save(buffer, "PNG")
+    return buffer.getvalue()
+
+
+class TestContentAddressedStorage(TestCase):
+
+    def setUp(self):
+        media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, media_root)
+        media_settings = override_settings(MEDIA_ROOT=media_root)
+        media_settings.enable()
+        self.addCleanup(media_settings.disable)
+        self.product = models.Product.objects.create(
+            name="The cathedral and the bazaar", price=Decimal("10.00"))
+
+    def add_image(self, content, name="cover.png"):
+        image = models.ProductImage(product=self.product)
+        image.image.save(name, ContentFile(content), save=False)
+        image.save()
+        return image
+
+    def test_identical_uploads_share_one_blob(self):
+        first = self.add_image(make_image("red"), "cover.png")
+        second = self.add_image(make_image("red"), "COPY.PNG")
+        other = self.add_image(make_image("blue"))
+
+        self.assertEqual(first.image.name, second.image.name)
+        self.assertNotEqual(first.image.name, other.image.name)
+        self.assertTrue(default_storage.exists(first.image.name))
+        blob = models.MediaBlob.objects.get(name=first.image.name)
+        self.assertEqual(blob.refcount, 2)
+        self.assertEqual(blob.size, len(make_image("red")))
+        # image + thumbnail of red, image + thumbnail of blue
+        self.assertEqual(models.MediaBlob.objects.count(), 4)
+
+    def test_gc_media_deletes_unreferenced_blobs(self):
+        kept = self.add_image(make_image("red"))
+        dropped = self.add_image(make_image("blue"))
+        name = dropped.image.name
+        dropped.delete()
+        self.assertEqual(
+            models.MediaBlob.objects.get(name=name).refcount, 0)
+
+        out = StringIO()
+        call_command("gc_media", hours=0, stdout=out)
+
+        self.assertIn("Blobs deleted=2", out.getvalue())
+        self.assertFalse(default_storage.exists(name))
+        self.assertTrue(default_storage.exists(kept.image.name))
+        self.assertEqual(models.MediaBlob.objects.count(), 2)
+
+    def test_gc_media_keeps_a_blob_uploaded_again_after_its_commit(self):
+        dropped = self.add_image(make_image("blue"))
+        name = dropped.image.name
+        dropped.delete()
+        delete = QuerySet.delete
+
+        def delete_then_upload(queryset):
+            deleted = delete(queryset)
+            # the same bytes uploaded between the commit and the files
+            default_storage.save("again.png", ContentFile(make_image("blue")))
+            return deleted
+
+        out = StringIO()
+        with mock.patch.object(QuerySet, "delete", autospec=True,
+                               side_effect=delete_then_upload):
+            call_command("gc_media", hours=0, stdout=out)
+
+        # only the thumbnail went
+        self.assertIn("Blobs deleted=1", out.getvalue())
+        self.assertTrue(default_storage.exists(name))
+        self.assertTrue(models.MediaBlob.objects.filter(name=name).exists())
+
+    def test_gc_media_recount_repairs_counts(self):
+        image = self.add_image(make_image("red"))
+        models.MediaBlob.objects.update(refcount=0)
+
+        call_command("gc_media", recount=True, hours=0, stdout=StringIO())
+
+        self.assertTrue(default_storage.exists(image.image.name))
+        self.assertEqual(
+            models.MediaBlob.objects.get(name=image.image.name).refcount, 1)
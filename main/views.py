@@ -3,13 +3,17 @@ from django.views.generic.edit import (
     FormView, CreateView, UpdateView, DeleteView
 )
 from django.views.generic.list import ListView
-from django.http import HttpResponseRedirect
+from django.views.generic.detail import DetailView
+from django.db.models import F, Prefetch, Q
+from django.utils.dateparse import parse_datetime
+from django.http import HttpResponseRedirect, JsonResponse, Http404
+from django.views.decorators.http import require_POST
 from django.urls import reverse_lazy, reverse
 from django.contrib.auth.mixins import LoginRequiredMixin
-from django.contrib.auth import login, authenticate
+from django.contrib.auth import login
 from django.contrib import messages
 from django.shortcuts import get_object_or_404, render
-from main import models
+from main import analytics, catalogue, models, ratelimit
 from .forms import (ContactForm, UserCreationForm,
                     AddressSelectionForm, BasketLineFormSet)
 
@@ -22,31 +26,50 @@ class SignUpView(FormView):
     # form_class = UserCreationForm
 
     def get_form_class(self):
-        try:
-            user_device, platform = self.request.META["HTTP_USER_AGENT"], self.request.META["HTTP_SEC_CH_UA_PLATFORM"]
-            logger.info(
-                {"USER_DEVICE": user_device, "PLATFORM": platform}
-            )
-        except:
-            pass
-
         return UserCreationForm
 
     def get_success_url(self):
         redirect_to = self.request.GET.get("next", '/')
         return redirect_to
 
+    def post(self, request, *args, **kwargs):
+        keys = {"ip": ratelimit.client_ip(request),
+                "email": request.POST.get("email", "").strip().lower()}
+        # a form without an email is only counted per ip
+        limits = {per: limit
+                  for per, limit in ratelimit.get_limits("signup").items()
+                  if keys[per]}
+        if any(limit.is_limited(keys[per]) for per, limit in limits.items()):
+            # checked before the form hashes the password
+            ratelimit.record("signup", "rejected")
+            logger.warning(
+                "Throttled signup for email=%s from ip=%s",
+                keys["email"], keys["ip"]
+            )
+            form = self.get_form()
+            form.add_error(
+                None, "Too many signup attempts, please try again later."
+            )
+            response = self.form_invalid(form)
+            response.status_code = 429
+            return response
+        for per, limit in limits.items():
+            limit.hit(keys[per])
+        return super().post(request, *args, **kwargs)
+
     def form_valid(self, form):
         response = super().form_valid(form)
-        form.save()
+        user = form.save()
 
         email = form.cleaned_data.get('email')
-        raw_password = form.cleaned_data.get("password1")
         logger.info(
             "New signup for email=%s through SignupView", email
         )
-        user = authenticate(email=email, password=raw_password)
-        login(self.request, user)
+        # the password was just hashed by save(), authenticating
+        # again would hash it a second time
+        analytics.track(self.request, models.AuthEvent.SIGNUP, user)
+        login(self.request, user,
+              backend='django.contrib.auth.backends.ModelBackend')
         form.send_mail()
         messages.info(
             self.request, "You signed up successfully."
@@ -72,9 +95,9 @@ class ProductListView(ListView):
         tag = self.kwargs['tag']
         self.tag = None
         if tag != "all":
-            self.tag = get_object_or_404(
-                models.ProductTag, slug=tag
-            )
+            self.tag = catalogue.get_tag(tag)
+            if self.tag is None:
+                raise Http404("No such tag")
         if self.tag:
             products = models.Product.objects.active().filter(
                 tags=self.tag
@@ -87,10 +110,12 @@ class ProductListView(ListView):
 
 class AddressListView(LoginRequiredMixin, ListView):
     model = models.Address
+    # the cached address book is a list, not a queryset
+    template_name = "main/address_list.html"
 
     def get_queryset(self):
         # get Address of Request User
-        return self.model.objects.filter(user=self.request.user)
+        return self.model.objects.address_book(self.request.user)
 
 
 class AddressCreateView(LoginRequiredMixin, CreateView):
@@ -151,47 +176,169 @@ class AddressSelectionView(LoginRequiredMixin, FormView):
         return kwargs
 
     def form_valid(self, form):
-        del self.request.session['basket_id']
+        key = form.cleaned_data['idempotency_key']
         basket = self.request.basket
+        if basket is None:
+            # a retry after the first submit already emptied the session
+            if models.Order.objects.filter(
+                    user=self.request.user, idempotency_key=key).exists():
+                return super().form_valid(form)
+            messages.info(self.request, "Your basket is empty.")
+            return HttpResponseRedirect(reverse('basket'))
+
         basket.create_order(
             form.cleaned_data['billing_address'],
             form.cleaned_data['shipping_address'],
+            idempotency_key=key,
         )
-        
+        self.request.session.pop('basket_id', None)
         return super().form_valid(form)
 
+class OrderHistoryView(LoginRequiredMixin, ListView):
+    """
+        Keyset paginated list of the customer orders, newest first.
+    The cursor is the (date_added, id) of the last order shown, so
+    every page is one range scan on the (user, date_added) index
+    """
+    template_name = "main/order_list.html"
+    page_size = 10
+
+    def get_queryset(self):
+        orders = models.Order.objects.filter(user=self.request.user)
+        cursor = self.parse_cursor(self.request.GET.get("before", ""))
+        if cursor:
+            date_added, pk = cursor
+            orders = orders.filter(
+                Q(date_added__lt=date_added) |
+                Q(date_added=date_added, pk__lt=pk)
+            )
+        orders = orders.order_by("-date_added", "-id")
+        # one extra row tells whether there is a next page
+        self.orders = list(orders[:self.page_size + 1])
+        return self.orders[:self.page_size]
+
+    def get_context_data(self, **kwargs):
+        context = super().get_context_data(**kwargs)
+        context["next_cursor"] = None
+        if len(self.orders) > self.page_size:
+            last = self.orders[self.page_size - 1]
+            context["next_cursor"] = "%s_%d" % (
+                last.date_added.isoformat(), last.pk)
+        return context
+
+    @staticmethod
+    def parse_cursor(cursor):
+        date_added, _, pk = cursor.rpartition("_")
+        date_added = parse_datetime(date_added) if date_added else None
+        if date_added is None or not pk.isdigit():
+            return None
+        return date_added, int(pk)
+
+
+class OrderDetailView(LoginRequiredMixin, DetailView):
+    template_name = "main/order_detail.html"
+
+    def get_queryset(self):
+        return models.Order.objects.filter(
+            user=self.request.user
+        ).select_related(
+            "billing_address", "shipping_address"
+        ).prefetch_related(
+            Prefetch(
+                "items",
+                queryset=models.OrderItem.objects.select_related("product")
+                .order_by("pk"),
+            )
+        )
+
+
 def add_to_basket(request):
-    # product_pk = request.GET.get("product_id")
+    params = request.POST or request.GET
     product = get_object_or_404(
-        models.Product, pk=request.GET.get("product_id"))
+        models.Product.objects.only("slug"), pk=params.get("product_id"))
+    try:
+        quantity = int(params.get("quantity", 1))
+    except ValueError:
+        quantity = 1
+    quantity = min(max(quantity, 1), models.BasketLine.MAX_QUANTITY)
+
     basket = request.basket
-    if not request.basket:
+    if not basket:
         if request.user.is_authenticated:
             user = request.user
         else:
             user = None
         basket = models.Basket.objects.create(user=user)
         request.session["basket_id"] = basket.pk
+        request.basket = basket
+
+    basket.add_product(product.pk, quantity)
 
-        basketline, created = models.BasketLine.objects.get_or_create(
-            basket=basket, product=product)
-        if not created:
-            basketline.quantity += 1
-            basketline.save()
+    if request.is_ajax():
+        return JsonResponse({
+            "product_id": product.pk,
+            "basket": basket.totals(),
+        })
     return HttpResponseRedirect(reverse("product", args=(product.slug,)))
 
 
 def manage_basket(request):
     if not request.basket:
         return render(request, 'basket.html', {'formset': None})
+    # the template shows each line's product name
+    lines = models.BasketLine.objects.select_related("product")
     if request.method == "POST":
         formset = BasketLineFormSet(
-            request.POST, instance=request.basket
+            request.POST, instance=request.basket, queryset=lines
         )
         if formset.is_valid():
             formset.save()
+            request.basket.touch()
     else:
-        formset = BasketLineFormSet(instance=request.basket)
+        formset = BasketLineFormSet(instance=request.basket, queryset=lines)
     if request.basket.is_empty():
         return render(request, 'basket.html', {'formset': None})
     return render(request, 'basket.html', {'formset': formset})
+
+
+BASKET_LINE_ACTIONS = ("increment", "decrement", "remove")
+
+
+@require_POST
+def basket_line_update(request, pk):
+    """
+        JSON endpoint used by the quantity widget, every action
+    is a single conditional UPDATE (or DELETE) on the line
+    """
+    action = request.POST.get("action")
+    if not request.basket or action not in BASKET_LINE_ACTIONS:
+        raise Http404("No such basket line action.")
+
+    # a submitted basket is the content of its order
+    lines = models.BasketLine.objects.filter(
+        pk=pk, basket=request.basket, basket__status=models.Basket.OPEN)
+    if action == "increment":
+        changed = lines.filter(
+            quantity__lt=models.BasketLine.MAX_QUANTITY
+        ).update(quantity=F("quantity") + 1)
+        if not changed:
+            # a line at the maximum stays as it is
+            changed = lines.exists()
+    elif action == "decrement":
+        changed = lines.filter(quantity__gt=1).update(
+            quantity=F("quantity") - 1
+        )
+        if not changed:
+            # decrementing the last unit removes the line
+            changed, _ = lines.delete()
+    else:
+        changed, _ = lines.delete()
+    if not changed:
+        raise Http404("No such basket line.")
+    request.basket.touch()
+
+    quantity = lines.values_list("quantity", flat=True).first() or 0
+    return JsonResponse({
+        "line": {"id": pk, "quantity": quantity},
+        "basket": request.basket.totals(),
+    })
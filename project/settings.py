@@ -44,6 +44,7 @@ INSTALLED_APPS = [
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
 
     'django.middleware.common.CommonMiddleware',
@@ -56,6 +57,8 @@ MIDDLEWARE = [
 
 ROOT_URLCONF = 'project.urls'
 
+# No 'loaders': with DEBUG off Django wraps the default loaders in the
+# cached loader, templates are compiled once per process
 TEMPLATES = [
     {
         'BACKEND': 'django.template.backends.django.DjangoTemplates',
@@ -67,11 +70,27 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'main.context_processors.catalogue_cache',
             ],
         },
     },
 ]
 
+# Seconds a cached template fragment is kept, the keys change with
+# the catalogue version so no explicit invalidation is needed
+TEMPLATE_FRAGMENT_TIMEOUT = 3600
+
+# Anonymous storefront pages (see main.pagecache) are cached whole for
+# TIMEOUT seconds, then served stale for up to STALE more seconds while
+# one request renders them again. COUNTRY_HEADER is the request.META
+# key of a country header set by a CDN or proxy, e.g. 'HTTP_CF_IPCOUNTRY',
+# responses then vary on that header as well as on Cookie
+PAGE_CACHE = {
+    'TIMEOUT': 60,
+    'STALE': 600,
+    'COUNTRY_HEADER': None,
+}
+
 WSGI_APPLICATION = 'project.wsgi.application'
 # ASGI_APPLICATION = 'project.routing.application'
 
@@ -82,9 +101,67 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': os.path.join(BASE_DIR, 'db.sqlite3'),
+        # keep the connection open between requests of the same process
+        'CONN_MAX_AGE': 60,
+        'OPTIONS': {
+            # seconds a writer waits for the lock before failing
+            'timeout': 20,
+        },
+        # a file, not the shared in-memory database, so concurrent
+        # tests wait for locks (busy_timeout) like the site does
+        'TEST': {'NAME': os.path.join(BASE_DIR, 'test_db.sqlite3')},
     }
 }
 
+# Applied by main.signals on every new SQLite connection. WAL lets
+# readers proceed while checkout or an import is writing.
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'busy_timeout': 20000,
+    'cache_size': -16000,
+    'mmap_size': 134217728,
+    'temp_store': 'MEMORY',
+}
+
+# Admin reporting views read through this alias when it is configured
+# (see main.routers.ReportingRouter), otherwise from 'default'.
+REPORTING_DATABASE = 'reporting'
+DATABASE_ROUTERS = ['main.routers.ReportingRouter']
+
+if not DEBUG:
+    DATABASES['reporting'] = {
+        'ENGINE': 'django.db.backends.sqlite3',
+        'NAME': 'file:%s?mode=ro' % os.path.join(BASE_DIR, 'db.sqlite3'),
+        'CONN_MAX_AGE': 60,
+        'TEST': {'MIRROR': 'default'},
+    }
+
+# Cache
+# https://docs.djangoproject.com/en/2.2/topics/cache/
+
+CACHES = {
+    'default': {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'booktime',
+        # room for the full pages and fragments warm_cache renders,
+        # the default of 300 entries would cull them as they are added
+        'OPTIONS': {'MAX_ENTRIES': 5000},
+    }
+}
+
+# Sessions only carry the basket id and the auth keys. With a cache
+# shared by the processes (memcached, redis) they are read from it and
+# written through to the database; the locmem cache is per process, a
+# logout or basket change in one worker would not reach the copies of
+# the others, so sessions then come from the database. Use
+# 'django.contrib.sessions.backends.signed_cookies' to keep them
+# out of the database altogether (see the bench_sessions command).
+if CACHES['default']['BACKEND'].endswith('.LocMemCache'):
+    SESSION_ENGINE = 'django.contrib.sessions.backends.db'
+else:
+    SESSION_ENGINE = 'django.contrib.sessions.backends.cached_db'
+
 
 # Password validation
 # https://docs.djangoproject.com/en/2.2/ref/settings/#auth-password-validators
@@ -104,6 +181,46 @@ AUTH_PASSWORD_VALIDATORS = [
     },
 ]
 
+# New passwords are hashed with the profile below, the other hashers
+# only verify older hashes, which are upgraded on the next successful
+# login. Use the bench_hashers command to pick the costs for a host.
+PASSWORD_HASHER_PROFILE = 'pbkdf2'  # 'pbkdf2', 'scrypt' or 'argon2'
+PASSWORD_HASHER_COST = {
+    'pbkdf2_iterations': 150000,
+    'scrypt_work_factor': 2 ** 14,
+    'argon2_time_cost': 2,
+    'argon2_memory_cost': 512,
+}
+PASSWORD_HASHER_PROFILES = {
+    'pbkdf2': 'main.hashers.TunedPBKDF2PasswordHasher',
+    'scrypt': 'main.hashers.ScryptPasswordHasher',
+    'argon2': 'main.hashers.TunedArgon2PasswordHasher',
+}
+PASSWORD_HASHERS = [PASSWORD_HASHER_PROFILES[PASSWORD_HASHER_PROFILE]] + [
+    hasher for profile, hasher in PASSWORD_HASHER_PROFILES.items()
+    if profile != PASSWORD_HASHER_PROFILE
+] + [
+    'django.contrib.auth.hashers.PBKDF2SHA1PasswordHasher',
+    'django.contrib.auth.hashers.BCryptSHA256PasswordHasher',
+]
+
+# Attempts allowed per period (in seconds) for each client IP and
+# email, enforced from the cache before any password is hashed
+RATE_LIMITS = {
+    'login': {'ip': (30, 300), 'email': (5, 300)},
+    'signup': {'ip': (10, 3600), 'email': (5, 3600)},
+}
+
+# Signup/login events are buffered in memory and bulk inserted once
+# FLUSH_SIZE events are waiting or FLUSH_INTERVAL seconds have passed
+ANALYTICS = {
+    'FLUSH_SIZE': 100,
+    'FLUSH_INTERVAL': 60,
+}
+
+# Empties that buffer between tests, see main.test_runner
+TEST_RUNNER = 'main.test_runner.TestRunner'
+
 
 # Internationalization
 # https://docs.djangoproject.com/en/2.2/topics/i18n/
@@ -137,9 +254,23 @@ else:
 STATIC_URL = '/static/'
 # Production Mode
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static')]
+STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
+
+if not DEBUG:
+    # collectstatic minifies, hashes and precompresses (gzip, and brotli
+    # when installed), whitenoise then serves hashed files as immutable
+    STATICFILES_STORAGE = 'main.storage.MinifiedManifestStaticFilesStorage'
 
 MEDIA_URL = '/media/'
 MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+# uploads are stored once per content, see main.models.MediaBlob
+DEFAULT_FILE_STORAGE = 'main.storage.ContentAddressedStorage'
+# Cache lifetime of media files that are not content addressed blobs
+MEDIA_MAX_AGE = 60 * 60
+# Behind nginx, 'X-Accel-Redirect' with an internal location aliasing
+# MEDIA_ROOT at MEDIA_ACCEL_PREFIX; behind apache/lighttpd, 'X-Sendfile'
+MEDIA_SENDFILE_HEADER = None
+MEDIA_ACCEL_PREFIX = '/protected-media/'
 
 AUTH_USER_MODEL = 'main.User'
 LOGIN_URL = '/login'
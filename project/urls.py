@@ -3,22 +3,25 @@ from django.urls import path
 from django.contrib.auth import views as auth_views
 from django.views.generic import TemplateView
 from django.views.generic.detail import DetailView
-from django.conf.urls.static import static
 from django.conf import settings
 
-from main import views, forms, admin
+from main import api, changes, views, forms, admin, media
+from main.pagecache import cached_page
 from main.models import Product
 
 urlpatterns = [
-    path('', TemplateView.as_view(template_name='home.html'), name='home'),
+    path('', cached_page(TemplateView.as_view(template_name='home.html')),
+         name='home'),
     path('singup/', views.SignUpView.as_view(), name='signup'),
     path('login/', auth_views.LoginView.as_view(template_name='login.html',
          form_class=forms.AuthenticationForm), name='login'),
-    path('about-us/', TemplateView.as_view(template_name='about_us.html'),
-         name='about_us'),
+    path('about-us/', cached_page(
+        TemplateView.as_view(template_name='about_us.html')), name='about_us'),
     path('contact-us/', views.ContactUsView.as_view(), name='contact_us'),
-    path('products/<slug:tag>/', views.ProductListView.as_view(), name='products'),
-    path('product/<slug:slug>/', DetailView.as_view(model=Product), name='product'),
+    path('products/<slug:tag>/', cached_page(views.ProductListView.as_view()),
+         name='products'),
+    path('product/<slug:slug>/', cached_page(DetailView.as_view(model=Product)),
+         name='product'),
     path("address/", views.AddressListView.as_view(), name="address_list",),
     path("address/create/", views.AddressCreateView.as_view(),
          name="address_create",),
@@ -28,12 +31,25 @@ urlpatterns = [
          views.AddressDeleteView.as_view(), name="address_delete",),
     path("add_to_basket/", views.add_to_basket, name="add_to_basket"),
     path('basket/', views.manage_basket, name="basket"),
+    path('basket/lines/<int:pk>/', views.basket_line_update,
+         name="basket_line"),
     path("order/done/", TemplateView.as_view(template_name='order_done.html'),
          name='checkout_done'),
     path("order/address_select/",
          views.AddressSelectionView.as_view(), name='address_select'),
+    path("orders/", views.OrderHistoryView.as_view(), name='order_list'),
+    path("orders/<int:pk>/", views.OrderDetailView.as_view(),
+         name='order_detail'),
+    # Catalogue API
+    path("api/products/", api.product_list, name="api_product_list"),
+    path("api/products/<int:pk>/", api.product_detail,
+         name="api_product_detail"),
+    path("api/tags/", api.tag_list, name="api_tag_list"),
+    path("api/changes/", changes.feed, name="api_changes"),
     # Admin dashboard
     path('admin/', admin.main_admin.urls),
     path('office-admin/', admin.central_office_admin.urls),
     path('dispatch-admin/', admin.dispatchers_admin.urls),
-]+static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
+    path(settings.MEDIA_URL.lstrip('/') + '<path:path>', media.serve,
+         name='media'),
+]